@@ -0,0 +1,31 @@
+import time
+
+import click
+from app.core.application.services.iproduct_snapshot_service import IProductSnapshotService
+from app.infrastructure.container import Container
+from dependency_injector.wiring import Provide, inject
+from flask.cli import with_appcontext
+
+
+@click.group(name="export")
+def export_cli():
+    """Data export commands."""
+    pass
+
+
+@export_cli.command('products-parquet')
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--epdx/--no-epdx', default=True, help='Keep the epdx documents, needed to import the snapshot again.')
+@click.option('--status', default=None, help='Only products with this status.')
+@with_appcontext
+@inject
+def products_parquet(
+    path: str,
+    epdx: bool,
+    status: str,
+    product_snapshot_service: IProductSnapshotService = Provide[Container.product_snapshot_service],
+):
+    """Write a parquet snapshot of the products with a column per impact indicator and stage."""
+    start_time = time.perf_counter()
+    products = product_snapshot_service.write_snapshot(path, with_epdx=epdx, filters={'status': status})
+    click.echo(f"wrote {products} products to {path} in {time.perf_counter() - start_time:.1f}s")
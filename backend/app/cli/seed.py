@@ -1,8 +1,15 @@
+import time
+from typing import Optional
+from pathlib import Path
+
 import click
 from app.config import Config
 from app.core.application.services.iepdx_service import IEpdxService
+from app.core.application.services.iharvest_pipeline_service import IHarvestPipelineService
 from app.core.application.services.iokobau_service import IOkobauService
+from app.core.application.services.iokobau_sync_service import IOkobauSyncService
 from app.core.application.services.iproduct_service import IProductService
+from app.core.application.services.iproduct_snapshot_service import IProductSnapshotService
 from app.core.application.services.irole_service import IRoleService
 from app.core.application.services.iuser_roles_service import IUserRolesService
 from app.core.application.services.iuser_service import IUserService
@@ -72,14 +79,30 @@ def seed_okobau_product_by_uuid(
     product_service.create_product_from_dto(product_dto, user_id=admin_id)
 
 def seed_okobau_products(
-    okobau_service: IOkobauService,
-    epdx_service: IEpdxService,
-    product_service: IProductService,
+    harvest_pipeline_service: IHarvestPipelineService,
     user_service: IUserService,
+    resume: bool = False,
+    retry_failed: bool = False,
 ):  
     admin_id = user_service.get_user_by_email(Config.ADMIN_CONFIG.get_admin_user_credentials()[0]).id
-    product_dto_list = epdx_service.from_epdx_to_product_list(okobau_service.get_epdx_list())
-    product_service.create_product_from_dto_list(product_dto_list, user_id = admin_id)
+    report = harvest_pipeline_service.run(user_id=admin_id, resume=resume, retry_failed=retry_failed)
+    for uuid, error in report.failed.items():
+        click.echo(f"failed {uuid}: {error}")
+
+
+def seed_products_from_archive(
+    path: str,
+    harvest_pipeline_service: IHarvestPipelineService,
+    user_service: IUserService,
+    resume: bool = False,
+    retry_failed: bool = False,
+    source: Optional[str] = None,
+):
+    admin_id = user_service.get_user_by_email(Config.ADMIN_CONFIG.get_admin_user_credentials()[0]).id
+    report = harvest_pipeline_service.run_archive(Path(path), user_id=admin_id, resume=resume, retry_failed=retry_failed,
+                                                  source_name=source)
+    for uuid, error in report.failed.items():
+        click.echo(f"failed {uuid}: {error}")
 
 
 @seed_cli.command()
@@ -109,16 +132,54 @@ def user_roles(
 
 
 @seed_cli.command()
+@click.option('--resume', is_flag=True, help='Continue from the checkpoint, skipping written and failed uuids.')
+@click.option('--retry-failed', is_flag=True, help='Only process the uuids that failed in the checkpointed run.')
 @with_appcontext
 @inject
 def products(
-    okobau_service: IOkobauService = Provide[Container.okobau_service],
-    epdx_service: IEpdxService = Provide[Container.epdx_service],
-    product_service: IProductService = Provide[Container.product_service],
+    resume: bool,
+    retry_failed: bool,
+    harvest_pipeline_service: IHarvestPipelineService = Provide[Container.harvest_pipeline_service],
     user_service: IUserService = Provide[Container.user_service],
 ):
-    """Seed users table with sample data."""
-    seed_okobau_products(okobau_service, epdx_service, product_service, user_service)
+    """Harvest all okobaudat EPDs that are not in the products table yet."""
+    seed_okobau_products(harvest_pipeline_service, user_service, resume, retry_failed)
+
+def sync_okobau_products(
+    okobau_sync_service: IOkobauSyncService,
+    user_service: IUserService,
+    mark_retired: bool = False,
+    dry_run: bool = False,
+):
+    admin_id = user_service.get_user_by_email(Config.ADMIN_CONFIG.get_admin_user_credentials()[0]).id
+    report = okobau_sync_service.sync(user_id=admin_id, mark_retired=mark_retired, dry_run=dry_run)
+    prefix = "would be " if dry_run else ""
+    click.echo(f"{prefix}added: {len(report.added)}")
+    click.echo(f"{prefix}updated: {len(report.updated)}")
+    click.echo(f"{prefix}retired: {len(report.retired)}" + ("" if mark_retired or dry_run else " (not marked, use --mark-retired)"))
+    click.echo(f"unchanged: {report.unchanged}")
+    for uuid, error in report.failed.items():
+        click.echo(f"failed {uuid}: {error}")
+
+
+@seed_cli.command('products-from-archive')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--resume', is_flag=True, help='Continue from the checkpoint, skipping written and failed uuids.')
+@click.option('--retry-failed', is_flag=True, help='Only process the uuids that failed in the checkpointed run.')
+@click.option('--source', default=None, help='epd_sourceName of the EPD programme the archive comes from, Oekobaudat if not set.')
+@with_appcontext
+@inject
+def products_from_archive(
+    path: str,
+    resume: bool,
+    retry_failed: bool,
+    source: Optional[str],
+    harvest_pipeline_service: IHarvestPipelineService = Provide[Container.harvest_pipeline_service],
+    user_service: IUserService = Provide[Container.user_service],
+):
+    """Import the JSON process datasets of a local ILCD+EPD zip export."""
+    seed_products_from_archive(path, harvest_pipeline_service, user_service, resume, retry_failed, source)
+
 
 @seed_cli.command('product_id')
 @click.argument('uuid')
@@ -136,6 +197,51 @@ def product_id(
     seed_okobau_product_by_uuid(uuid, okobau_service, epdx_service, product_service, user_service)
 
 
+@seed_cli.command('sync-products')
+@click.option('--mark-retired', is_flag=True, help='Set the status of products no longer in the datastock to "retired".')
+@click.option('--dry-run', is_flag=True, help='Only report what would change.')
+@with_appcontext
+@inject
+def sync_products(
+    mark_retired: bool,
+    dry_run: bool,
+    okobau_sync_service: IOkobauSyncService = Provide[Container.okobau_sync_service],
+    user_service: IUserService = Provide[Container.user_service],
+):
+    """Fetch only new and changed okobaudat EPDs and update the products table."""
+    sync_okobau_products(okobau_sync_service, user_service, mark_retired, dry_run)
+
+
+@seed_cli.command('product-impacts')
+@with_appcontext
+@inject
+def product_impacts(
+    product_service: IProductService = Provide[Container.product_service],
+):
+    """Rebuild the product_impacts table from the epdx of every stored product."""
+    products = product_service.rebuild_product_impacts()
+    click.echo(f"rebuilt the impacts of {products} products")
+
+
+@seed_cli.command('products-parquet')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--keep-ids', is_flag=True, help='Reuse the product ids of the snapshot, to restore into an empty table.')
+@with_appcontext
+@inject
+def products_parquet(
+    path: str,
+    keep_ids: bool,
+    product_snapshot_service: IProductSnapshotService = Provide[Container.product_snapshot_service],
+):
+    """Store the products of a parquet snapshot written by flask export products-parquet."""
+    start_time = time.perf_counter()
+    report = product_snapshot_service.read_snapshot(path, keep_ids=keep_ids)
+    click.echo(
+        f"{report['inserted']} of {report['products']} products stored, {report['skipped']} already stored,"
+        f" in {time.perf_counter() - start_time:.1f}s"
+    )
+
+
 @seed_cli.command()
 @with_appcontext
 @inject
@@ -4,6 +4,12 @@
 class BaseConfig:
     FLASK_DEBUG='true'
     USE_EXTERNAL_DB='false'   #set to false to deploy internal db, use docker-compose with database
+    DB_BULK_BATCH_SIZE='500' # rows per existence query and insert statement when importing products in bulk
+    EPD_CACHE_SIZE='2048' # parsed epdx documents of stored products kept in memory, 0 disables the cache
+    DB_STREAM_BATCH_SIZE='1000' # rows fetched per round trip from the server side cursor when exporting products
+    SNAPSHOT_ROW_GROUP_SIZE='10000' # products per parquet row group, what a snapshot writer or reader holds in memory
+    IMPACT_MATRIX_CACHE='true' # keep the impacts of the whole catalog as one array for batch evaluation, false loads them per request
+    BUILDUP_RESULTS_CACHE='true' # store computed buildup impacts until the buildup or a product it references changes, false computes them on every read
     #INTERNAL_DATABASE_URL='mysql+pymysql://myuser:mypassword@db:3306/carbonitor_db'  # set this to match the db manifest in docker compose with database
     JWT_SECRET='e0e9d14170af26e9cdd710bcf82439c6ab2c92135bd74fc1d3e239bd69e2fe32' # 32bit hash code - generate your own! very important for your app´s safety if it´s exposed to the internet. 
     ADMIN_USERNAME='admin'
@@ -15,6 +21,24 @@ class BaseConfig:
     OEKOBAU_DATASTOCK_ID='ca70a7e6-0ea4-4e90-a947-d44585783626'
     OEKOBAU_COMPLIANCE_ID_A1='b00f9ec0-7874-11e3-981f-0800200c9a66'
     OEKOBAU_COMPLIANCE_ID_A2='c0016b33-8cf7-415c-ac6e-deba0d21440d'
+    OEKOBAU_LIST_PAGE_SIZE='500' # process list entries requested per page
+    OEKOBAU_FETCH_WORKERS='8' # parallel downloads when harvesting the okobaudat datastock, 1 fetches serially
+    OEKOBAU_FETCH_TIMEOUT='30' # seconds per request
+    OEKOBAU_FETCH_RETRIES='0' # job level retries, on top of the http client retries below
+    OEKOBAU_FETCH_BACKOFF='0.5' # seconds, doubled on every retry
+    OEKOBAU_FETCH_ORDERED='true' # false yields epds as soon as they are downloaded
+    OEKOBAU_CONVERT_WORKERS='0' # processes converting ilcd to products when harvesting, 0 uses one per cpu
+    OEKOBAU_PIPELINE_QUEUE_SIZE='64' # items buffered between two harvest stages
+    OEKOBAU_WRITE_BATCH_SIZE='100' # products written per transaction when harvesting
+    OEKOBAU_CACHE_MAX_MB='2048' # size of the on-disk ilcd / epdx cache, 0 disables it
+    OEKOBAU_CACHE_LATEST_TTL='86400' # seconds an uuid without version is assumed to still point to the same version
+    EXTERNAL_HTTP_POOL_SIZE='16' # keep-alive connections kept per host
+    EXTERNAL_HTTP_MAX_PER_HOST='8' # concurrent requests per host
+    EXTERNAL_HTTP_RATE_LIMIT='10' # requests per second over all hosts, 0 disables the limit
+    EXTERNAL_HTTP_BURST='20'
+    EXTERNAL_HTTP_RETRIES='3'
+    EXTERNAL_HTTP_BACKOFF='0.5' # seconds, upper bound of the jittered delay doubles on every retry
+    EXTERNAL_HTTP_TIMEOUT='30' # seconds per request
 
     # optional vars
     TEST_USER='true'
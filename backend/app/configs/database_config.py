@@ -7,6 +7,13 @@ load_dotenv()
 from app.configs.base_config import BaseConfig
 
 class DatabaseConfig:
+    BULK_BATCH_SIZE = int(os.environ.get('DB_BULK_BATCH_SIZE', BaseConfig.DB_BULK_BATCH_SIZE))
+    EPD_CACHE_SIZE = int(os.environ.get('EPD_CACHE_SIZE', BaseConfig.EPD_CACHE_SIZE))
+    STREAM_BATCH_SIZE = int(os.environ.get('DB_STREAM_BATCH_SIZE', BaseConfig.DB_STREAM_BATCH_SIZE))
+    SNAPSHOT_ROW_GROUP_SIZE = int(os.environ.get('SNAPSHOT_ROW_GROUP_SIZE', BaseConfig.SNAPSHOT_ROW_GROUP_SIZE))
+    IMPACT_MATRIX_CACHE = os.environ.get('IMPACT_MATRIX_CACHE', BaseConfig.IMPACT_MATRIX_CACHE).lower() == 'true'
+    BUILDUP_RESULTS_CACHE = os.environ.get('BUILDUP_RESULTS_CACHE', BaseConfig.BUILDUP_RESULTS_CACHE).lower() == 'true'
+
     @staticmethod
     def is_external_db() -> bool:
         return os.environ.get('USE_EXTERNAL_DB', BaseConfig.USE_EXTERNAL_DB).lower() == 'true'
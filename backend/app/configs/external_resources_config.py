@@ -2,15 +2,40 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 from app.configs.base_config import BaseConfig
+from app.configs.path_config import PathConfig
 
 class OkobauConfig:
+    SOURCE_NAME = "Oekobaudat"   # epd_sourceName of harvested products
     DATASTOCK_ID = os.environ.get("OEKOBAU_DATASTOCK_ID", BaseConfig.OEKOBAU_DATASTOCK_ID)
     MAIN_URL = f"https://oekobaudat.de/OEKOBAU.DAT/resource/datastocks/{DATASTOCK_ID}"
     COMPLIANCE_ID_A1 = os.environ.get("OEKOBAU_COMPLIANCE_ID_A1", BaseConfig.OEKOBAU_COMPLIANCE_ID_A1)
     COMPLIANCE_ID_A2 = os.environ.get("OEKOBAU_COMPLIANCE_ID_A2", BaseConfig.OEKOBAU_COMPLIANCE_ID_A2) #choose a1 in first phases of dev
-    FULL_LIST_URL = f"{MAIN_URL}/processes?search=true&compliance={COMPLIANCE_ID_A2}&format=json&pageSize=5000"
-    FULL_LIST_URL_A1 = f"{MAIN_URL}/processes?search=true&format=json&pageSize=5000"
     SINGLE_ITEM_URL = f"{MAIN_URL}/processes/"
+    PROCESS_LIST_URL = f"{MAIN_URL}/processes"
+    PROCESS_LIST_PARAMS = {"search": "true", "compliance": COMPLIANCE_ID_A2, "format": "json"}   # read a page at a time by iter_epds
+    LIST_PAGE_SIZE = int(os.environ.get("OEKOBAU_LIST_PAGE_SIZE", BaseConfig.OEKOBAU_LIST_PAGE_SIZE))
+    FETCH_WORKERS = int(os.environ.get("OEKOBAU_FETCH_WORKERS", BaseConfig.OEKOBAU_FETCH_WORKERS))
+    FETCH_TIMEOUT = float(os.environ.get("OEKOBAU_FETCH_TIMEOUT", BaseConfig.OEKOBAU_FETCH_TIMEOUT))
+    FETCH_RETRIES = int(os.environ.get("OEKOBAU_FETCH_RETRIES", BaseConfig.OEKOBAU_FETCH_RETRIES))
+    FETCH_BACKOFF = float(os.environ.get("OEKOBAU_FETCH_BACKOFF", BaseConfig.OEKOBAU_FETCH_BACKOFF))
+    FETCH_ORDERED = os.environ.get("OEKOBAU_FETCH_ORDERED", BaseConfig.OEKOBAU_FETCH_ORDERED).lower() == 'true'
+    CONVERT_WORKERS = int(os.environ.get("OEKOBAU_CONVERT_WORKERS", BaseConfig.OEKOBAU_CONVERT_WORKERS)) or os.cpu_count() or 1
+    PIPELINE_QUEUE_SIZE = int(os.environ.get("OEKOBAU_PIPELINE_QUEUE_SIZE", BaseConfig.OEKOBAU_PIPELINE_QUEUE_SIZE))
+    WRITE_BATCH_SIZE = int(os.environ.get("OEKOBAU_WRITE_BATCH_SIZE", BaseConfig.OEKOBAU_WRITE_BATCH_SIZE))
+    CHECKPOINT_FILE = PathConfig.BACKEND_DIR / os.environ.get("OEKOBAU_CHECKPOINT_FILE", str(PathConfig.CACHE_DIR / 'harvest_checkpoint.jsonl'))
+    CACHE_DIR = PathConfig.BACKEND_DIR / os.environ.get("OEKOBAU_CACHE_DIR", str(PathConfig.CACHE_DIR / 'ilcd'))
+    CACHE_MAX_BYTES = int(float(os.environ.get("OEKOBAU_CACHE_MAX_MB", BaseConfig.OEKOBAU_CACHE_MAX_MB)) * 1024 * 1024)
+    CACHE_LATEST_TTL = float(os.environ.get("OEKOBAU_CACHE_LATEST_TTL", BaseConfig.OEKOBAU_CACHE_LATEST_TTL))
+
+class HttpClientConfig:
+    POOL_SIZE = int(os.environ.get("EXTERNAL_HTTP_POOL_SIZE", BaseConfig.EXTERNAL_HTTP_POOL_SIZE))
+    MAX_PER_HOST = int(os.environ.get("EXTERNAL_HTTP_MAX_PER_HOST", BaseConfig.EXTERNAL_HTTP_MAX_PER_HOST))
+    RATE_LIMIT = float(os.environ.get("EXTERNAL_HTTP_RATE_LIMIT", BaseConfig.EXTERNAL_HTTP_RATE_LIMIT))
+    BURST = float(os.environ.get("EXTERNAL_HTTP_BURST", BaseConfig.EXTERNAL_HTTP_BURST))
+    RETRIES = int(os.environ.get("EXTERNAL_HTTP_RETRIES", BaseConfig.EXTERNAL_HTTP_RETRIES))
+    BACKOFF = float(os.environ.get("EXTERNAL_HTTP_BACKOFF", BaseConfig.EXTERNAL_HTTP_BACKOFF))
+    TIMEOUT = float(os.environ.get("EXTERNAL_HTTP_TIMEOUT", BaseConfig.EXTERNAL_HTTP_TIMEOUT))
 
 class ExternalResourcesConfig:
-    OKOBAU = OkobauConfig
\ No newline at end of file
+    OKOBAU = OkobauConfig
+    HTTP_CLIENT = HttpClientConfig
\ No newline at end of file
@@ -3,6 +3,9 @@ from pathlib import Path
 class PathConfig:
     # Base path
     APP_DIR = Path(__file__).parent.parent  # Points to app directory
+    BACKEND_DIR = APP_DIR.parent
+    # Local caches of external resources
+    CACHE_DIR = BACKEND_DIR / 'cache'
     # Infrastructure paths
     INFRASTRUCTURE_DIR = APP_DIR / 'infrastructure'
     PERSISTENCE_DIR = INFRASTRUCTURE_DIR / 'persistence'
@@ -0,0 +1,32 @@
+#backend/app/core/application/dtos/buildup/buildup_impact_dto.py
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+# the impacts of one entry of buildup.products, already multiplied by its results quantity
+class ProductContribution_DTO(BaseModel):
+    key: str                                # key in buildup.products, "product_id_1"
+    type: str                               # actual or reference
+    element_id: Optional[str] = None        # model_mapping_element_id of the mapped model element
+    uri: Optional[str] = None               # references only
+    product_id: Optional[int] = None        # the stored product a reference resolved to
+    epd_version: Optional[str] = None
+    name: Optional[str] = None
+    declared_unit: Optional[str] = None
+    quantity: float
+    stages: Dict[str, Dict[str, float]] = Field(default_factory=dict)    # indicator -> stage -> value
+    phases: Dict[str, Dict[str, float]] = Field(default_factory=dict)    # indicator -> life cycle phase -> value
+
+
+class BuildupImpact_DTO(BaseModel):
+    id: int
+    name: str
+    quantity: Optional[float] = None
+    unit: Optional[str] = None
+    stages: Dict[str, Dict[str, float]] = Field(default_factory=dict)    # summed over the products
+    phases: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+    contributions: List[ProductContribution_DTO] = Field(default_factory=list)
+    errors: Dict[str, str] = Field(default_factory=dict)    # product key -> why it is not in the totals
+    complete: bool = True                                   # every product made it into the totals
@@ -0,0 +1,22 @@
+# backend/app/core/application/dtos/fetch/fetch_result_dto.py
+
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+# outcome of a single job run by the fetch pool
+class FetchResult_DTO(BaseModel):
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+    )
+    index: int      # position of the item in the submitted iterable
+    item: Any
+    value: Optional[Any] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None   # class name of the exception, if the job failed
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error_type is None
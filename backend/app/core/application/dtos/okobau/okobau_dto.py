@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -39,4 +39,25 @@ class EPDResponse(BaseModel):
     dsType: Optional[str] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# outcome of an incremental sync of the okobaudat datastock against the products table
+class OkobauSyncReport_DTO(BaseModel):
+    added: List[str] = Field(default_factory=list)      # uuids
+    updated: List[str] = Field(default_factory=list)
+    retired: List[str] = Field(default_factory=list)    # in the products table, but no longer in the datastock
+    unchanged: int = 0
+    failed: Dict[str, str] = Field(default_factory=dict)   # uuid : error
+    dry_run: bool = False
+
+
+
+# outcome of a pipelined harvest of the okobaudat datastock
+class HarvestReport_DTO(BaseModel):
+    added: int = 0
+    existing: int = 0     # skipped before download, same uuid and version already in the products table
+    skipped: int = 0      # left out because of --resume / --retry-failed
+    failed: Dict[str, str] = Field(default_factory=dict)   # uuid : error
+    elapsed_s: float = 0
+    stages: Dict[str, Dict[str, Any]] = Field(default_factory=dict)   # stage name : throughput and queue stats
@@ -0,0 +1,15 @@
+# backend/app/core/application/dtos/page/page_dto.py
+
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# one page of a keyset paginated listing
+class Page_DTO(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)   # repositories page entities, services page dtos
+
+    items: List[Any] = Field(default_factory=list)
+    limit: int
+    next_cursor: Optional[str] = None   # pass back to get the following page, None on the last page
+    total: Optional[int] = None         # only counted when asked for
@@ -1,8 +1,9 @@
 # backend/app/core/application/dtos/product/product_dto.py
 
-from typing import Dict, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # for minimal use (make list of products, check identity, etc)
@@ -37,11 +38,13 @@ class ProductDensity_DTO(ProductHeader_DTO):
     epd_bulk_density: Optional[float] = None
     epd_grammage: Optional[float] = None
     epd_layer_thickness: Optional[float] = None
+    epd_weight_per_piece: Optional[float] = None
 
 
 # to calculate a product´s environmental impact
 class Product_DTO(ProductDensity_DTO):
     epdx: Dict
+    updated_at: Optional[datetime] = None   # set by the db, part of the parsed epd cache key
 
 
 # minimal implementation used by filter mappings
@@ -59,3 +62,35 @@ class ProductEPD_DTO(BaseModel):
     sample use:
     impacts = {"gwp_fos" : {"a1a3" : 100}}
     """
+
+
+# outcome of a bulk import, products are named by their uri and version <epd_sourceName>.<epd_id>@<epd_version>
+class ProductBulkReport_DTO(BaseModel):
+    created: List[str] = Field(default_factory=list)
+    skipped: List[str] = Field(default_factory=list)   # same source, id and version already stored, or repeated in the input
+    conflicts: List[str] = Field(default_factory=list)   # stored by another writer between the existence check and the insert
+    failed: Dict[str, str] = Field(default_factory=dict)   # <uri>@<epd_version> : error
+    elapsed_s: float = 0
+
+
+# products resolved from references, keyed as requested: <epd_sourceName>.<epd_id>, or <uri>@<epd_version> for a version
+class ProductUriBatch_DTO(BaseModel):
+    products: Dict[str, Product_DTO] = Field(default_factory=dict)
+    missing: List[str] = Field(default_factory=list)   # well formed, but not stored
+    invalid: List[str] = Field(default_factory=list)   # not of the form <epd_sourceName>.<epd_id>
+
+
+# one product of an impact ranking, value is its impact on the ranked indicator and stage
+class ProductImpactRank_DTO(BaseModel):
+    value: float
+    product: ProductHeader_DTO
+
+
+# impacts of many products as one table, a row per product in product_ids and a value per column, None where not declared
+class ProductImpactTable_DTO(BaseModel):
+    by: str = "total"    # columns per indicator (total), <indicator>.<phase> (phase) or <indicator>.<stage> (stage)
+    columns: List[str] = Field(default_factory=list)
+    product_ids: List[int] = Field(default_factory=list)
+    values: List[List[Optional[float]]] = Field(default_factory=list)
+    missing: List[int] = Field(default_factory=list)   # requested, but not stored
+    errors: Dict[int, str] = Field(default_factory=dict)    # not convertible to to_unit, by product id
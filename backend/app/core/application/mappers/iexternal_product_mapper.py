@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Dict, Optional
 
 from app.core.application.dtos.epdx.epdx_dto import EPD
 from app.core.application.dtos.okobau.okobau_dto import \
@@ -6,10 +7,34 @@ from app.core.application.dtos.okobau.okobau_dto import \
 
 
 class IOkobauMapper():
+    @staticmethod
     @abstractmethod
-    def uuid_to_epdx(uuid: str) -> EPD:
+    def uuid_to_url(uuid: str) -> str:
         pass
 
+    @staticmethod
     @abstractmethod
-    def epd_to_epdx(epd: OkobauResponse) -> EPD:
-        pass
\ No newline at end of file
+    def ilcd_version(data: Dict) -> Optional[str]:
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def ilcd_url(data: Dict) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def uuid_to_ilcd(self, uuid: str, timeout: Optional[float] = None, version: Optional[str] = None) -> Dict:
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def ilcd_to_epdx(data: Dict, source_url: Optional[str], source_name: Optional[str] = None) -> EPD:
+        pass
+
+    @abstractmethod
+    def uuid_to_epdx(self, uuid: str, timeout: Optional[float] = None, version: Optional[str] = None) -> EPD:
+        pass
+
+    @abstractmethod
+    def epd_to_epdx(self, epd: OkobauResponse, timeout: Optional[float] = None) -> EPD:
+        pass
@@ -12,10 +12,22 @@ class IProductMapper():
     def dto_to_product_entity(product_dto : ProductHeader_DTO) -> Product:
         pass
 
+    @abstractmethod
+    def dto_to_product_row(product_dto : ProductHeader_DTO) -> dict:
+        pass
+
     @abstractmethod
     def entity_to_product_dto(product : Product) -> Product_DTO: 
         pass
 
+    @abstractmethod
+    def row_columns() -> list[str]:
+        pass
+
+    @abstractmethod
+    def header_columns() -> list[str]:
+        pass
+
     @abstractmethod
     def entity_to_product_header_dto(product : Product) -> ProductHeader_DTO:  
         pass
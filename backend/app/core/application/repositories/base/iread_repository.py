@@ -1,6 +1,7 @@
 # app/core/application/repositories/base/iread_repository.py
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
+from app.core.application.dtos.page.page_dto import Page_DTO
 from app.core.application.repositories.base.irepository import IRepository, T
 
 class IReadRepository(IRepository[T]):
@@ -11,10 +12,35 @@ class IReadRepository(IRepository[T]):
         #it is similar to Union[T, None] if it finds the entity it returns T or else None
         pass
 
+    @abstractmethod
+    def get_by_ids(self, ids: List[int]) -> List[T]:
+        pass
+
     @abstractmethod
     def get_all(self) -> List[T]:
         pass
     
     @abstractmethod
     def filter(self, **kwargs) -> List[T]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        pass
+
+    @abstractmethod
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False,
+        columns: Optional[List[str]] = None
+    ) -> Page_DTO:
+        pass
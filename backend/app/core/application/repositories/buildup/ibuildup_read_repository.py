@@ -1,6 +1,11 @@
 # app/core/application/repositories/buildup/ibuildup_read_repository.py
-from app.core.domain.entities import Buildup
+from abc import abstractmethod
+from typing import List, Optional, Tuple
+
+from app.core.domain.entities import Buildup, BuildupResult
 from app.core.application.repositories.base.iread_repository import IReadRepository
 
 class IBuildupReadRepository(IReadRepository[Buildup]):
-    pass
\ No newline at end of file
+    @abstractmethod
+    def get_results(self, ids: List[int]) -> List[Tuple[int, int, Optional[BuildupResult]]]:
+        pass
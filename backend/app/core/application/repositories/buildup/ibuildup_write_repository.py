@@ -1,6 +1,15 @@
 # app/core/application/repositories/buildup/ibuildup_write_repository.py
+from abc import abstractmethod
+from typing import Any, Dict, List
+
 from app.core.domain.entities import Buildup
 from app.core.application.repositories.base.iwrite_repository import IWriteRepository
 
 class IBuildupWriteRepository(IWriteRepository[Buildup]):
-    pass
\ No newline at end of file
+    @abstractmethod
+    def save_results(self, rows: List[Dict[str, Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def touch_results(self, ids: List[int], products_stamp: str) -> None:
+        pass
@@ -1,6 +1,89 @@
 # app/core/application/repositories/product/iproduct_read_repository.py
+from abc import abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.application.dtos.page.page_dto import Page_DTO
 from app.core.domain.entities import Product
 from app.core.application.repositories.base.iread_repository import IReadRepository
 
 class IProductReadRepository(IReadRepository[Product]):
-    pass
\ No newline at end of file
+
+    @abstractmethod
+    def get_versions_by_source(self, epd_sourceName: str) -> Dict[str, List[Tuple[int, str]]]:
+        pass
+
+    @abstractmethod
+    def get_existing_keys(self, keys: List[Tuple[str, str, str]]) -> Set[Tuple[str, str, str]]:
+        pass
+
+    @abstractmethod
+    def get_by_uri(self, epd_sourceName: str, epd_id: str, epd_version: Optional[str] = None) -> Optional[Product]:
+        pass
+
+    @abstractmethod
+    def get_by_uris(self, uris: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Product]]:
+        pass
+
+    @abstractmethod
+    def get_uri_versions(self, uris: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        pass
+
+    @abstractmethod
+    def rank_by_impact(
+        self,
+        indicator: str,
+        stage: str,
+        limit: int,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[int, float]]:
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Page_DTO:
+        pass
+
+    @abstractmethod
+    def get_impact_rows(
+        self,
+        ids: Optional[List[int]] = None,
+        batch_size: int = 1000
+    ) -> Tuple[List[int], List[Tuple[int, str, str, Optional[float]]]]:
+        pass
+
+    @abstractmethod
+    def get_column_rows(
+        self,
+        columns: List[str],
+        ids: Optional[List[int]] = None,
+        batch_size: int = 1000
+    ) -> List[Tuple[Any, ...]]:
+        pass
+
+    @abstractmethod
+    def get_impact_change_stamp(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_impact_keys(self, indicators: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        columns: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        with_impacts: bool = False,
+        indicators: Optional[List[str]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[Tuple[str, str], float]]]:
+        pass
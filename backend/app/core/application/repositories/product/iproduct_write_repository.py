@@ -1,6 +1,20 @@
 # app/core/application/repositories/product/iproduct_write_repository.py
+from abc import abstractmethod
+from typing import Any, Dict, List
+
 from app.core.domain.entities import Product
 from app.core.application.repositories.base.iwrite_repository import IWriteRepository
 
 class IProductWriteRepository(IWriteRepository[Product]):
-    pass
\ No newline at end of file
+
+    @abstractmethod
+    def update_status(self, ids: List[int], status: str) -> int:
+        pass
+
+    @abstractmethod
+    def bulk_insert(self, rows: List[Dict[str, Any]], skip_conflicts: bool = True) -> int:
+        pass
+
+    @abstractmethod
+    def rebuild_impacts(self, batch_size: int = 500) -> int:
+        pass
@@ -1,20 +1,52 @@
 
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from app.core.application.dtos.buildup.buildup_dto import BuildupBase_DTO, BuildupCreate_DTO, BuildupResponse_DTO, BuildupUpdate_DTO, MappedBuildup_DTO
+from app.core.application.dtos.buildup.buildup_impact_dto import BuildupImpact_DTO
 
 class IBuildupService(ABC):
 
     @abstractmethod
-    def get_impact_from_buildup_dto(self, buildup_dto : Union[BuildupResponse_DTO, MappedBuildup_DTO]):
+    def get_impact_from_buildup_dto(
+        self,
+        buildup_dto : Union[BuildupResponse_DTO, MappedBuildup_DTO],
+        indicators: Optional[List[str]] = None,
+        with_contributions: bool = True
+    ) -> BuildupImpact_DTO:
+        pass
+
+    @abstractmethod
+    def get_impacts_from_buildup_dtos(
+        self,
+        buildup_dtos: List[Union[BuildupResponse_DTO, MappedBuildup_DTO]],
+        indicators: Optional[List[str]] = None,
+        with_contributions: bool = True
+    ) -> List[BuildupImpact_DTO]:
+        pass
+
+    @abstractmethod
+    def get_buildup_impacts(
+        self,
+        ids: List[int],
+        indicators: Optional[List[str]] = None,
+        with_contributions: bool = True
+    ) -> Dict[int, BuildupImpact_DTO]:
+        pass
+
+    @abstractmethod
+    def get_impact_stamp(self, id: int) -> Optional[str]:
         pass
 
     @abstractmethod
     def get_all_buildups(self) -> Optional[List[BuildupResponse_DTO]] :
         pass
 
+    @abstractmethod
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        pass
+
     @abstractmethod
     def get_buildup_by_name_status(self, buildup_dto : BuildupBase_DTO) -> Optional[BuildupResponse_DTO]:
         pass       
@@ -33,6 +33,10 @@ class ICategoryService(ABC):
     def get_all_categories(self) -> List[CategoryResponseDTO]:
         pass
 
+    @abstractmethod
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        pass
+
     @abstractmethod
     def get_category_property_by_id(self, categoryResponseDTO: CategoryResponseDTO, property_id : int) -> CategoryProperty:
         pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
+
+from app.core.application.dtos.epdx.epdx_dto import EPD
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.core.domain.values.impact_vector import ImpactVector
+
+
+class IEpdCacheService(ABC):
+    @abstractmethod
+    def get_epd(self, product_dto: Product_DTO) -> EPD:
+        pass
+
+    @abstractmethod
+    def get_impact_vector(self, product_dto: Product_DTO) -> ImpactVector:
+        pass
+
+    @abstractmethod
+    def get_epd_and_impact_vector(self, product_dto: Product_DTO) -> Tuple[EPD, ImpactVector]:
+        pass
+
+    @abstractmethod
+    def invalidate(self, product_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
@@ -3,6 +3,7 @@ from typing import List, Union
 
 from app.core.application.dtos.epdx.epdx_dto import EPD, Conversion, ImpactCategoryKey, LifeCycleStage
 from app.core.application.dtos.product.product_dto import Product_DTO
+from app.core.domain.values.impact_vector import ImpactVector
 
 
 class IEpdxService(ABC):
@@ -14,7 +15,8 @@ class IEpdxService(ABC):
     life_cycle_stages : List[LifeCycleStage] = None,
     conversion : Conversion = None,
     conversion_factor : float = 1,    #give the option to just provide a factor, if available. 
-    normalize_to : float = 1   # the buildup or model will pass this along. 
+    normalize_to : float = 1,   # the buildup or model will pass this along. 
+    impact_vector : ImpactVector = None   # the impacts of product_epd, built from it if not given
      ) -> float:
         pass
 
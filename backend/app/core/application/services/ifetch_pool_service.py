@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from app.core.application.dtos.fetch.fetch_result_dto import FetchResult_DTO
+
+
+class IFetchPoolService(ABC):
+    @abstractmethod
+    def call_with_retry(self, fn: Callable[[Any], Any], item: Any) -> Any:
+        pass
+
+    @abstractmethod
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any], ordered: Optional[bool] = None) -> Iterator[FetchResult_DTO]:
+        pass
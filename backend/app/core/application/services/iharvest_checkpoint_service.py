@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class IHarvestCheckpointService(ABC):
+    @abstractmethod
+    def for_namespace(self, namespace: str) -> "IHarvestCheckpointService":
+        pass
+
+    @abstractmethod
+    def load(self) -> Dict[str, Dict]:
+        pass
+
+    @abstractmethod
+    def get_processed(self) -> Set[str]:
+        pass
+
+    @abstractmethod
+    def get_failed(self) -> Dict[str, str]:
+        pass
+
+    @abstractmethod
+    def record_done(self, items: List[Tuple[str, Optional[str]]]) -> None:
+        pass
+
+    @abstractmethod
+    def record_failed(self, uuid: str, version: Optional[str], error_type: str, error: str) -> None:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from app.core.application.dtos.okobau.okobau_dto import HarvestReport_DTO
+
+
+class IHarvestPipelineService(ABC):
+    @abstractmethod
+    def run(self, user_id: Optional[int] = None, resume: bool = False, retry_failed: bool = False) -> HarvestReport_DTO:
+        pass
+
+    @abstractmethod
+    def run_archive(
+        self,
+        path: Path,
+        user_id: Optional[int] = None,
+        resume: bool = False,
+        retry_failed: bool = False,
+        source_name: Optional[str] = None
+    ) -> HarvestReport_DTO:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+import requests
+
+
+class IHttpClientService(ABC):
+    @abstractmethod
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> requests.Response:
+        pass
+
+    @abstractmethod
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def reset_stats(self) -> None:
+        pass
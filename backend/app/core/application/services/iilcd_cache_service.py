@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class IIlcdCacheService(ABC):
+    @abstractmethod
+    def get(self, kind: str, uuid: str, version: Optional[str] = None) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def put(self, kind: str, uuid: str, version: str, data: Any, latest: bool = False) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
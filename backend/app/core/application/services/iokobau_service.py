@@ -1,20 +1,26 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional
 
 from app.core.application.dtos.epdx.epdx_dto import EPD
+from app.core.application.dtos.fetch.fetch_result_dto import FetchResult_DTO
 from app.core.application.dtos.okobau.okobau_dto import EPDResponse
 
 
 class IOkobauService(ABC):
     @abstractmethod
-    def get_epds(self) -> dict:
+    def get_epds_list() -> list:
         pass
 
     @abstractmethod
-    def get_epds_list() -> list:
+    def get_epd_response_list() -> list[EPDResponse]:
         pass
 
     @abstractmethod
-    def get_epd_response_list() -> list[EPDResponse]:
+    def iter_epds(self, page_size: Optional[int] = None) -> Iterator[dict]:
+        pass
+
+    @abstractmethod
+    def iter_epd_responses(self, page_size: Optional[int] = None) -> Iterator[EPDResponse]:
         pass
 
     @abstractmethod
@@ -30,13 +36,21 @@ class IOkobauService(ABC):
         pass
 
     @abstractmethod
-    def get_epdx_list(self) -> list[EPD]:
+    def iter_epdx(self, epds: Iterable[EPDResponse], ordered: Optional[bool] = None) -> Iterator[FetchResult_DTO]:
+        pass
+
+    @abstractmethod
+    def get_epdx_list(self, ordered: Optional[bool] = None) -> list[EPD]:
         pass
 
     @abstractmethod
     def get_epdx_from_uuid(self, uuid: str) -> EPD:
         pass
 
+    @abstractmethod
+    def get_http_stats(self) -> dict:
+        pass
+
 
     # Or more detailed version:
     @abstractmethod
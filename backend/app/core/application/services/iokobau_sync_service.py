@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
+
+from app.core.application.dtos.okobau.okobau_dto import EPDResponse, OkobauSyncReport_DTO
+
+
+class IOkobauSyncService(ABC):
+    @abstractmethod
+    def diff(self, remote_epds: Iterable[EPDResponse]) -> Tuple[List[EPDResponse], List[Tuple[EPDResponse, int]], List[Tuple[str, List[int]]], int]:
+        pass
+
+    @abstractmethod
+    def sync(self, user_id: Optional[int] = None, mark_retired: bool = False, dry_run: bool = False) -> OkobauSyncReport_DTO:
+        pass
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.core.application.dtos.product.product_dto import ProductImpactTable_DTO
+from app.core.domain.values.impact_matrix import ImpactMatrix
+
+
+class IProductImpactService(ABC):
+    @abstractmethod
+    def get_impact_matrix(self, ids: Optional[Sequence[int]] = None) -> Tuple[ImpactMatrix, List[int]]:
+        pass
+
+    @abstractmethod
+    def evaluate_matrix(
+        self,
+        ids: Optional[Sequence[int]] = None,
+        quantities: Optional[Mapping[int, float]] = None,
+        conversion_factors: Optional[Mapping[int, float]] = None,
+        indicators: Optional[Sequence[Any]] = None,
+        stages: Optional[Sequence[Any]] = None,
+        to_unit: Optional[Any] = None
+    ) -> Tuple[ImpactMatrix, List[int], Dict[int, str]]:
+        pass
+
+    @abstractmethod
+    def evaluate_impacts(
+        self,
+        ids: Optional[Sequence[int]] = None,
+        quantities: Optional[Mapping[int, float]] = None,
+        conversion_factors: Optional[Mapping[int, float]] = None,
+        indicators: Optional[Sequence[Any]] = None,
+        stages: Optional[Sequence[Any]] = None,
+        by: str = "total",
+        to_unit: Optional[Any] = None
+    ) -> ProductImpactTable_DTO:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -1,11 +1,13 @@
 # app/core/application/services/iproduct_service.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from app.core.application.dtos.product.product_dto import (Product_DTO, ProductEPD_DTO,
-                                                           ProductHeader_DTO)
+from app.core.application.dtos.page.page_dto import Page_DTO
+from app.core.application.dtos.product.product_dto import (Product_DTO, ProductBulkReport_DTO, ProductEPD_DTO,
+                                                           ProductHeader_DTO, ProductImpactRank_DTO, ProductUriBatch_DTO)
 from app.core.domain.entities import Product
-from app.core.application.dtos.epdx.epdx_dto import Conversion, ImpactCategoryKey, LifeCycleStage
+from app.core.application.dtos.epdx.epdx_dto import EPD, Conversion, ImpactCategoryKey, LifeCycleStage
+from app.core.domain.values.impact_vector import ImpactVector
 
 
 class IProductService(ABC):
@@ -13,6 +15,67 @@ class IProductService(ABC):
     def get_all_products(self) -> List[Product]:
         pass
     
+    @abstractmethod
+    def get_products_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False
+    ) -> Page_DTO:
+        pass
+
+    @abstractmethod
+    def get_product_headers_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False
+    ) -> Page_DTO:
+        pass
+
+    @abstractmethod
+    def search_products(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Page_DTO:
+        pass
+
+    @abstractmethod
+    def rank_products_by_impact(
+        self,
+        indicator: str,
+        stage: str,
+        limit: int,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ProductImpactRank_DTO]:
+        pass
+
+    @abstractmethod
+    def export_products(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        with_impacts: bool = False,
+        indicators: Optional[List[str]] = None
+    ) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        pass
+
     @abstractmethod
     def get_product_by_id(self, id: int) -> Optional[Product]:
         pass
@@ -21,6 +84,18 @@ class IProductService(ABC):
     def get_product_by_uri(self, uri : str) -> Optional[Product]:
         pass
 
+    @abstractmethod
+    def get_products_by_uris(self, references: List[Tuple[str, Optional[str]]]) -> ProductUriBatch_DTO:
+        pass
+
+    @abstractmethod
+    def get_uri_versions(self, uris: List[str]) -> Dict[str, str]:
+        pass
+
+    @abstractmethod
+    def get_product_versions_by_source(self, epd_sourceName : str) -> Dict[str, List[Tuple[int, str]]]:
+        pass
+
     @abstractmethod    
     def get_impact_from_product_dto(self, 
     impact : ImpactCategoryKey, 
@@ -31,6 +106,18 @@ class IProductService(ABC):
     normalize_to : float) -> float:
         pass
 
+    @abstractmethod
+    def get_epd_from_product_dto(self, product_dto : Product_DTO) -> EPD:
+        pass
+
+    @abstractmethod
+    def get_impact_vector_from_product_dto(self, product_dto : Product_DTO) -> ImpactVector:
+        pass
+
+    @abstractmethod
+    def get_epd_cache_stats(self) -> Dict[str, Any]:
+        pass
+
     @abstractmethod
     def create_product(self, product: Product) -> Product:
         pass
@@ -41,13 +128,25 @@ class IProductService(ABC):
         pass
     
     @abstractmethod
-    def create_product_from_dto_list(self, product_dtos : list[ProductHeader_DTO], user_id: Optional[int] = None) -> list[Product]:
+    def create_product_from_dto_list(self, product_dtos : list[ProductHeader_DTO], user_id: Optional[int] = None) -> ProductBulkReport_DTO:
+        pass
+
+    @abstractmethod
+    def create_validated_product_list(self, product_dtos: List[Product_DTO], user_id: Optional[int] = None) -> int:
         pass
 
     @abstractmethod
     def update_product(self, id: int, product: Product) -> Optional[Product]:
         pass
     
+    @abstractmethod
+    def set_products_status(self, ids: List[int], status: str) -> int:
+        pass
+
     @abstractmethod
     def delete_product(self, id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def rebuild_product_impacts(self) -> int:
         pass
\ No newline at end of file
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+
+
+class IProductSnapshotService(ABC):
+    @abstractmethod
+    def write_snapshot(
+        self,
+        target: Union[str, BinaryIO],
+        with_epdx: bool = True,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def stream_snapshot(self, with_epdx: bool = False, filters: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+        pass
+
+    @abstractmethod
+    def read_snapshot(self, source: Union[str, BinaryIO], keep_ids: bool = False) -> Dict[str, int]:
+        pass
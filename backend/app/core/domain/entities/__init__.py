@@ -1,6 +1,7 @@
 # app/core/domain/entities/__init__.py
 from app.core.domain.entities.base import Base
 from app.core.domain.entities.buildup import Buildup
+from app.core.domain.entities.buildup_result import BuildupResult
 from app.core.domain.entities.category import Category
 from app.core.domain.entities.category_association import CategoryAssociation
 from app.core.domain.entities.identity_provider import IdentityProvider
@@ -8,6 +9,8 @@ from app.core.domain.entities.model import Model
 from app.core.domain.entities.filter_element import FilterElement
 from app.core.domain.entities.filter_mapping import FilterMapping
 from app.core.domain.entities.product import Product
+from app.core.domain.entities.product_impact import ProductImpact
+from app.core.domain.entities import product_search   # registers the full-text search ddl
 from app.core.domain.entities.role import Role
 from app.core.domain.entities.user import User
 from app.core.domain.entities.user_identity import UserIdentity
@@ -15,5 +18,5 @@ from app.core.domain.entities.user_roles import user_roles
 
 __all__ = [
     'User', 'Role', 'IdentityProvider', 'UserIdentity', 
-    'user_roles', 'BuildupEPD_DTO', 'Model', 'Product', 'Category', 'CategoryAssociation', 'FilterElement', 'FilterMapping'
+    'user_roles', 'Buildup', 'BuildupResult', 'Model', 'Product', 'ProductImpact', 'Category', 'CategoryAssociation', 'FilterElement', 'FilterMapping'
 ]
\ No newline at end of file
@@ -1,13 +1,19 @@
 # app/core/domain/entities/base.py
 from datetime import datetime, timezone
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Integer, literal_column, text
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 class Base(DeclarativeBase):
     __abstract__ = True
+    # read row_version back after a flush so merged entities carry the incremented value
+    __mapper_args__ = {"eager_defaults": True}
     
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
\ No newline at end of file
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
+    # incremented in sql on every update, unlike updated_at it changes for edits within the same second
+    row_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1"), onupdate=literal_column("row_version") + 1
+    )
@@ -0,0 +1,26 @@
+# app/core/domain/entities/buildup_result.py
+from typing import Dict, List, Optional
+from sqlalchemy import JSON, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.domain.entities.base import Base
+from sqlalchemy_serializer import SerializerMixin
+
+
+class BuildupResult(Base, SerializerMixin):
+    """
+    The computed impacts of a buildup, kept by the buildup service and valid while its fingerprint
+    matches: the buildup's row_version plus the id and row_version of the product each referenced uri
+    resolves to. products_stamp is the product table stamp the fingerprint was last checked against,
+    as long as it is unchanged the result is used without looking at the products.
+    """
+    __tablename__ = 'buildup_results'
+
+    buildup_id: Mapped[int] = mapped_column(Integer, ForeignKey('buildups.id', ondelete='CASCADE'), primary_key=True)
+    buildup_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    products_stamp: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    uris: Mapped[List[str]] = mapped_column(JSON, nullable=False)
+    impacts: Mapped[Dict] = mapped_column(JSON, nullable=False)
+
+    def __repr__(self):
+        return f"<BuildupResult(buildup_id={self.buildup_id}, fingerprint='{self.fingerprint}')>"
@@ -2,13 +2,19 @@
 from typing import Dict, Optional
 
 from app.core.domain.entities.base import Base
-from sqlalchemy import JSON, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy_serializer import SerializerMixin
 
 
 class Product(Base, SerializerMixin):
     __tablename__ = 'products'
+    __table_args__ = (
+        # one row per EPD version, enforced so that concurrent imports cannot duplicate it
+        Index('uq_products_source_epd_version', 'epd_sourceName', 'epd_id', 'epd_version', unique=True),
+        # uri lookups (latest row of source and epd id) find the row with one index seek
+        Index('ix_products_source_epd_id', 'epd_sourceName', 'epd_id', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id_created: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
@@ -33,4 +39,5 @@ class Product(Base, SerializerMixin):
     epd_layer_thickness: Mapped[Optional[float]] = mapped_column(Float(10), nullable=True)
     epd_subtype: Mapped[str] = mapped_column(String(255), nullable=True)
     epd_bulk_density: Mapped[Optional[float]] = mapped_column(Float(10), nullable=True)
+    epd_weight_per_piece: Mapped[Optional[float]] = mapped_column(Float(10), nullable=True)
     epd_description: Mapped[Optional[Text]] = mapped_column(Text, nullable = True)
\ No newline at end of file
@@ -0,0 +1,21 @@
+from app.core.domain.entities.base import Base
+from sqlalchemy import Double, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy_serializer import SerializerMixin
+
+
+class ProductImpact(Base, SerializerMixin):
+    """One value of products.epdx["impacts"][indicator][stage], kept in sync by the product write repository."""
+    __tablename__ = 'product_impacts'
+    __table_args__ = (
+        # ranking and range filters on one indicator and stage, answered from the index alone
+        Index('ix_product_impacts_indicator_stage_value', 'indicator', 'stage', 'value', 'product_id'),
+    )
+
+    product_id: Mapped[int] = mapped_column(Integer, ForeignKey('products.id', ondelete='CASCADE'), primary_key=True)
+    indicator: Mapped[str] = mapped_column(String(45), primary_key=True)
+    stage: Mapped[str] = mapped_column(String(45), primary_key=True)
+    value: Mapped[float] = mapped_column(Double, nullable=False)
+
+    def __repr__(self):
+        return f"<ProductImpact(product_id={self.product_id}, indicator='{self.indicator}', stage='{self.stage}', value={self.value})>"
@@ -0,0 +1,30 @@
+from app.core.domain.entities.product import Product
+from sqlalchemy import DDL, event
+
+# the product text that /products/search looks at, in bm25 weight order
+PRODUCT_SEARCH_COLUMNS = ('epd_name', 'epd_description', 'epd_comment', 'epd_sourceName')
+PRODUCT_SEARCH_WEIGHTS = (10.0, 1.0, 1.0, 2.0)
+
+# sqlite: an fts5 table keyed by the product id, written by the product write repository
+PRODUCT_SEARCH_TABLE = 'products_fts'
+# mysql: a FULLTEXT index that innodb maintains itself
+PRODUCT_SEARCH_INDEX = 'ft_products_search'
+
+event.listen(
+    Product.__table__, 'after_create',
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCT_SEARCH_TABLE} "
+        f"USING fts5({', '.join(PRODUCT_SEARCH_COLUMNS)}, tokenize='unicode61 remove_diacritics 2')"
+    ).execute_if(dialect='sqlite'),
+)
+event.listen(
+    Product.__table__, 'after_create',
+    DDL(
+        f"CREATE FULLTEXT INDEX {PRODUCT_SEARCH_INDEX} ON products "
+        f"({', '.join(f'`{column}`' for column in PRODUCT_SEARCH_COLUMNS)})"
+    ).execute_if(dialect=('mysql', 'mariadb')),
+)
+event.listen(
+    Product.__table__, 'before_drop',
+    DDL(f"DROP TABLE IF EXISTS {PRODUCT_SEARCH_TABLE}").execute_if(dialect='sqlite'),
+)
@@ -1,9 +1,9 @@
-from typing import List
+from typing import Dict, List
 from lcax import LifeCycleStage
 from enum import Enum
 
 
-class LifeCyclePhases(str, Enum):
+class LifeCyclePhases(Enum):
     """mapping of single life cycle stages to broader life cycle phases"""
     PRODUCTION : List[LifeCycleStage] = [LifeCycleStage.a1a3]
     CONSTRUCTION : List[LifeCycleStage] = [LifeCycleStage.a4, LifeCycleStage.a5]
@@ -13,4 +13,8 @@ class LifeCyclePhases(str, Enum):
     OPERATIONAL_TRANSPORT : List[LifeCycleStage] = [LifeCycleStage.b8]
     DISASSEMBLY : List[LifeCycleStage] = [LifeCycleStage.c1, LifeCycleStage.c2]
     DISPOSAL : List[LifeCycleStage] = [LifeCycleStage.c3, LifeCycleStage.c4]
-    REUSE : List[LifeCycleStage] = [LifeCycleStage.d]
\ No newline at end of file
+    REUSE : List[LifeCycleStage] = [LifeCycleStage.d]
+
+
+# stage key as used in epdx impacts ("a1a3") -> phase name ("production")
+PHASE_OF_STAGE: Dict[str, str] = {stage.value: phase.name.lower() for phase in LifeCyclePhases for stage in phase.value}
@@ -0,0 +1,7 @@
+from app.core.domain.values.impact_matrix import TABLE_REDUCTIONS, ImpactMatrix
+from app.core.domain.values.impact_vector import INDICATORS, PHASES, STAGES, ImpactVector
+from app.core.domain.values.unit_conversion import (ConversionPath, UnitConversionError, conversion_factor, conversion_factors,
+                                                    conversion_parameters, impact_factor)
+
+__all__ = ['INDICATORS', 'PHASES', 'STAGES', 'TABLE_REDUCTIONS', 'ConversionPath', 'ImpactMatrix', 'ImpactVector', 'UnitConversionError',
+           'conversion_factor', 'conversion_factors', 'conversion_parameters', 'impact_factor']
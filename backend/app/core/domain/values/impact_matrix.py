@@ -0,0 +1,172 @@
+# app/core/domain/values/impact_matrix.py
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.domain.values.impact_vector import (INDICATOR_INDEX, INDICATORS, PHASE_MATRIX, PHASES, STAGE_INDEX, STAGES,
+                                                  ImpactVector, _key)
+
+# how a matrix is flattened into a table: a column per indicator and stage, per phase, or per indicator
+TABLE_REDUCTIONS = ("stage", "phase", "total")
+
+
+def _axis(names: Iterable[Any], order: Sequence[str]) -> Tuple[str, ...]:
+    present = {_key(name) for name in names}
+    return tuple(name for name in order if name in present)
+
+
+class ImpactMatrix:
+    """
+    The impacts of many products stacked into one N x indicator x stage float64 array with a mask
+    of the declared values, the batch counterpart of ImpactVector. Rows are in product id order.
+    The axes only hold the indicators and stages that occur, in enum order, so a catalog that
+    declares a dozen stages does not carry seventeen. 50000 products x 20 indicators x 10 stages
+    take about 80 MB for the values and 10 MB for the mask.
+    Matrices are immutable, evaluate and take return new ones.
+    """
+    __slots__ = ("ids", "indicators", "stages", "values", "mask")
+
+    def __init__(self, ids: np.ndarray, indicators: Sequence[str], stages: Sequence[str], values: np.ndarray, mask: np.ndarray):
+        shape = (len(ids), len(indicators), len(stages))
+        if values.shape != shape or mask.shape != shape:
+            raise ValueError(f"expected {shape} arrays, got {values.shape} and {mask.shape}")
+        for array in (ids, values, mask):
+            array.setflags(write=False)
+        self.ids = ids
+        self.indicators = tuple(indicators)
+        self.stages = tuple(stages)
+        self.values = values
+        self.mask = mask
+
+    @classmethod
+    def from_rows(cls, ids: Iterable[int], rows: Sequence[Tuple[int, str, str, Optional[float]]]) -> "ImpactMatrix":
+        """
+        From product_impacts rows (product id, indicator, stage, value). Every id gets a row, also
+        without impacts; rows of other products, unknown indicators or stages and values that are
+        not finite are left out.
+        """
+        ids = np.unique(np.fromiter(ids, dtype=np.int64))
+        product_ids, indicators, stages, values = zip(*rows) if rows else ((), (), (), ())
+        indicator_axis = _axis(set(indicators), INDICATORS)
+        stage_axis = _axis(set(stages), STAGES)
+        indicator_index = {name: index for index, name in enumerate(indicator_axis)}
+        stage_index = {name: index for index, name in enumerate(stage_axis)}
+
+        count = len(product_ids)
+        product_ids = np.fromiter(product_ids, dtype=np.int64, count=count)
+        rows_of = np.minimum(np.searchsorted(ids, product_ids), max(len(ids) - 1, 0))
+        columns = np.fromiter((indicator_index.get(name, -1) for name in indicators), dtype=np.intp, count=count)
+        depths = np.fromiter((stage_index.get(name, -1) for name in stages), dtype=np.intp, count=count)
+        values = np.array(values, dtype=np.float64)    # None becomes nan
+        keep = (columns >= 0) & (depths >= 0) & np.isfinite(values)
+        if len(ids):
+            keep &= ids[rows_of] == product_ids
+        else:
+            keep[:] = False
+
+        shape = (len(ids), len(indicator_axis), len(stage_axis))
+        grid = np.zeros(shape)
+        mask = np.zeros(shape, dtype=bool)
+        grid[rows_of[keep], columns[keep], depths[keep]] = values[keep]
+        mask[rows_of[keep], columns[keep], depths[keep]] = True
+        return cls(ids, indicator_axis, stage_axis, grid, mask)
+
+    @classmethod
+    def from_vectors(cls, ids: Sequence[int], vectors: Sequence[ImpactVector]) -> "ImpactMatrix":
+        """Stacks vectors, e.g. of products that are not stored, on the full axes."""
+        if len(ids) != len(vectors):
+            raise ValueError("one id per vector")
+        ids = np.asarray(ids, dtype=np.int64)
+        order = np.argsort(ids, kind="stable")
+        values = np.array([vector.values for vector in vectors]).reshape(len(ids), len(INDICATORS), len(STAGES))
+        mask = np.array([vector.mask for vector in vectors], dtype=bool).reshape(values.shape)
+        return cls(ids[order], INDICATORS, STAGES, values[order], mask[order])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def positions(self, ids: Sequence[int]) -> Tuple[np.ndarray, List[int]]:
+        """The rows of these ids in the given order, and the ids that have none."""
+        wanted = np.asarray(ids, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.ids, wanted), max(len(self.ids) - 1, 0))
+        found = self.ids[positions] == wanted if len(self.ids) else np.zeros(len(wanted), dtype=bool)
+        return positions[found], wanted[~found].tolist()
+
+    def take(self, ids: Sequence[int]) -> Tuple["ImpactMatrix", List[int]]:
+        """The rows of these ids in the given order, and the ids that have none."""
+        positions, missing = self.positions(ids)
+        return ImpactMatrix(self.ids[positions], self.indicators, self.stages, self.values[positions], self.mask[positions]), missing
+
+    def vector(self, position: int) -> ImpactVector:
+        """One row on the full ImpactVector axes."""
+        values = np.zeros(ImpactVector.shape)
+        mask = np.zeros(ImpactVector.shape, dtype=bool)
+        grid = np.ix_([INDICATOR_INDEX[name] for name in self.indicators], [STAGE_INDEX[name] for name in self.stages])
+        values[grid] = self.values[position]
+        mask[grid] = self.mask[position]
+        return ImpactVector(values, mask)
+
+    def evaluate(
+        self,
+        factors: Optional[np.ndarray] = None,
+        indicators: Optional[Iterable[Any]] = None,
+        stages: Optional[Iterable[Any]] = None
+    ) -> "ImpactMatrix":
+        """
+        Every row multiplied by its factor (quantity x conversion), on the selected indicators and
+        stages only, in one broadcast pass. Rows with a factor that is not finite, a unit that could
+        not be converted, come out as not declared.
+        """
+        indicator_axis = self.indicators if indicators is None else _axis(indicators, self.indicators)
+        stage_axis = self.stages if stages is None else _axis(stages, self.stages)
+        values, mask = self.values, self.mask
+        # np.take along one axis at a time copies runs of memory, a fancy index over all three gathers cell by cell
+        if indicator_axis != self.indicators:
+            columns = [self.indicators.index(name) for name in indicator_axis]
+            values, mask = np.take(values, columns, axis=1), np.take(mask, columns, axis=1)
+        if stage_axis != self.stages:
+            depths = [self.stages.index(name) for name in stage_axis]
+            values, mask = np.take(values, depths, axis=2), np.take(mask, depths, axis=2)
+        if factors is not None:
+            factors = np.asarray(factors, dtype=np.float64)
+            if factors.shape != (len(self),):
+                raise ValueError(f"expected {len(self)} factors, got {factors.shape}")
+            valid = np.isfinite(factors)
+            scale = np.where(valid, factors, 0.0)[:, None, None]
+            # in place where the selection already made a copy
+            values = np.multiply(values, scale, out=values) if values is not self.values else values * scale
+            mask = mask & valid[:, None, None]
+        return ImpactMatrix(self.ids, indicator_axis, stage_axis, values, mask)
+
+    def totals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """N x indicators, the sum over the stages, and where any stage is declared."""
+        # a product with a vector of ones runs through blas, several times faster than sum(axis=2)
+        return self.values @ np.ones(len(self.stages)), self.mask @ np.ones(len(self.stages), dtype=bool)
+
+    def phases(self) -> Tuple[np.ndarray, np.ndarray]:
+        """N x indicators x PHASES, the stages summed per life cycle phase, and where any is declared."""
+        phase_matrix = PHASE_MATRIX[[STAGE_INDEX[name] for name in self.stages]]
+        return self.values @ phase_matrix, self.mask @ phase_matrix.astype(bool)
+
+    def table(self, by: str = "total") -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        The matrix flattened to N x columns, named <indicator>, <indicator>.<phase> or
+        <indicator>.<stage> like the export columns. Columns without any declared value are dropped.
+        """
+        if by == "total":
+            values, mask = self.totals()
+            names = list(self.indicators)
+        elif by == "phase":
+            values, mask = self.phases()
+            names = [f"{indicator}.{phase}" for indicator in self.indicators for phase in PHASES]
+        elif by == "stage":
+            values, mask = self.values, self.mask
+            names = [f"{indicator}.{stage}" for indicator in self.indicators for stage in self.stages]
+        else:
+            raise ValueError(f"by must be one of {', '.join(TABLE_REDUCTIONS)}")
+        values, mask = values.reshape(len(self), len(names)), mask.reshape(len(self), len(names))
+        declared = mask.any(axis=0)
+        return [name for name, keep in zip(names, declared) if keep], values[:, declared], mask[:, declared]
+
+    def __repr__(self) -> str:
+        return f"<ImpactMatrix(products={len(self)}, indicators={len(self.indicators)}, stages={len(self.stages)})>"
@@ -0,0 +1,154 @@
+# app/core/domain/values/impact_vector.py
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from lcax import ImpactCategoryKey, LifeCycleStage
+
+from app.core.domain.enums.life_cycle_phases import LifeCyclePhases
+
+# the fixed axes of the grid, in enum order
+INDICATORS = tuple(key.value for key in ImpactCategoryKey)
+STAGES = tuple(stage.value for stage in LifeCycleStage)
+PHASES = tuple(phase.name.lower() for phase in LifeCyclePhases)
+
+INDICATOR_INDEX: Dict[str, int] = {name: index for index, name in enumerate(INDICATORS)}
+STAGE_INDEX: Dict[str, int] = {name: index for index, name in enumerate(STAGES)}
+
+# stages x phases, 1 where the stage belongs to the phase. a0 is in no phase.
+PHASE_MATRIX = np.zeros((len(STAGES), len(PHASES)))
+for _column, _phase in enumerate(LifeCyclePhases):
+    for _stage in _phase.value:
+        PHASE_MATRIX[STAGE_INDEX[_stage.value], _column] = 1.0
+PHASE_MATRIX.setflags(write=False)
+
+
+def _key(value: Any) -> str:
+    return value.value if hasattr(value, "value") else value
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ImpactVector:
+    """
+    The impacts of an EPD as a fixed indicator x stage float64 grid, with a mask of the values
+    the EPD declares. Missing values are 0.0 in the grid, so sums need no special casing, and the
+    mask keeps "not declared" apart from "declared as 0". Indicators and stages outside
+    ImpactCategoryKey and LifeCycleStage are dropped.
+    Vectors are immutable, every operation returns a new one.
+    """
+    __slots__ = ("values", "mask")
+
+    shape = (len(INDICATORS), len(STAGES))
+
+    def __init__(self, values: np.ndarray, mask: np.ndarray):
+        if values.shape != self.shape or mask.shape != self.shape:
+            raise ValueError(f"impact vectors are {self.shape} grids, got {values.shape} and {mask.shape}")
+        values.setflags(write=False)
+        mask.setflags(write=False)
+        self.values = values
+        self.mask = mask
+
+    @classmethod
+    def zeros(cls) -> "ImpactVector":
+        return cls(np.zeros(cls.shape), np.zeros(cls.shape, dtype=bool))
+
+    @classmethod
+    def from_impacts(cls, impacts: Optional[Mapping[str, Mapping[str, Any]]]) -> "ImpactVector":
+        """From epdx impacts, indicator -> stage -> value. Values that are not finite numbers are missing."""
+        values = np.zeros(cls.shape)
+        mask = np.zeros(cls.shape, dtype=bool)
+        for indicator, stages in (impacts or {}).items():
+            row = INDICATOR_INDEX.get(_key(indicator))
+            if row is None or not isinstance(stages, Mapping):
+                continue
+            for stage, value in stages.items():
+                column = STAGE_INDEX.get(_key(stage))
+                if column is not None and _is_number(value) and np.isfinite(value):
+                    values[row, column] = value
+                    mask[row, column] = True
+        return cls(values, mask)
+
+    @classmethod
+    def from_epd(cls, epd: Any) -> "ImpactVector":
+        """From anything with epdx impacts, an EPD dto or an lcax EPD."""
+        return cls.from_impacts(epd.impacts)
+
+    @classmethod
+    def sum(cls, vectors: Iterable["ImpactVector"]) -> "ImpactVector":
+        """Sum of many vectors, a value is declared where any of them declares it."""
+        vectors = list(vectors)
+        if not vectors:
+            return cls.zeros()
+        return cls(np.sum([vector.values for vector in vectors], axis=0), np.any([vector.mask for vector in vectors], axis=0))
+
+    def __add__(self, other: "ImpactVector") -> "ImpactVector":
+        return ImpactVector(self.values + other.values, self.mask | other.mask)
+
+    def scale(self, factor: float) -> "ImpactVector":
+        return ImpactVector(self.values * factor, self.mask.copy())
+
+    __mul__ = scale
+    __rmul__ = scale
+
+    @staticmethod
+    def _axis_mask(names: Optional[Iterable[Any]], index: Dict[str, int], size: int) -> np.ndarray:
+        if names is None:
+            return np.ones(size, dtype=bool)
+        selected = np.zeros(size, dtype=bool)
+        selected[[index[_key(name)] for name in names if _key(name) in index]] = True
+        return selected
+
+    def select(self, indicators: Optional[Iterable[Any]] = None, stages: Optional[Iterable[Any]] = None) -> "ImpactVector":
+        """Only these indicators and stages, everything else becomes missing. None keeps an axis whole."""
+        keep = np.outer(
+            self._axis_mask(indicators, INDICATOR_INDEX, len(INDICATORS)),
+            self._axis_mask(stages, STAGE_INDEX, len(STAGES)),
+        )
+        return ImpactVector(np.where(keep, self.values, 0.0), self.mask & keep)
+
+    def mask_stages(self, stages: Iterable[Any]) -> "ImpactVector":
+        return self.select(stages=stages)
+
+    def totals(self) -> np.ndarray:
+        """The sum over all stages per indicator."""
+        return self.values.sum(axis=1)
+
+    def total(self, indicator: Any) -> Optional[float]:
+        """The sum over the stages of one indicator, None if it declares none."""
+        row = INDICATOR_INDEX.get(_key(indicator))
+        if row is None or not self.mask[row].any():
+            return None
+        return float(self.values[row].sum())
+
+    def phase_values(self) -> np.ndarray:
+        """indicators x PHASES, the stages summed per life cycle phase."""
+        return self.values @ PHASE_MATRIX
+
+    def phase_mask(self) -> np.ndarray:
+        return (self.mask @ PHASE_MATRIX) > 0
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """The declared values as epdx impacts, indicator -> stage -> value."""
+        return self._nested(self.values, self.mask, STAGES)
+
+    def phases_to_dict(self) -> Dict[str, Dict[str, float]]:
+        """indicator -> phase -> value, for the phases with a declared stage."""
+        return self._nested(self.phase_values(), self.phase_mask(), PHASES)
+
+    @staticmethod
+    def _nested(values: np.ndarray, mask: np.ndarray, columns: Sequence[str]) -> Dict[str, Dict[str, float]]:
+        nested: Dict[str, Dict[str, float]] = {}
+        for row, column in zip(*np.nonzero(mask)):
+            nested.setdefault(INDICATORS[row], {})[columns[column]] = float(values[row, column])
+        return nested
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ImpactVector) and np.array_equal(self.mask, other.mask) and np.array_equal(self.values, other.values)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<ImpactVector(declared={int(self.mask.sum())}, indicators={sorted(self.to_dict())})>"
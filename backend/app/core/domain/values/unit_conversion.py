@@ -0,0 +1,200 @@
+# app/core/domain/values/unit_conversion.py
+import math
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.application.dtos.epdx.epdx_dto import Conversion, ConversionConfig, ConversionUnit, Unit
+
+# conversions that hold for every product: one of the first unit is factor of the second
+FIXED_EDGES: Tuple[Tuple[str, str, float], ...] = (
+    (Unit.tones.value, Unit.kg.value, 1000.0),
+    (Unit.km.value, Unit.m.value, 1000.0),
+    (Unit.l.value, Unit.m3.value, 0.001),
+)
+
+# the unit one value of a ConversionUnit is given per, kg/m^3 is the weight of one m3
+_PER_UNIT = {
+    ConversionUnit.KG_PER_M3: Unit.m3,
+    ConversionUnit.KG_PER_M2: Unit.m2,
+    ConversionUnit.KG_PER_M: Unit.m,
+    ConversionUnit.KG: Unit.pcs,
+    ConversionUnit.M: Unit.m2,
+}
+
+
+def _edge_units(config: Mapping[str, Any]) -> Tuple[str, str]:
+    # a layer thickness in m turns one m2 of the layer into thickness m3, not into m as its "to" says
+    to = Unit.m3 if config["unit"] == ConversionUnit.M else config["to"]
+    return _PER_UNIT[config["unit"]].value, to.value
+
+
+# product specific conversions by ConversionType name: one of the first unit is value of the second
+PARAMETER_EDGES: Dict[str, Tuple[str, str]] = {
+    conversion_type.value: _edge_units(config) for conversion_type, config in ConversionConfig.MAPPINGS.items()
+}
+# the first ConversionType of each ConversionUnit, for conversions that only name their unit
+_PARAMETER_OF_UNIT: Dict[str, str] = {}
+for _type, _config in ConversionConfig.MAPPINGS.items():
+    _PARAMETER_OF_UNIT.setdefault(_config["unit"].value, _type.value)
+
+# compiled paths kept per (source, target, available parameters), a catalog has few distinct ones
+PATH_CACHE_SIZE = 4096
+
+
+class UnitConversionError(ValueError):
+    """There is no conversion between two units with the conversions a product declares."""
+
+
+def _unit(unit: Any) -> Optional[str]:
+    return unit.value if hasattr(unit, "value") else unit
+
+
+def parameter_edge(name: str) -> Optional[Tuple[str, str]]:
+    """The units a parameter converts between, ConversionType names or <from>-><to> of generic conversions."""
+    if name in PARAMETER_EDGES:
+        return PARAMETER_EDGES[name]
+    source, separator, target = name.partition("->")
+    return (source, target) if separator and source and target else None
+
+
+def conversion_parameters(declared_unit: Any, conversions: Optional[Iterable[Conversion]]) -> Dict[str, float]:
+    """
+    The conversion parameters of an EPD by name. Conversions are known by their ConversionType
+    name, else by their unit; one with neither converts one declared unit into value of its "to".
+    Values that are not finite and positive cannot convert anything and are left out.
+    """
+    parameters: Dict[str, float] = {}
+    for conversion in conversions or []:
+        value = conversion.value
+        if not isinstance(value, (int, float)) or not math.isfinite(value) or value <= 0:
+            continue
+        meta_data = conversion.meta_data
+        name = None
+        if meta_data is not None:
+            name = meta_data.name if meta_data.name in PARAMETER_EDGES else _PARAMETER_OF_UNIT.get(meta_data.unit)
+        if name is None and _unit(declared_unit):
+            name = f"{_unit(declared_unit)}->{_unit(conversion.to)}"
+        if name is not None:
+            parameters.setdefault(name, float(value))
+    return parameters
+
+
+@dataclass(frozen=True)
+class ConversionPath:
+    """How many target units one source unit is: constant x the product of parameter ** exponent."""
+    source: str
+    target: str
+    constant: float
+    exponents: Tuple[Tuple[str, int], ...]
+    units: Tuple[str, ...]    # the units passed through, source to target
+
+    def factor(self, parameters: Mapping[str, float]) -> float:
+        factor = self.constant
+        for name, exponent in self.exponents:
+            factor *= parameters[name] if exponent > 0 else 1.0 / parameters[name]
+        return factor
+
+    def factors(self, columns: Mapping[str, np.ndarray], rows: np.ndarray) -> np.ndarray:
+        """The factor of many products at once, columns holds a value per product of every parameter."""
+        factors = np.full(len(rows), self.constant)
+        for name, exponent in self.exponents:
+            values = columns[name][rows]
+            factors = factors * values if exponent > 0 else factors / values
+        return factors
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(source: str, target: str, parameters: FrozenSet[str] = frozenset()) -> ConversionPath:
+    """
+    The conversion with the fewest steps from source to target over the fixed conversions and the
+    available parameters, each usable in both directions. Raises UnitConversionError if there is none.
+    """
+    if source == target:
+        return ConversionPath(source, target, 1.0, (), (source,))
+    adjacency: Dict[str, List[Tuple[str, float, Optional[Tuple[str, int]]]]] = {}
+    for start, end, value in FIXED_EDGES:
+        adjacency.setdefault(start, []).append((end, value, None))
+        adjacency.setdefault(end, []).append((start, 1.0 / value, None))
+    # in MAPPINGS order, so of two parameters with the same units the first one is used
+    ordered = [name for name in PARAMETER_EDGES if name in parameters] + sorted(parameters - PARAMETER_EDGES.keys())
+    for name in ordered:
+        edge = parameter_edge(name)
+        if edge is not None:
+            adjacency.setdefault(edge[0], []).append((edge[1], 1.0, (name, 1)))
+            adjacency.setdefault(edge[1], []).append((edge[0], 1.0, (name, -1)))
+
+    previous: Dict[str, Tuple[str, float, Optional[Tuple[str, int]]]] = {source: None}
+    queue = deque([source])
+    while queue and target not in previous:
+        unit = queue.popleft()
+        for neighbour, constant, parameter in adjacency.get(unit, []):
+            if neighbour not in previous:
+                previous[neighbour] = (unit, constant, parameter)
+                queue.append(neighbour)
+    if target not in previous:
+        available = ", ".join(sorted(parameters)) or "none"
+        raise UnitConversionError(f"no conversion from {source} to {target}, available conversions: {available}")
+
+    constant, exponents, units = 1.0, [], [target]
+    unit = target
+    while previous[unit] is not None:
+        unit, step, parameter = previous[unit]
+        constant *= step
+        if parameter is not None:
+            exponents.append(parameter)
+        units.append(unit)
+    return ConversionPath(source, target, constant, tuple(reversed(exponents)), tuple(reversed(units)))
+
+
+def conversion_factor(source: Any, target: Any, parameters: Optional[Mapping[str, float]] = None) -> float:
+    """How many target units one source unit is, with these conversion parameters of a product."""
+    source, target = _unit(source), _unit(target)
+    if not source or not target:
+        raise UnitConversionError(f"cannot convert from {source} to {target} without both units")
+    parameters = parameters or {}
+    return compile_path(source, target, frozenset(parameters)).factor(parameters)
+
+
+def impact_factor(declared_unit: Any, target_unit: Any, parameters: Optional[Mapping[str, float]] = None) -> float:
+    """
+    The factor that turns an impact per declared unit into the impact per target unit, the
+    inverse of converting the amount: an impact per m3 is divided by the kg one m3 weighs.
+    """
+    return conversion_factor(target_unit, declared_unit, parameters)
+
+
+def conversion_factors(
+    sources: Sequence[Any],
+    targets: Sequence[Any],
+    columns: Mapping[str, np.ndarray]
+) -> Tuple[np.ndarray, Dict[int, str]]:
+    """
+    conversion_factor of many products as one vector. columns holds a value per product of each
+    parameter, nan where a product has none. Products are grouped by their units and available
+    parameters, so a path is compiled once per group and evaluated column-wise. Rows that cannot
+    be converted are nan, with the reason by row index.
+    """
+    count = len(sources)
+    factors = np.full(count, np.nan)
+    errors: Dict[int, str] = {}
+    names = list(columns)
+    available = np.array([np.isfinite(columns[name]) & (columns[name] > 0) for name in names], dtype=bool).reshape(len(names), count)
+    groups: Dict[Tuple[Optional[str], Optional[str], Tuple[bool, ...]], List[int]] = {}
+    for row, (source, target, flags) in enumerate(zip(sources, targets, available.T.tolist())):
+        groups.setdefault((_unit(source), _unit(target), tuple(flags)), []).append(row)
+
+    for (source, target, flags), rows in groups.items():
+        rows = np.asarray(rows, dtype=np.intp)
+        try:
+            if not source or not target:
+                raise UnitConversionError(f"cannot convert from {source} to {target} without both units")
+            path = compile_path(source, target, frozenset(name for name, flag in zip(names, flags) if flag))
+        except UnitConversionError as e:
+            errors.update((int(row), str(e)) for row in rows)
+            continue
+        factors[rows] = path.factors(columns, rows)
+    return factors, errors
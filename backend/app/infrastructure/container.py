@@ -2,6 +2,12 @@
 from app.config import Config
 from app.infrastructure.infrastructure.services.authentication_service import AuthenticationService
 from app.infrastructure.infrastructure.services.epdx_service import EpdxService
+from app.infrastructure.infrastructure.services.fetch_pool_service import FetchPoolService
+from app.infrastructure.infrastructure.services.harvest_checkpoint_service import HarvestCheckpointService
+from app.infrastructure.infrastructure.services.harvest_pipeline_service import HarvestPipelineService
+from app.infrastructure.infrastructure.services.http_client_service import HttpClientService
+from app.infrastructure.infrastructure.services.epd_cache_service import EpdCacheService
+from app.infrastructure.infrastructure.services.ilcd_cache_service import IlcdCacheService
 from app.infrastructure.infrastructure.services.jwt_service import JWTService
 from app.infrastructure.infrastructure.services.okobau_service import OkobauService
 from app.infrastructure.infrastructure.services.password_service import PasswordService
@@ -29,7 +35,10 @@ from app.infrastructure.persistence.repositories.user_roles.user_roles_read_repo
 from app.infrastructure.persistence.repositories.user_roles.user_roles_write_repository import UserRolesWriteRepository
 from app.infrastructure.persistence.services.category_association_service import CategoryAssociationService
 from app.infrastructure.persistence.services.category_service import CategoryService
+from app.infrastructure.persistence.services.okobau_sync_service import OkobauSyncService
 from app.infrastructure.persistence.services.product_service import ProductService
+from app.infrastructure.persistence.services.product_impact_service import ProductImpactService
+from app.infrastructure.persistence.services.product_snapshot_service import ProductSnapshotService
 from app.infrastructure.persistence.services.role_service import RoleService
 from app.infrastructure.persistence.services.user_roles_service import UserRolesService
 from app.infrastructure.persistence.services.user_service import UserService
@@ -66,6 +75,7 @@ class Container(containers.DeclarativeContainer):
             "app.presentation.controllers.filter_element_controller",
             "app.presentation.controllers.filter_mapping_controller",
             "app.cli.seed",
+            "app.cli.export",
         ]
     )
     config = providers.Singleton(Config)
@@ -98,13 +108,39 @@ class Container(containers.DeclarativeContainer):
     # ---------------------INFRASTRUCTURE SERVICES-------------------
     permission_service = providers.Singleton(PermissionService)
     password_service = providers.Singleton(PasswordService)
+    http_client_service = providers.Singleton(
+        HttpClientService,
+        pool_size=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.POOL_SIZE,
+        max_per_host=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.MAX_PER_HOST,
+        rate_limit=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.RATE_LIMIT,
+        burst=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.BURST,
+        retries=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.RETRIES,
+        backoff=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.BACKOFF,
+        timeout=Config.EXTERNAL_RESOURCES.HTTP_CLIENT.TIMEOUT,
+    )
+    ilcd_cache_service = providers.Singleton(
+        IlcdCacheService,
+        directory=Config.EXTERNAL_RESOURCES.OKOBAU.CACHE_DIR,
+        datastock=Config.EXTERNAL_RESOURCES.OKOBAU.DATASTOCK_ID,
+        max_bytes=Config.EXTERNAL_RESOURCES.OKOBAU.CACHE_MAX_BYTES,
+        latest_ttl=Config.EXTERNAL_RESOURCES.OKOBAU.CACHE_LATEST_TTL,
+    )
+    okobau_fetch_pool_service = providers.Singleton(
+        FetchPoolService,
+        workers=Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_WORKERS,
+        retries=Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_RETRIES,
+        backoff=Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_BACKOFF,
+        ordered=Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_ORDERED,
+    )
 
     # ------------------------MAPPERS--------------------------------
     role_mapper = providers.Singleton(RoleMapper)
     user_mapper = providers.Singleton(UserMapper, password_service=password_service)
     user_roles_mapper = providers.Singleton(UserRolesMapper)
     epdx_mapper = providers.Singleton(EpdxMapper)
-    okobau_mapper = providers.Singleton(OkobauMapper)
+    okobau_mapper = providers.Singleton(
+        OkobauMapper, http_client_service=http_client_service, ilcd_cache_service=ilcd_cache_service
+    )
     product_mapper = providers.Singleton(ProductMapper)
 
     category_mapper = providers.Singleton(CategoryMapper)
@@ -116,13 +152,60 @@ class Container(containers.DeclarativeContainer):
 
     # ------------------------PERSISTENCE SERVICES------------------------
     epdx_service = providers.Singleton(EpdxService, mapper=epdx_mapper)
-    okobau_service = providers.Singleton(OkobauService, mapper=okobau_mapper)
+    okobau_service = providers.Singleton(
+        OkobauService,
+        mapper=okobau_mapper,
+        fetch_pool_service=okobau_fetch_pool_service,
+        http_client_service=http_client_service,
+        ilcd_cache_service=ilcd_cache_service,
+    )
+    epd_cache_service = providers.Singleton(EpdCacheService, max_entries=Config.DATABASE_CONFIG.EPD_CACHE_SIZE)
     product_service = providers.Singleton(
         ProductService,
         product_read_repository=product_read_repository,
         product_write_repository=product_write_repository,
         product_mapper=product_mapper,
         epdx_service=epdx_service,
+        bulk_batch_size=Config.DATABASE_CONFIG.BULK_BATCH_SIZE,
+        epd_cache_service=epd_cache_service,
+        stream_batch_size=Config.DATABASE_CONFIG.STREAM_BATCH_SIZE,
+    )
+    product_impact_service = providers.Singleton(
+        ProductImpactService,
+        product_read_repository=product_read_repository,
+        cache_catalog=Config.DATABASE_CONFIG.IMPACT_MATRIX_CACHE,
+        batch_size=Config.DATABASE_CONFIG.STREAM_BATCH_SIZE,
+    )
+    product_snapshot_service = providers.Singleton(
+        ProductSnapshotService,
+        product_read_repository=product_read_repository,
+        product_write_repository=product_write_repository,
+        product_mapper=product_mapper,
+        row_group_size=Config.DATABASE_CONFIG.SNAPSHOT_ROW_GROUP_SIZE,
+        bulk_batch_size=Config.DATABASE_CONFIG.BULK_BATCH_SIZE,
+        stream_batch_size=Config.DATABASE_CONFIG.STREAM_BATCH_SIZE,
+    )
+
+    okobau_sync_service = providers.Singleton(
+        OkobauSyncService,
+        okobau_service=okobau_service,
+        epdx_service=epdx_service,
+        product_service=product_service,
+    )
+
+    harvest_checkpoint_service = providers.Singleton(
+        HarvestCheckpointService, path=Config.EXTERNAL_RESOURCES.OKOBAU.CHECKPOINT_FILE
+    )
+    harvest_pipeline_service = providers.Singleton(
+        HarvestPipelineService,
+        okobau_service=okobau_service,
+        okobau_mapper=okobau_mapper,
+        fetch_pool_service=okobau_fetch_pool_service,
+        product_service=product_service,
+        checkpoint_service=harvest_checkpoint_service,
+        convert_workers=Config.EXTERNAL_RESOURCES.OKOBAU.CONVERT_WORKERS,
+        queue_size=Config.EXTERNAL_RESOURCES.OKOBAU.PIPELINE_QUEUE_SIZE,
+        batch_size=Config.EXTERNAL_RESOURCES.OKOBAU.WRITE_BATCH_SIZE,
     )
 
     buildup_mapper = providers.Singleton(BuildupMapper, product_service = product_service)     # should restructure this a bit, so that things are grouped consistently.
@@ -131,8 +214,8 @@ class Container(containers.DeclarativeContainer):
         buildup_read_repository=buildup_read_repository,
         buildup_write_repository=buildup_write_repository,
         buildup_mapper=buildup_mapper,
-        product_service = product_service
-        
+        product_service = product_service,
+        materialise_results=Config.DATABASE_CONFIG.BUILDUP_RESULTS_CACHE,
     )
 
     category_service = providers.Singleton(
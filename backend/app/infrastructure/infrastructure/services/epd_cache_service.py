@@ -0,0 +1,103 @@
+# app/infrastructure/infrastructure/services/epd_cache_service.py
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.core.application.dtos.epdx.epdx_dto import EPD
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.core.application.services.iepd_cache_service import IEpdCacheService
+from app.core.domain.values.impact_vector import ImpactVector
+
+
+class EpdCacheService(IEpdCacheService):
+    """In-memory LRU cache of validated EPD objects of stored products, and of their impact vectors.
+
+    Entries are keyed by (product id, updated_at, epd_version), so a product that changed in the
+    database, also through another process, gets a new key and the old entry is dropped. Products
+    without an id are not stored and are parsed on every call: hashing their content costs more
+    than validating it. A `max_entries` of 0 disables the cache.
+    The cached EPDs are shared, callers must not modify them. The impact vector of an entry is
+    built on its first use and lives as long as the entry.
+    """
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Hashable, ...], List]" = OrderedDict()    # key : [EPD, ImpactVector or None]
+        self._keys: Dict[int, Tuple[Hashable, ...]] = {}   # product id : its current key
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    @staticmethod
+    def _key(product_dto: Product_DTO) -> Optional[Tuple[Hashable, ...]]:
+        if product_dto.id is None:
+            return None
+        return product_dto.id, product_dto.updated_at, product_dto.epd_version
+
+    def _entry(self, product_dto: Product_DTO) -> Optional[List]:
+        key = self._key(product_dto) if self.enabled else None
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["misses"] += 1
+
+        # validated outside the lock, two threads may both parse the same product once
+        entry = [EPD.model_validate(product_dto.epdx), None]
+        with self._lock:
+            stale = self._keys.get(product_dto.id)
+            if stale is not None and stale != key and self._entries.pop(stale, None) is not None:
+                self._stats["invalidations"] += 1
+            self._entries[key] = entry
+            self._keys[product_dto.id] = key
+            while len(self._entries) > self._max_entries:
+                (evicted_id, *_), _ = self._entries.popitem(last=False)
+                self._keys.pop(evicted_id, None)
+                self._stats["evictions"] += 1
+        return entry
+
+    def get_epd(self, product_dto: Product_DTO) -> EPD:
+        entry = self._entry(product_dto)
+        return EPD.model_validate(product_dto.epdx) if entry is None else entry[0]
+
+    def get_impact_vector(self, product_dto: Product_DTO) -> ImpactVector:
+        return self.get_epd_and_impact_vector(product_dto)[1]
+
+    def get_epd_and_impact_vector(self, product_dto: Product_DTO) -> Tuple[EPD, ImpactVector]:
+        """The EPD and its impact vector with one lookup, for callers that need both."""
+        entry = self._entry(product_dto)
+        if entry is None:
+            epd = EPD.model_validate(product_dto.epdx)
+            return epd, ImpactVector.from_epd(epd)
+        if entry[1] is None:
+            # vectors are immutable, building one twice in two threads does no harm
+            entry[1] = ImpactVector.from_epd(entry[0])
+        return entry[0], entry[1]
+
+    def invalidate(self, product_id: int) -> None:
+        with self._lock:
+            key = self._keys.pop(product_id, None)
+            if key is not None and self._entries.pop(key, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+            }
@@ -2,12 +2,14 @@
 import time
 from typing import List, Union
 
-from app.core.application.dtos.epdx.epdx_dto import EPD, Conversion, ConversionUnit, ImpactCategoryKey, LifeCycleStage, Unit
+from app.core.application.dtos.epdx.epdx_dto import EPD, Conversion, ImpactCategoryKey, LifeCycleStage
 from app.core.application.dtos.product.product_dto import (Product_DTO,
                                                            ProductDensity_DTO, ProductEPD_DTO,
                                                            ProductHeader_DTO)
 from app.core.application.mappers.iepdx_mapper import IEpdxMapper
 from app.core.application.services.iepdx_service import IEpdxService
+from app.core.domain.values.impact_vector import ImpactVector
+from app.core.domain.values.unit_conversion import conversion_parameters, impact_factor
 
 
 class EpdxService(IEpdxService):
@@ -28,32 +30,31 @@ class EpdxService(IEpdxService):
     life_cycle_stages : List[LifeCycleStage] = None,
     conversion : Conversion = None,
     conversion_factor : float = 1,    #give the option to just provide a factor, if available. 
-    normalize_to : float = 1   # the buildup or model will pass this along. 
+    normalize_to : float = 1,   # the buildup or model will pass this along. 
+    impact_vector : ImpactVector = None   # the impacts of product_epd, built from it if not given
      ) -> float:
 
-        if not hasattr(product_epd.impacts, impact.value):
+        if impact_vector is None:
+            impact_vector = ImpactVector.from_epd(product_epd)
+        if impact_vector.total(impact) is None:
             print(f"epd has no impact {impact}")
             return None
 
-        result = 0
-        impact_indicator = product_epd.impacts[impact.value]
-
-        # If specific life cycle stages are provided, filter the impacts
+        # If specific life cycle stages are provided, sum only those
         if life_cycle_stages:
-            filtered_impacts = {stage: impact_indicator.get(stage, {}) for stage in life_cycle_stages}
-        else:
-            filtered_impacts = impact_indicator
-        
-        impact_value = sum(value for key, value in filtered_impacts)
+            impact_vector = impact_vector.mask_stages(life_cycle_stages)
 
+        impact_value = impact_vector.total(impact)
         if impact_value is None:
-            return result
+            return 0
 
-        # Apply conversion if needed
+        # Apply conversion if needed: the impact per declared unit becomes the impact per conversion.to,
+        # over as many of the epd's conversions as it takes, and conversion itself if it names one.
+        # Raises UnitConversionError if there is no way.
         if conversion:
-            # Assuming a conversion method exists to convert the value
-            declared_unit = product_epd.declared_unit
-            impact_value = self._convert_impact_value(impact_value, declared_unit, conversion)
+            conversions = [*(product_epd.conversions or []), *([conversion] if conversion.meta_data else [])]
+            parameters = conversion_parameters(product_epd.declared_unit, conversions)
+            impact_value = impact_value * impact_factor(product_epd.declared_unit, conversion.to, parameters)
         
         # Apply conversion factor:
         impact_value = impact_value * conversion_factor
@@ -64,70 +65,6 @@ class EpdxService(IEpdxService):
 
         return result
 
-    def _convert_impact_value(self, value: float, declared_unit : Unit, conversion: Conversion) -> float:
-        """
-        Convert a value from one unit to another based on the conversion configuration.
-    
-        Args:
-            value: The value to convert
-            declared_unit: The original unit of the value
-            convert_to: The conversion configuration containing target unit and metadata
-    
-         Returns:
-             float: The converted value
-         """
-        if value == 0 or conversion.value == 0:
-            return 0.0
-        try:
-            # If units are the same, no conversion needed
-            if declared_unit == conversion.to and conversion.value == 1:
-                return value
-
-            # Handle specific unit conversions
-            if declared_unit == Unit.tones and conversion.to == Unit.kg:
-                value = value * 1000  # 1 tonne = 1000 kg
-
-            elif declared_unit == Unit.km and conversion.to == Unit.m:
-                value = value * 1000
-
-            elif conversion.meta_data:
-                if conversion.meta_data.unit == ConversionUnit.KG_PER_M3.value:
-                    if declared_unit == Unit.kg and conversion.to == Unit.m3:
-                        return value / float(conversion.value)
-                    if declared_unit == Unit.m3 and conversion.to == Unit.kg:
-                        return value * float(conversion.value)
-
-                elif conversion.meta_data.unit == ConversionUnit.KG_PER_M2.value:
-                    if declared_unit == Unit.kg and conversion.to == Unit.m2:
-                        return value / float(conversion.value)
-                    if declared_unit == Unit.m2 and conversion.to == Unit.kg:
-                        return value * float(conversion.value)
-
-                elif conversion.meta_data.unit == ConversionUnit.KG_PER_M.value:
-                    if declared_unit == Unit.kg and conversion.to == Unit.m:
-                        return value / float(conversion.value)
-                    if declared_unit == Unit.m and conversion.to == Unit.kg:
-                        return value * float(conversion.value)
-                
-                elif conversion.meta_data.unit == ConversionUnit.M.value:
-                    if declared_unit == Unit.m2 and conversion.to == Unit.m:
-                        return value / float(conversion.value)
-                    if declared_unit == Unit.m and conversion.to == Unit.m2:
-                        return value * float(conversion.value)
-
-                elif conversion.meta_data.unit == ConversionUnit.KG.value:
-                    if declared_unit == Unit.pcs and conversion.to == Unit.kg:
-                        return value / float(conversion.value)
-                    if declared_unit == Unit.kg and conversion.to == Unit.pcs:
-                        return value * float(conversion.value)
-            else:
-                raise ValueError(f"Unsupported conversion from {declared_unit} to {conversion.to}")
-
-        except Exception as e:
-            raise ValueError(f"Error converting from {declared_unit} to {conversion.to}: {str(e)}")
-
-
-
     # epdx to product
     def from_epdx_to_product(self, epdx: EPD) -> Product_DTO:
         return self._mapper.to_product_epd(epdx)
@@ -0,0 +1,106 @@
+# app/infrastructure/infrastructure/services/fetch_pool_service.py
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Type
+
+import requests
+from app.core.application.dtos.fetch.fetch_result_dto import FetchResult_DTO
+from app.core.application.services.ifetch_pool_service import IFetchPoolService
+
+
+class FetchPoolService(IFetchPoolService):
+    """Runs blocking jobs (usually http downloads) on a bounded thread pool.
+
+    Items are pulled lazily from the input iterable, so at most 2 * workers jobs are
+    in flight or waiting to be yielded at any time. Failed jobs are retried with
+    exponential backoff when they raise one of the `retry_on` exceptions.
+    """
+    def __init__(
+        self,
+        workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        ordered: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (requests.RequestException,)
+    ):
+        self._workers = max(1, workers)
+        self._retries = max(0, retries)
+        self._backoff = backoff
+        self._ordered = ordered
+        self._retry_on = retry_on
+
+    def _is_retryable(self, error: BaseException) -> bool:
+        if not isinstance(error, self._retry_on):
+            return False
+        # client errors will not go away by asking again, except for rate limiting
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status >= 500 or status == 429
+        return True
+
+    def _call(self, fn: Callable[[Any], Any], item: Any) -> Tuple[Any, int]:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn(item), attempt
+            except Exception as e:
+                if attempt > self._retries or not self._is_retryable(e):
+                    e.attempts = attempt
+                    raise
+                time.sleep(self._backoff * 2 ** (attempt - 1))
+
+    def call_with_retry(self, fn: Callable[[Any], Any], item: Any) -> Any:
+        value, _ = self._call(fn, item)
+        return value
+
+    def _result(self, index: int, item: Any, future: Future) -> FetchResult_DTO:
+        try:
+            value, attempts = future.result()
+            return FetchResult_DTO(index=index, item=item, value=value, attempts=attempts)
+        except Exception as e:
+            return FetchResult_DTO(
+                index=index, item=item, error=str(e), error_type=type(e).__name__,
+                attempts=getattr(e, "attempts", 1)
+            )
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any], ordered: Optional[bool] = None) -> Iterator[FetchResult_DTO]:
+        """Yield a FetchResult_DTO per item, in input order if `ordered`, else as jobs complete."""
+        ordered = self._ordered if ordered is None else ordered
+        window = self._workers * 2
+        source = enumerate(items)
+        pending: Dict[Future, Tuple[int, Any]] = {}
+        finished: Dict[int, FetchResult_DTO] = {}   # completed out of order, waiting for their turn
+        next_index = 0
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            try:
+                while True:
+                    while not exhausted and len(pending) + len(finished) < window:
+                        try:
+                            index, item = next(source)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        pending[executor.submit(self._call, fn, item)] = (index, item)
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, item = pending.pop(future)
+                        result = self._result(index, item, future)
+                        if not ordered:
+                            yield result
+                        else:
+                            finished[index] = result
+
+                    while next_index in finished:
+                        yield finished.pop(next_index)
+                        next_index += 1
+            finally:
+                # the consumer stopped early: drop whatever has not started yet
+                for future in pending:
+                    future.cancel()
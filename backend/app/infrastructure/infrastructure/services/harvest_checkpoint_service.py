@@ -0,0 +1,84 @@
+# app/infrastructure/infrastructure/services/harvest_checkpoint_service.py
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.application.services.iharvest_checkpoint_service import IHarvestCheckpointService
+
+DONE = "done"
+FAILED = "failed"
+
+
+class HarvestCheckpointService(IHarvestCheckpointService):
+    """Append only JSON-lines log of the uuids a harvest has written or given up on.
+
+    Every line is one record, the last record of an uuid wins. Records are flushed and
+    fsynced as they are written, so a crashed run loses at most the line being written,
+    and a truncated last line is ignored on load.
+    """
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def for_namespace(self, namespace: str) -> "HarvestCheckpointService":
+        """A separate checkpoint next to this one, <name>.<namespace>.jsonl, for runs that must not share progress."""
+        return HarvestCheckpointService(self._path.with_name(f"{self._path.stem}.{namespace}{self._path.suffix}"))
+
+    def _append(self, records: List[Dict]) -> None:
+        if not records:
+            return
+        with self._lock:
+            if self._file is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._path, "a", encoding="utf-8")
+            self._file.write("".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def load(self) -> Dict[str, Dict]:
+        """Return the latest record per uuid."""
+        records: Dict[str, Dict] = {}
+        if not self._path.exists():
+            return records
+        with open(self._path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue   # torn write of a crashed run
+                records[record["uuid"]] = record
+        return records
+
+    def get_processed(self) -> Set[str]:
+        return set(self.load())
+
+    def get_failed(self) -> Dict[str, str]:
+        """uuid : error class of every uuid whose latest record is a failure."""
+        return {uuid: record.get("error_type") for uuid, record in self.load().items() if record["status"] == FAILED}
+
+    def record_done(self, items: List[Tuple[str, Optional[str]]]) -> None:
+        now = time.time()
+        self._append([{"uuid": uuid, "version": version, "status": DONE, "at": now} for uuid, version in items])
+
+    def record_failed(self, uuid: str, version: Optional[str], error_type: str, error: str) -> None:
+        self._append([{
+            "uuid": uuid, "version": version, "status": FAILED,
+            "error_type": error_type, "error": error, "at": time.time(),
+        }])
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
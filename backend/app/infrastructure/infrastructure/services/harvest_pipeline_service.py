@@ -0,0 +1,455 @@
+# app/infrastructure/infrastructure/services/harvest_pipeline_service.py
+import copy
+import hashlib
+import json
+import multiprocessing
+import queue
+import re
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.config import Config
+from app.core.application.dtos.epdx.epdx_dto import EPD
+from app.core.application.dtos.okobau.okobau_dto import EPDResponse, HarvestReport_DTO
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.core.application.mappers.iexternal_product_mapper import IOkobauMapper
+from app.core.application.services.ifetch_pool_service import IFetchPoolService
+from app.core.application.services.iharvest_checkpoint_service import IHarvestCheckpointService
+from app.core.application.services.iharvest_pipeline_service import IHarvestPipelineService
+from app.core.application.services.iokobau_service import IOkobauService
+from app.core.application.services.iproduct_service import IProductService
+from app.infrastructure.mappers.epdx_mapper import EpdxMapper
+from app.infrastructure.mappers.external_product_mapper import OkobauMapper
+
+_DONE = object()   # end of stream marker passed down the queues
+PROCESS_ENTRY = re.compile(r"(^|/)processes/[^/]+\.(json|xml)$", re.IGNORECASE)
+
+
+def ilcd_to_product(data: Dict, source_url: Optional[str], source_name: str) -> Product_DTO:
+    """Convert and validate one ILCD document. Module level, so it can run in a worker process."""
+    product_dto = EpdxMapper.to_product_epd(OkobauMapper.ilcd_to_epdx(data, source_url, source_name))
+    if product_dto is None:
+        raise ValueError("epdx could not be mapped to a product")
+    # the same check ProductService runs before every single insert
+    EPD.model_validate(EPD(**product_dto.epdx))
+    return product_dto
+
+
+class StageStats:
+    """Item count, busy time and downstream queue depth of one pipeline stage."""
+    def __init__(self, name: str, out_queue: Optional[queue.Queue] = None):
+        self.name = name
+        self._out_queue = out_queue
+        self._lock = threading.Lock()
+        self.items = 0
+        self.errors = 0
+        self.busy_s = 0.0
+        self.max_queue = 0
+        self.started = None
+        self.finished = None
+
+    def record(self, busy_s: float = 0.0, items: int = 1, failed: bool = False) -> None:
+        with self._lock:
+            if self.started is None:
+                self.started = time.perf_counter()
+            self.items += items
+            self.errors += int(failed)
+            self.busy_s += busy_s
+            if self._out_queue is not None:
+                self.max_queue = max(self.max_queue, self._out_queue.qsize())
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    def as_dict(self) -> Dict[str, Any]:
+        elapsed = (self.finished or time.perf_counter()) - (self.started or time.perf_counter())
+        return {
+            "items": self.items,
+            "errors": self.errors,
+            "items_per_s": round(self.items / elapsed, 2) if elapsed > 0 else None,
+            "busy_s": round(self.busy_s, 2),
+            "max_queue": self.max_queue,
+            "queue": self._out_queue.qsize() if self._out_queue is not None else 0,
+        }
+
+
+class HarvestPipelineService(IHarvestPipelineService):
+    """Harvests the okobaudat datastock as a pipeline of concurrently running stages.
+
+    list -> fetch (thread pool) -> convert and validate (process pool) -> write (one thread, batched)
+    or, for a local ILCD zip export:
+    read -> convert and validate (process pool) -> write (one thread, batched)
+
+    Stages are connected by bounded queues, so a slow stage holds the faster ones back
+    instead of letting work pile up in memory, and the total time approaches the time of
+    the slowest stage rather than the sum of all stages.
+
+    Written and failed uuids are logged to the checkpoint, so an interrupted run can be
+    resumed and failures can be retried without downloading everything again.
+    """
+    def __init__(
+        self,
+        okobau_service: IOkobauService,
+        okobau_mapper: IOkobauMapper,
+        fetch_pool_service: IFetchPoolService,
+        product_service: IProductService,
+        checkpoint_service: Optional[IHarvestCheckpointService] = None,
+        convert_workers: int = 1,
+        queue_size: int = 64,
+        batch_size: int = 100,
+    ):
+        self._okobau_service = okobau_service
+        self._mapper = okobau_mapper
+        self._fetch_pool = fetch_pool_service
+        self._product_service = product_service
+        self._checkpoint = checkpoint_service
+        self._convert_workers = max(1, convert_workers)
+        self._queue_size = max(1, queue_size)
+        self._batch_size = max(1, batch_size)
+
+    def _put(self, target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Blocking put that gives up once the pipeline is stopped."""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fail(self, report: HarvestReport_DTO, uuid: str, version: Optional[str], error_type: str, error: str) -> None:
+        report.failed[uuid] = f"{error_type}: {error}"
+        if self._checkpoint:
+            self._checkpoint.record_failed(uuid, version, error_type, error)
+
+    def _fetch_stage(self, epds, out_queue: queue.Queue, stats: StageStats, report: HarvestReport_DTO, stop: threading.Event) -> None:
+        timeout = Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_TIMEOUT
+        fetch = lambda epd: self._mapper.uuid_to_ilcd(epd.uuid, timeout, epd.version)
+        try:
+            results = self._fetch_pool.map(fetch, epds, ordered=False)
+            for result in results:
+                if not result.ok:
+                    self._fail(report, result.item.uuid, result.item.version, result.error_type, result.error)
+                    stats.record(failed=True)
+                    continue
+                stats.record()
+                if not self._put(out_queue, (result.item, result.value), stop):
+                    results.close()
+                    break
+        finally:
+            stats.finish()
+            self._put(out_queue, _DONE, stop)
+
+    def _convert_stage(
+        self,
+        in_queue: queue.Queue,
+        out_queue: queue.Queue,
+        stats: StageStats,
+        report: HarvestReport_DTO,
+        stop: threading.Event,
+        source_name: str,
+        source_url: Callable[[EPDResponse, Dict], Optional[str]],
+    ) -> None:
+        window = self._convert_workers * 2
+        in_flight: deque[Tuple[EPDResponse, Future, float]] = deque()
+
+        def collect(epd: EPDResponse, future: Future, submitted: float) -> bool:
+            try:
+                product_dto = future.result()
+            except Exception as e:
+                self._fail(report, epd.uuid, epd.version, type(e).__name__, str(e))
+                stats.record(time.perf_counter() - submitted, failed=True)
+                return True
+            stats.record(time.perf_counter() - submitted)
+            return self._put(out_queue, product_dto, stop)
+
+        try:
+            # spawn, forking next to the running fetch threads could copy their held locks into the workers
+            with ProcessPoolExecutor(max_workers=self._convert_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                while not stop.is_set():
+                    try:
+                        item = in_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        # pass finished conversions on while the fetch stage waits on the network
+                        if in_flight and in_flight[0][1].done() and not collect(*in_flight.popleft()):
+                            break
+                        continue
+                    if item is _DONE:
+                        break
+                    epd, ilcd = item
+                    submitted = executor.submit(ilcd_to_product, ilcd, source_url(epd, ilcd), source_name)
+                    in_flight.append((epd, submitted, time.perf_counter()))
+                    while len(in_flight) >= window or (in_flight and in_flight[0][1].done()):
+                        if not collect(*in_flight.popleft()):
+                            break
+                while in_flight and not stop.is_set():
+                    collect(*in_flight.popleft())
+                for _, future, _ in in_flight:
+                    future.cancel()
+        finally:
+            stats.finish()
+            self._put(out_queue, _DONE, stop)
+
+    def _write(self, batch: List[Product_DTO], user_id: Optional[int], report: HarvestReport_DTO) -> None:
+        report.added += self._product_service.create_validated_product_list(batch, user_id)
+        if self._checkpoint:
+            # only after the commit, so a checkpointed uuid is always in the products table
+            self._checkpoint.record_done([(product_dto.epd_id, product_dto.epd_version) for product_dto in batch])
+
+    def _write_batch(self, batch: List[Product_DTO], user_id: Optional[int], stats: StageStats, report: HarvestReport_DTO) -> None:
+        start = time.perf_counter()
+        try:
+            self._write(batch, user_id, report)
+            stats.record(time.perf_counter() - start, items=len(batch))
+        except Exception as e:
+            # a failed batch is retried row by row, so one bad product does not cost the other ones
+            print(f"error writing batch of {len(batch)} products, retrying one by one: {e}")
+            for product_dto in batch:
+                try:
+                    self._write([product_dto], user_id, report)
+                    stats.record()
+                except Exception as e:
+                    self._fail(report, product_dto.epd_id, product_dto.epd_version, type(e).__name__, str(e))
+                    stats.record(failed=True)
+
+    def _write_stage(self, in_queue: queue.Queue, user_id: Optional[int], stats: StageStats, report: HarvestReport_DTO) -> None:
+        batch: List[Product_DTO] = []
+        while True:
+            item = in_queue.get()
+            if item is _DONE:
+                break
+            batch.append(item)
+            if len(batch) >= self._batch_size:
+                self._write_batch(batch, user_id, stats, report)
+                batch = []
+        if batch:
+            self._write_batch(batch, user_id, stats, report)
+        stats.finish()
+
+    def _read_stage(self, items: Iterator[Tuple[EPDResponse, Dict]], out_queue: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for item in items:
+                if not self._put(out_queue, item, stop):
+                    break
+        finally:
+            self._put(out_queue, _DONE, stop)
+
+    def _select(
+        self,
+        items: Iterable[Any],
+        key: Callable[[Any], EPDResponse],
+        report: HarvestReport_DTO,
+        stats: StageStats,
+        source_name: str,
+        skip: Set[str],
+        only: Optional[Set[str]] = None
+    ) -> Iterator[Any]:
+        """Yield items whose uuid and version are not stored for this source yet, minus `skip`, limited to `only` if given."""
+        local = self._product_service.get_product_versions_by_source(source_name)
+        known = {(uuid, version) for uuid, rows in local.items() for _, version in rows}
+        for item in items:
+            epd = key(item)
+            stats.record()
+            if epd.uuid in skip or (only is not None and epd.uuid not in only):
+                report.skipped += 1
+                continue
+            if (epd.uuid, epd.version) in known:
+                report.existing += 1
+                continue
+            known.add((epd.uuid, epd.version))   # the list may contain duplicates
+            yield item
+        stats.finish()
+
+    @staticmethod
+    def _archive_entries(path: Path) -> List[str]:
+        """Names of the JSON process datasets in an ILCD zip."""
+        if not zipfile.is_zipfile(path):
+            raise ValueError(f"{path} is not a zip archive")
+        with zipfile.ZipFile(path) as archive:
+            entries = [name for name in archive.namelist() if PROCESS_ENTRY.search(name)]
+        json_entries = [name for name in entries if name.lower().endswith(".json")]
+        xml_count = len(entries) - len(json_entries)
+        if xml_count and not json_entries:
+            raise ValueError(
+                f"{path} only contains ILCD XML process datasets, lcax converts the JSON format only. "
+                "Export the datastock as JSON."
+            )
+        if xml_count:
+            print(f"skipping {xml_count} XML process datasets in {path}, only JSON is supported")
+        return json_entries
+
+    def _iter_archive(self, path: Path, entries: List[str], report: HarvestReport_DTO) -> Iterator[Tuple[EPDResponse, Dict]]:
+        """Stream process datasets out of the zip, one entry in memory at a time."""
+        with zipfile.ZipFile(path) as archive:
+            for name in entries:
+                try:
+                    with archive.open(name) as file:
+                        data = json.load(file)
+                    uuid = data["processInformation"]["dataSetInformation"]["UUID"]
+                except (ValueError, KeyError, TypeError) as e:
+                    self._fail(report, name, None, type(e).__name__, str(e))
+                    continue
+                base_name = data["processInformation"]["dataSetInformation"].get("name", {}).get("baseName") or []
+                name = next((entry.get("value") for entry in base_name if entry.get("value")), uuid)
+                yield EPDResponse(uuid=uuid, name=name, version=OkobauMapper.ilcd_version(data)), data
+
+    @staticmethod
+    def archive_url(data: Dict, uuid: str, source_name: str) -> Optional[str]:
+        """The uri an archived dataset gives itself, else its okobaudat url if it comes from okobaudat."""
+        url = OkobauMapper.ilcd_url(data)
+        if url is None and source_name == Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME:
+            url = OkobauMapper.uuid_to_url(uuid)
+        return url
+
+    @staticmethod
+    def archive_namespace(path: Path) -> str:
+        """Checkpoint namespace of an archive, one per archive file so imports never share or reset each other's progress."""
+        digest = hashlib.sha1(str(Path(path).resolve()).encode()).hexdigest()[:12]
+        return f"archive-{digest}"
+
+    def _with_checkpoint(self, checkpoint: Optional[IHarvestCheckpointService]) -> "HarvestPipelineService":
+        """This pipeline logging to another checkpoint, the stages read it from self."""
+        pipeline = copy.copy(self)
+        pipeline._checkpoint = checkpoint
+        return pipeline
+
+    def _start_checkpoint(self, resume: bool, retry_failed: bool) -> Tuple[Set[str], Optional[Set[str]]]:
+        """Returns the uuids to skip and, when retrying, the only uuids to process."""
+        if not self._checkpoint:
+            if resume or retry_failed:
+                raise ValueError("resuming needs a checkpoint service")
+            return set(), None
+        if retry_failed:
+            return set(), set(self._checkpoint.get_failed())
+        if resume:
+            return self._checkpoint.get_processed(), None
+        self._checkpoint.reset()
+        return set(), None
+
+    def _run(
+        self,
+        title: str,
+        source_stages: Dict[str, StageStats],
+        source: Callable[[queue.Queue, threading.Event], None],
+        fetched: queue.Queue,
+        report: HarvestReport_DTO,
+        user_id: Optional[int],
+        source_name: str,
+        source_url: Callable[[EPDResponse, Dict], Optional[str]],
+    ) -> HarvestReport_DTO:
+        """Run `source`, which fills `fetched` with (epd, ilcd) pairs, against the convert and write stages."""
+        start_time = time.perf_counter()
+        stop = threading.Event()
+        source_errors: List[BaseException] = []
+
+        def guarded_source(out_queue: queue.Queue, stop: threading.Event) -> None:
+            try:
+                source(out_queue, stop)
+            except BaseException as e:
+                source_errors.append(e)   # raised on the calling thread once the other stages are done
+
+        converted: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        stages = {
+            **source_stages,
+            "convert": StageStats("convert", converted),
+            "write": StageStats("write"),
+        }
+        workers = [
+            threading.Thread(target=guarded_source, name="harvest-source", daemon=True, args=(fetched, stop)),
+            threading.Thread(
+                target=self._convert_stage, name="harvest-convert", daemon=True,
+                args=(fetched, converted, stages["convert"], report, stop, source_name, source_url),
+            ),
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            # the single writer runs on the calling thread, which owns the app context
+            self._write_stage(converted, user_id, stages["write"], report)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+            if self._checkpoint:
+                self._checkpoint.close()
+        if source_errors:
+            raise source_errors[0]
+
+        report.elapsed_s = round(time.perf_counter() - start_time, 2)
+        report.stages = {name: stage.as_dict() for name, stage in stages.items()}
+        print(
+            f"{title} took: {int(report.elapsed_s // 60)} minutes and {int(report.elapsed_s % 60)} seconds"
+        )
+        for name, stage in report.stages.items():
+            print(f"{name}: {stage}")
+        print(
+            f"added: {report.added}, already in database: {report.existing}, "
+            f"skipped by checkpoint: {report.skipped}, failed: {len(report.failed)}"
+        )
+        return report
+
+    def run(self, user_id: Optional[int] = None, resume: bool = False, retry_failed: bool = False) -> HarvestReport_DTO:
+        """
+        Harvest the datastock. Without flags a new checkpoint is started.
+
+        Args:
+            resume: skip every uuid the checkpoint has already written or given up on
+            retry_failed: only process the uuids whose last checkpoint record is a failure
+        """
+        report = HarvestReport_DTO()
+        skip, only = self._start_checkpoint(resume, retry_failed)
+        fetched: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        stages = {"list": StageStats("list"), "fetch": StageStats("fetch", fetched)}
+        source_name = Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME
+        epds = self._select(self._okobau_service.iter_epd_responses(), lambda epd: epd, report, stages["list"], source_name, skip, only)
+        source = lambda out_queue, stop: self._fetch_stage(epds, out_queue, stages["fetch"], report, stop)
+        source_url = lambda epd, ilcd: OkobauMapper.uuid_to_url(epd.uuid)
+        return self._run("harvesting okobaudat", stages, source, fetched, report, user_id, source_name, source_url)
+
+    def run_archive(
+        self,
+        path: Path,
+        user_id: Optional[int] = None,
+        resume: bool = False,
+        retry_failed: bool = False,
+        source_name: Optional[str] = None
+    ) -> HarvestReport_DTO:
+        """
+        Import an ILCD+EPD zip export (JSON datasets) without any network access, same flags as `run`.
+
+        Args:
+            source_name: epd_sourceName of the imported products, the EPD programme the archive
+                comes from, okobaudat if not given. Datasets keep the permanent uri they declare,
+                only okobaudat datasets without one get an okobaudat url.
+
+        Every archive file has its own checkpoint, next to the one of `run`.
+        """
+        if self._checkpoint:
+            return self._with_checkpoint(self._checkpoint.for_namespace(self.archive_namespace(path)))._run_archive(
+                path, user_id, resume, retry_failed, source_name
+            )
+        return self._run_archive(path, user_id, resume, retry_failed, source_name)
+
+    def _run_archive(
+        self,
+        path: Path,
+        user_id: Optional[int],
+        resume: bool,
+        retry_failed: bool,
+        source_name: Optional[str]
+    ) -> HarvestReport_DTO:
+        source_name = source_name or Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME
+        entries = self._archive_entries(path)
+        report = HarvestReport_DTO()
+        skip, only = self._start_checkpoint(resume, retry_failed)
+        fetched: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        stages = {"read": StageStats("read", fetched)}
+        items = self._select(self._iter_archive(path, entries, report), lambda item: item[0], report, stages["read"], source_name, skip, only)
+        source = lambda out_queue, stop: self._read_stage(items, out_queue, stop)
+        source_url = lambda epd, ilcd: self.archive_url(ilcd, epd.uuid, source_name)
+        return self._run(f"importing {path}", stages, source, fetched, report, user_id, source_name, source_url)
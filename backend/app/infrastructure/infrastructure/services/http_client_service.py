@@ -0,0 +1,151 @@
+# app/infrastructure/infrastructure/services/http_client_service.py
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from app.core.application.services.ihttp_client_service import IHttpClientService
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, with bursts of up to `capacity`."""
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = max(1.0, capacity)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available, return the seconds spent waiting."""
+        if self._rate <= 0:
+            return 0.0   # unlimited
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self._rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HttpClientService(IHttpClientService):
+    """Shared http client for external EPD sources.
+
+    Keeps connections alive in a pooled session, applies a global token bucket rate limit
+    and a per host concurrency cap, and retries transient failures with jittered backoff.
+    """
+    def __init__(
+        self,
+        pool_size: int = 16,
+        max_per_host: int = 8,
+        rate_limit: float = 10,
+        burst: float = 20,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30,
+    ):
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._bucket = TokenBucket(rate_limit, burst)
+        self._max_per_host = max(1, max_per_host)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._retries = max(0, retries)
+        self._backoff = backoff
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Generator[None, Any, None]:
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.setdefault(host, threading.BoundedSemaphore(self._max_per_host))
+        with slot:
+            yield
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        # full jitter, so that parallel workers do not hit the server again in lockstep
+        return random.uniform(0, self._backoff * 2 ** attempt)
+
+    def _record(self, latency: float, size: int, failed: bool = False) -> None:
+        latency_ms = latency * 1000
+        bucket = next((str(limit) for limit in LATENCY_BUCKETS_MS if latency_ms <= limit), "inf")
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes"] += size
+            self._stats["errors"] += int(failed)
+            self._stats["latency_total_s"] += latency
+            self._stats["latency_histogram_ms"][bucket] += 1
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> requests.Response:
+        """GET a url, raising requests exceptions once all retries are used up."""
+        timeout = timeout or self._timeout
+        attempt = 0
+        while True:
+            response = None
+            error = None
+            with self._host_slot(url):
+                waited = self._bucket.acquire()
+                start = time.perf_counter()
+                try:
+                    response = self._session.get(url, params=params, timeout=timeout)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+                latency = time.perf_counter() - start
+            retryable = error is not None or response.status_code in RETRY_STATUS_CODES
+            self._record(latency, len(response.content) if response is not None else 0, retryable)
+            with self._lock:
+                self._stats["throttled_s"] += waited
+
+            if not retryable:
+                response.raise_for_status()
+                return response
+            if attempt >= self._retries:
+                if error is not None:
+                    raise error
+                response.raise_for_status()
+            with self._lock:
+                self._stats["retries"] += 1
+            time.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+        return self.get(url, params, timeout).json()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["latency_histogram_ms"] = dict(self._stats["latency_histogram_ms"])
+        stats["latency_avg_ms"] = round(stats["latency_total_s"] * 1000 / stats["requests"], 1) if stats["requests"] else None
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {
+                "requests": 0,
+                "bytes": 0,
+                "retries": 0,
+                "errors": 0,
+                "throttled_s": 0.0,
+                "latency_total_s": 0.0,
+                "latency_histogram_ms": {bucket: 0 for bucket in [*map(str, LATENCY_BUCKETS_MS), "inf"]},
+            }
@@ -0,0 +1,139 @@
+# app/infrastructure/infrastructure/services/ilcd_cache_service.py
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.application.services.iilcd_cache_service import IIlcdCacheService
+
+ALIAS_KIND = "latest"
+
+
+class IlcdCacheService(IIlcdCacheService):
+    """Gzip compressed on-disk cache for ILCD and EPDX documents.
+
+    A dataset is immutable for a given (datastock, uuid, version), so versioned entries never
+    go stale and are only removed by the size based LRU eviction. Lookups without a version
+    go through a `latest` alias that points to the last version seen, and expires after
+    `latest_ttl` seconds. A `max_bytes` of 0 disables the cache.
+    """
+    def __init__(self, directory: Path, datastock: str, max_bytes: int, latest_ttl: float = 86400):
+        self._directory = Path(directory)
+        self._datastock = datastock
+        self._max_bytes = max_bytes
+        self._latest_ttl = latest_ttl
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None   # counted lazily on the first write
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def _path(self, kind: str, uuid: str, version: str) -> Path:
+        key = hashlib.sha256(f"{self._datastock}/{uuid}/{version}".encode()).hexdigest()
+        return self._directory / kind / key[:2] / f"{key}.json.gz"
+
+    def _read(self, path: Path) -> Optional[Any]:
+        try:
+            with gzip.open(path, "rb") as file:
+                data = json.loads(file.read())
+            os.utime(path)   # mark as recently used
+            return data
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, data: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = gzip.compress(json.dumps(data, separators=(",", ":")).encode(), compresslevel=6)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(payload)
+        previous = path.stat().st_size if path.exists() else 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += len(payload) - previous
+            self._stats["writes"] += 1
+            over_limit = self._size > self._max_bytes
+        if over_limit:
+            self._evict()
+
+    def _disk_usage(self) -> int:
+        return sum(path.stat().st_size for path in self._directory.rglob("*.json.gz"))
+
+    def _evict(self) -> None:
+        """Remove least recently used files until the cache is back under 90% of its size limit."""
+        with self._lock:
+            files = []
+            for path in self._directory.rglob("*.json.gz"):
+                try:
+                    stat = path.stat()
+                    files.append((stat.st_mtime, stat.st_size, path))
+                except FileNotFoundError:
+                    continue
+            size = sum(file_size for _, file_size, _ in files)
+            target = self._max_bytes * 0.9
+            for _, file_size, path in sorted(files, key=lambda file: file[0]):
+                if size <= target:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                size -= file_size
+                self._stats["evictions"] += 1
+            self._size = size
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            self._stats["hits" if hit else "misses"] += 1
+
+    def _resolve_latest(self, uuid: str) -> Optional[str]:
+        path = self._path(ALIAS_KIND, uuid, "")
+        alias = self._read(path)
+        if not alias or time.time() - alias.get("cached_at", 0) > self._latest_ttl:
+            return None
+        return alias.get("version")
+
+    def get(self, kind: str, uuid: str, version: Optional[str] = None) -> Optional[Any]:
+        """Return the cached document, or None. Without a version the latest known version is used."""
+        if not self.enabled:
+            return None
+        if version is None:
+            version = self._resolve_latest(uuid)
+            if version is None:
+                self._count(False)
+                return None
+        data = self._read(self._path(kind, uuid, version))
+        self._count(data is not None)
+        return data
+
+    def put(self, kind: str, uuid: str, version: str, data: Any, latest: bool = False) -> None:
+        """Store a document. `latest` also points unversioned lookups of this uuid at `version`."""
+        if not self.enabled or not version:
+            return
+        try:
+            self._write(self._path(kind, uuid, version), data)
+            if latest:
+                self._write(self._path(ALIAS_KIND, uuid, ""), {"version": version, "cached_at": time.time()})
+        except OSError as e:
+            # the cache is an optimisation, a full or read only disk should not break harvesting
+            print(f"could not write {kind} {uuid} version {version} to cache: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._directory.rglob("*.json.gz"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._size is None and self.enabled and self._directory.exists():
+                self._size = self._disk_usage()
+            return {**self._stats, "bytes": self._size or 0, "max_bytes": self._max_bytes}
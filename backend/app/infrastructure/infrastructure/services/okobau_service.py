@@ -5,38 +5,56 @@ sys.path.append("/home/admin/carbonitor-v2/backend")  # Your project root path
 import json
 import time
 from collections import Counter
+from typing import Iterable, Iterator, Optional
 
 import lcax
 import requests
 from app.config import Config
 from app.core.application.dtos.epdx.epdx_dto import EPD
+from app.core.application.dtos.fetch.fetch_result_dto import FetchResult_DTO
 from app.core.application.dtos.okobau.okobau_dto import EPDResponse
 from app.core.application.mappers.iexternal_product_mapper import IOkobauMapper
+from app.core.application.services.ifetch_pool_service import IFetchPoolService
+from app.core.application.services.ihttp_client_service import IHttpClientService
+from app.core.application.services.iilcd_cache_service import IIlcdCacheService
 from app.core.application.services.iokobau_service import IOkobauService
 from app.core.domain.entities.product import Product
 
 
 class OkobauService(IOkobauService):
     def __init__(self,
-        mapper = IOkobauMapper
+        mapper = IOkobauMapper,
+        fetch_pool_service: IFetchPoolService = None,
+        http_client_service: IHttpClientService = None,
+        ilcd_cache_service: IIlcdCacheService = None
     ):
         self._mapper = mapper
-
-    def get_epds(self) -> dict:
-        response = requests.get(Config.EXTERNAL_RESOURCES.OKOBAU.FULL_LIST_URL)
-        response.raise_for_status()
-        data = response.json()
-        return data
+        self._fetch_pool = fetch_pool_service
+        self._http_client = http_client_service
+        self._cache = ilcd_cache_service
 
     def get_ilcd_from_uuid(self, uuid: str) -> dict:
-        base_url = f"{Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL}{uuid}"
-        response = requests.get(f"{base_url}?format=json&view=extended")
-        response.raise_for_status()
-        data = response.json()
-        return data
+        return self._mapper.uuid_to_ilcd(uuid, Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_TIMEOUT)
 
     def get_epds_list(self) -> list:
-        return self.get_epds().get("data", [])
+        return list(self.iter_epds())
+
+    def iter_epds(self, page_size: Optional[int] = None) -> Iterator[dict]:
+        """Walk the paginated process list, holding at most one page in memory."""
+        okobau = Config.EXTERNAL_RESOURCES.OKOBAU
+        page_size = page_size or okobau.LIST_PAGE_SIZE
+        start_index = 0
+        while True:
+            page = self._http_client.get_json(
+                okobau.PROCESS_LIST_URL,
+                params={**okobau.PROCESS_LIST_PARAMS, "startIndex": start_index, "pageSize": page_size},
+            )
+            data = page.get("data", [])
+            yield from data
+            start_index += len(data)
+            total_count = page.get("totalCount")
+            if len(data) < page_size or (total_count is not None and start_index >= total_count):
+                return
 
     def get_epdx_from_uuid(self, uuid: str) -> EPD:
         try:
@@ -47,23 +65,19 @@ class OkobauService(IOkobauService):
                 )
 
 
-    def get_epd_response_list(self) -> list[EPDResponse]:
-        raw_epds = self.get_epds_list()
-        valid_epds: list[EPDResponse] = []
-        invalid_count = 0
-
-        for epd_data in raw_epds:
+    def iter_epd_responses(self, page_size: Optional[int] = None) -> Iterator[EPDResponse]:
+        """Yield validated list entries page by page, so downloads can start before the list is complete."""
+        for epd_data in self.iter_epds(page_size):
             try:
                 # Direct conversion using dict unpacking
-                epd_response = EPDResponse(**epd_data)
-                valid_epds.append(epd_response)
+                yield EPDResponse(**epd_data)
             except Exception as e:
-                invalid_count += 1
                 print(
                     f"Invalid EPD - UUID: {epd_data.get('uuid', 'No UUID')}, Error: {str(e)}"
                 )
-                continue
-        return valid_epds
+
+    def get_epd_response_list(self) -> list[EPDResponse]:
+        return list(self.iter_epd_responses())
 
     def get_epdx(self, epd_response: EPDResponse) -> EPD:
         try:
@@ -71,18 +85,23 @@ class OkobauService(IOkobauService):
         except Exception as e:
             print(f"error getting epdx: {e}")
 
-    def get_epdx_list(self) -> list[EPD]:
-        epds = self.get_epd_response_list()
+    def iter_epdx(self, epds: Iterable[EPDResponse], ordered: Optional[bool] = None) -> Iterator[FetchResult_DTO]:
+        """Download and convert epds concurrently, yielding one result per epd as it becomes available."""
+        timeout = Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_TIMEOUT
+        return self._fetch_pool.map(lambda epd: self._mapper.epd_to_epdx(epd, timeout), epds, ordered)
+
+    def get_epdx_list(self, ordered: Optional[bool] = None) -> list[EPD]:
+        epds = self.iter_epd_responses()
         epdx_list: list[EPD] = []
         invalid_epd_list: list[EPDResponse] = []
         start_time = time.perf_counter()
 
-        for i, epd in enumerate(epds):
-            try:
-                epdx_list.append(self._mapper.epd_to_epdx(epd))
-            except Exception as e:
-                invalid_epd_list.append(i)
-                print(str(e))
+        for result in self.iter_epdx(epds, ordered):
+            if result.ok:
+                epdx_list.append(result.value)
+            else:
+                invalid_epd_list.append(result.index)
+                print(f"Invalid EPD - UUID: {result.item.uuid}, Error: {result.error_type}: {result.error}")
 
         end_time = time.perf_counter()
         time_diff = end_time - start_time
@@ -94,8 +113,13 @@ class OkobauService(IOkobauService):
         print(f"successfully converted responses: {len(epdx_list)}")
         print(f"failed to convert responses: {len(invalid_epd_list)}")
         print(f"failed responses: \n {invalid_epd_list}")
+        print(f"http client stats: {self.get_http_stats()}")
+        print(f"ilcd cache stats: {self._cache.get_stats()}")
         return epdx_list
 
+    def get_http_stats(self) -> dict:
+        return self._http_client.get_stats()
+
     def get_language_statistics(self):
         epd_list = self.get_epd_response_list()
         # Get all languages using map and flatten
@@ -38,6 +38,7 @@ class EpdxMapper(IEpdxMapper):
             ConversionType.GRAMMAGE: product.epd_grammage,
             ConversionType.LAYER_THICKNESS: product.epd_layer_thickness,
             ConversionType.BULK_DENSITY: product.epd_bulk_density,
+            ConversionType.WEIGHT_PER_PIECE: product.epd_weight_per_piece,
         }
 
         for conv_type, value in density_mappings.items():
@@ -143,7 +144,7 @@ class EpdxMapper(IEpdxMapper):
             epd_location=epd.location.value,
             epd_formatVersion=epd.format_version,
             epd_sourceName=str(epd.source.name),
-            epd_sourceUrl=str(epd.source.url),  # Construct URL as needed
+            epd_sourceUrl=str(epd.source.url) if epd.source.url else None,
             epd_subtype=epd.subtype.value,
         )
 
@@ -158,6 +159,7 @@ class EpdxMapper(IEpdxMapper):
             ConversionType.BULK_DENSITY.value: "epd_bulk_density",
             ConversionType.GRAMMAGE.value: "epd_grammage",
             ConversionType.LAYER_THICKNESS.value: "epd_layer_thickness",
+            ConversionType.WEIGHT_PER_PIECE.value: "epd_weight_per_piece",
         }
 
         density_values = {}
@@ -1,33 +1,64 @@
 # backend/app/infrastructure/mappers/external_product_mapper.py
 
 import json
-from typing import Dict
+from typing import Dict, Optional
 
 import lcax
-import requests
 from app.config import Config
 from app.core.application.dtos.epdx.epdx_dto import EPD
 from app.core.application.dtos.okobau.okobau_dto import \
     EPDResponse as OkobauResponse
 from app.core.application.mappers.iexternal_product_mapper import IOkobauMapper
+from app.core.application.services.ihttp_client_service import IHttpClientService
+from app.core.application.services.iilcd_cache_service import IIlcdCacheService
 
 
 class OkobauMapper(IOkobauMapper):
+    def __init__(self, http_client_service: IHttpClientService, ilcd_cache_service: IIlcdCacheService):
+        self._http_client = http_client_service
+        self._cache = ilcd_cache_service
 
     @staticmethod
-    def uuid_to_epdx(uuid: str) -> EPD:
-        base_url = f"{Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL}{uuid}"
-        response = requests.get(f"{base_url}?format=json&view=extended")
-        response.raise_for_status()
-        data = response.json()
+    def uuid_to_url(uuid: str) -> str:
+        return f"{Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL}{uuid}"
+
+    @staticmethod
+    def ilcd_version(data: Dict) -> Optional[str]:
+        publication = (data.get("administrativeInformation") or {}).get("publicationAndOwnership") or {}
+        return publication.get("dataSetVersion")
+
+    @staticmethod
+    def ilcd_url(data: Dict) -> Optional[str]:
+        """The permanent uri the publisher gives the dataset, if any."""
+        publication = (data.get("administrativeInformation") or {}).get("publicationAndOwnership") or {}
+        return publication.get("permanentDataSetURI") or None
+
+    def uuid_to_ilcd(self, uuid: str, timeout: Optional[float] = None, version: Optional[str] = None) -> Dict:
+        cached = self._cache.get("ilcd", uuid, version)
+        if cached is not None:
+            return cached
+        params = {"format": "json", "view": "extended"}
+        if version:
+            params["version"] = version
+        data = self._http_client.get_json(OkobauMapper.uuid_to_url(uuid), params=params, timeout=timeout)
+        self._cache.put("ilcd", uuid, version or OkobauMapper.ilcd_version(data), data, latest=version is None)
+        return data
+
+    @staticmethod
+    def ilcd_to_epdx(data: Dict, source_url: Optional[str], source_name: Optional[str] = None) -> EPD:
         epdx = lcax.convert_ilcd(data=json.dumps(data), as_type=str)
         epdx_dict = json.loads(epdx)  # Parse the JSON string into a dictionary
-        epdx_dict["source"] = {"name": "Oekobaudat", "url": base_url}
+        epdx_dict["source"] = {"name": source_name or Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME, "url": source_url}
         return EPD(**epdx_dict)
 
-    @staticmethod
-    def epd_to_epdx(epd: OkobauResponse) -> EPD:
-        return OkobauMapper.uuid_to_epdx(epd.uuid)
-
+    def uuid_to_epdx(self, uuid: str, timeout: Optional[float] = None, version: Optional[str] = None) -> EPD:
+        cached = self._cache.get("epdx", uuid, version)
+        if cached is not None:
+            return EPD(**cached)
+        data = self.uuid_to_ilcd(uuid, timeout, version)
+        epd = OkobauMapper.ilcd_to_epdx(data, OkobauMapper.uuid_to_url(uuid))
+        self._cache.put("epdx", uuid, version or OkobauMapper.ilcd_version(data), epd.model_dump(mode="json", by_alias=True))
+        return epd
 
-    
\ No newline at end of file
+    def epd_to_epdx(self, epd: OkobauResponse, timeout: Optional[float] = None) -> EPD:
+        return self.uuid_to_epdx(epd.uuid, timeout, epd.version)
@@ -13,6 +13,8 @@ from app.core.domain.entities.product import Product
 from app.core.domain.enums.default_impacts import DefaultImpacts
 
 T = TypeVar ('T', Product_DTO, ProductEPD_DTO, ProductHeader_DTO, ProductDensity_DTO)
+# read from the db, but never written from a dto
+DB_MANAGED_FIELDS = {"updated_at"}
 # perfect!
 class ProductMapper(IProductMapper):
 
@@ -31,15 +33,34 @@ class ProductMapper(IProductMapper):
 
     @staticmethod
     def dto_to_product_entity(product_dto : ProductHeader_DTO) -> Product:
-        return Product(**product_dto.model_dump(exclude_unset=True))
+        return Product(**product_dto.model_dump(exclude_unset=True, exclude=DB_MANAGED_FIELDS))
+
+    @staticmethod
+    def dto_to_product_row(product_dto : ProductHeader_DTO) -> dict:
+        # same keys for every dto, so that rows can be inserted with one executemany
+        columns = Product.__table__.columns.keys()
+        return {key: value for key, value in product_dto.model_dump(exclude=DB_MANAGED_FIELDS).items() if key in columns and key != "id"}
 
     @staticmethod
     def entity_to_product_dto(product : Product) -> Product_DTO:  
         return ProductMapper._create_dto_from_entity(product, Product_DTO)
 
+    @staticmethod
+    def row_columns() -> list[str]:
+        # the columns a stored product is rebuilt from, the ones dto_to_product_row writes
+        columns = Product.__table__.columns.keys()
+        return [name for name in Product_DTO.model_fields if name in columns and name != "id" and name not in DB_MANAGED_FIELDS]
+
+    @staticmethod
+    def header_columns() -> list[str]:
+        # the scalar columns of a ProductHeader_DTO, loading these leaves the epdx json alone
+        columns = Product.__table__.columns.keys()
+        return [name for name in ProductHeader_DTO.model_fields if name in columns]
+
     @staticmethod
     def entity_to_product_header_dto(product : Product) -> ProductHeader_DTO:  
-        return ProductMapper._create_dto_from_entity(product, ProductHeader_DTO)
+        # reads the header attributes only, unlike to_dict, so it works on entities with deferred epdx
+        return ProductHeader_DTO.model_validate(product)
 
     @staticmethod
     def entity_to_product_density_dto(product : Product) -> ProductDensity_DTO:  
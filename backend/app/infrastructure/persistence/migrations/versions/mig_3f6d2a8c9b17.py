@@ -0,0 +1,67 @@
+"""product weight per piece
+
+Revision ID: 3f6d2a8c9b17
+Revises: e2b7c94d1a06
+Create Date: 2026-10-18 13:00:00.000000
+
+Column epd_weight_per_piece next to the other conversion columns, so that the impact matrix
+converts products declared per piece like the per product path does from their epdx.
+Filled from the "weight per piece" conversion of the stored epdx documents.
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6d2a8c9b17'
+down_revision: Union[str, None] = 'e2b7c94d1a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def _weight_per_piece(epdx) -> Union[float, None]:
+    if isinstance(epdx, str):
+        epdx = json.loads(epdx)
+    for conversion in (epdx or {}).get("conversions") or []:
+        meta_data = conversion.get("metaData") or conversion.get("meta_data") or {}
+        if meta_data.get("name") == "weight per piece":
+            try:
+                return float(meta_data.get("value"))
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "epd_weight_per_piece" in {column["name"] for column in sa.inspect(bind).get_columns("products")}:
+        return
+    op.add_column("products", sa.Column("epd_weight_per_piece", sa.Float(precision=10), nullable=True))
+
+    products = sa.table("products", sa.column("id"), sa.column("epdx"), sa.column("epd_weight_per_piece"))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(products.c.id, products.c.epdx).where(products.c.id > last_id).order_by(products.c.id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        values = [{"product_id": id, "weight": weight} for id, weight in ((id, _weight_per_piece(epdx)) for id, epdx in rows)
+                  if weight is not None]
+        if values:
+            bind.execute(
+                sa.update(products).where(products.c.id == sa.bindparam("product_id"))
+                .values(epd_weight_per_piece=sa.bindparam("weight")),
+                values,
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("products") as batch:
+        batch.drop_column("epd_weight_per_piece")
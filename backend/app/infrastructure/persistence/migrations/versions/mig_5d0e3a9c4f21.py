@@ -0,0 +1,45 @@
+"""product impacts table
+
+Revision ID: 5d0e3a9c4f21
+Revises: cbb0d61b2b7a
+Create Date: 2026-10-18 10:00:00.000000
+
+One row per products.epdx["impacts"][indicator][stage] value, so that impacts can be
+filtered, ranked and aggregated in SQL. Fill it for existing products with
+`flask seed product-impacts`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d0e3a9c4f21'
+down_revision: Union[str, None] = 'cbb0d61b2b7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("product_impacts"):
+        return
+    op.create_table(
+        "product_impacts",
+        sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("indicator", sa.String(length=45), nullable=False),
+        sa.Column("stage", sa.String(length=45), nullable=False),
+        sa.Column("value", sa.Double(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("product_id", "indicator", "stage"),
+    )
+    op.create_index(
+        "ix_product_impacts_indicator_stage_value", "product_impacts",
+        ["indicator", "stage", "value", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_impacts_indicator_stage_value", table_name="product_impacts")
+    op.drop_table("product_impacts")
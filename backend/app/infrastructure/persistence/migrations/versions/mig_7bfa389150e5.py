@@ -0,0 +1,24 @@
+"""baseline
+
+Revision ID: 7bfa389150e5
+Revises: 
+Create Date: 2025-04-24 00:00:00.000000
+
+The schema as created before migrations were kept in the repository. Databases set up
+back then are stamped with this revision, so later migrations can be applied on top.
+"""
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = '7bfa389150e5'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,43 @@
+"""row version
+
+Revision ID: 8c1e5f3a7d42
+Revises: 3f6d2a8c9b17
+Create Date: 2026-10-18 15:00:00.000000
+
+Column row_version on every table of the entities, incremented by each update. Change stamps
+and etags read it instead of updated_at, which has one second resolution on mysql.
+Existing rows start at 1.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1e5f3a7d42'
+down_revision: Union[str, None] = '3f6d2a8c9b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _tables(has_row_version: bool) -> list[str]:
+    # the entity tables are the ones with updated_at, every one of them gets row_version from Base
+    inspector = sa.inspect(op.get_bind())
+    tables = []
+    for table in inspector.get_table_names():
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "updated_at" in columns and ("row_version" in columns) == has_row_version:
+            tables.append(table)
+    return tables
+
+
+def upgrade() -> None:
+    for table in _tables(has_row_version=False):
+        op.add_column(table, sa.Column("row_version", sa.Integer(), nullable=False, server_default=sa.text("1")))
+
+
+def downgrade() -> None:
+    for table in _tables(has_row_version=True):
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("row_version")
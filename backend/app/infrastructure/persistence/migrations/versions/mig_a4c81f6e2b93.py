@@ -0,0 +1,47 @@
+"""product full-text search
+
+Revision ID: a4c81f6e2b93
+Revises: 5d0e3a9c4f21
+Create Date: 2026-10-18 11:00:00.000000
+
+Full-text index over epd_name, epd_description, epd_comment and epd_sourceName for
+/products/search: an fts5 table filled from the stored products on sqlite, a FULLTEXT
+index on mysql.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c81f6e2b93'
+down_revision: Union[str, None] = '5d0e3a9c4f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["epd_name", "epd_description", "epd_comment", "epd_sourceName"]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        if sa.inspect(bind).has_table("products_fts"):
+            return
+        columns = ", ".join(f'"{column}"' for column in COLUMNS)
+        op.execute(
+            f"CREATE VIRTUAL TABLE products_fts USING fts5({', '.join(COLUMNS)}, tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(f"INSERT INTO products_fts (rowid, {columns}) SELECT id, {columns} FROM products")
+    elif bind.dialect.name in ("mysql", "mariadb"):
+        if "ft_products_search" in {index["name"] for index in sa.inspect(bind).get_indexes("products")}:
+            return
+        op.create_index("ft_products_search", "products", COLUMNS, mysql_prefix="FULLTEXT")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS products_fts")
+    elif bind.dialect.name in ("mysql", "mariadb"):
+        op.drop_index("ft_products_search", table_name="products")
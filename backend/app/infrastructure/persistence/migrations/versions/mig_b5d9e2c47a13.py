@@ -0,0 +1,37 @@
+"""buildup results version
+
+Revision ID: b5d9e2c47a13
+Revises: 8c1e5f3a7d42
+Create Date: 2026-10-18 16:00:00.000000
+
+Stored buildup results record the buildup's row_version instead of its updated_at, which has
+one second resolution on mysql, so an edit within a second of the last one recomputes them.
+The stored results are removed, they are filled again on the next read of every buildup.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d9e2c47a13'
+down_revision: Union[str, None] = '8c1e5f3a7d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if "buildup_version" in {column["name"] for column in sa.inspect(op.get_bind()).get_columns("buildup_results")}:
+        return
+    op.execute(sa.text("DELETE FROM buildup_results"))
+    with op.batch_alter_table("buildup_results") as batch:
+        batch.drop_column("buildup_updated_at")
+        batch.add_column(sa.Column("buildup_version", sa.Integer(), nullable=False))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DELETE FROM buildup_results"))
+    with op.batch_alter_table("buildup_results") as batch:
+        batch.drop_column("buildup_version")
+        batch.add_column(sa.Column("buildup_updated_at", sa.String(length=64), nullable=False))
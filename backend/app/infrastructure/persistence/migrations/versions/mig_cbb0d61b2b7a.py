@@ -0,0 +1,96 @@
+"""product uri indexes
+
+Revision ID: cbb0d61b2b7a
+Revises: 7bfa389150e5
+Create Date: 2026-10-18 08:00:00.000000
+
+Unique index on (epd_sourceName, epd_id, epd_version), so concurrent imports cannot
+store an EPD version twice, and an index on (epd_sourceName, epd_id, id) that finds the
+latest row of a source and id with one index seek, the row itself is still read from the table.
+Duplicates stored before the index existed are removed, the oldest row is kept and the
+category associations of the removed rows are moved to it. Rows with a NULL key column are
+not duplicates, the unique index allows any number of them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cbb0d61b2b7a'
+down_revision: Union[str, None] = '7bfa389150e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = {index["name"] for index in sa.inspect(bind).get_indexes("products")}
+
+    products = sa.table(
+        "products", sa.column("id"), sa.column("epd_sourceName"), sa.column("epd_id"), sa.column("epd_version")
+    )
+    key = (products.c.epd_sourceName, products.c.epd_id, products.c.epd_version)
+    keep = (
+        sa.select(*key, sa.func.min(products.c.id).label("keep_id"))
+        .where(*(column.is_not(None) for column in key))
+        .group_by(*key)
+        .having(sa.func.count() > 1)
+        .subquery("keep")
+    )
+    duplicates = dict(bind.execute(
+        sa.select(products.c.id, keep.c.keep_id)
+        .join(keep, sa.and_(*(column == keep.c[column.name] for column in key)))
+        .where(products.c.id != keep.c.keep_id)
+    ).all())
+
+    if duplicates:
+        inspector = sa.inspect(bind)
+        if inspector.has_table("category_associations"):
+            _repoint_category_associations(bind, duplicates)
+        ids = list(duplicates)
+        for offset in range(0, len(ids), 500):
+            chunk = ids[offset:offset + 500]
+            if inspector.has_table("product_impacts"):
+                # created by create_all on some databases, sqlite does not cascade without foreign keys on
+                impacts = sa.table("product_impacts", sa.column("product_id"))
+                bind.execute(sa.delete(impacts).where(impacts.c.product_id.in_(chunk)))
+            bind.execute(sa.delete(products).where(products.c.id.in_(chunk)))
+        print(f"removed {len(duplicates)} duplicate products")
+
+    if "uq_products_source_epd_version" not in existing:
+        op.create_index(
+            "uq_products_source_epd_version", "products",
+            ["epd_sourceName", "epd_id", "epd_version"], unique=True,
+        )
+    if "ix_products_source_epd_id" not in existing:
+        op.create_index("ix_products_source_epd_id", "products", ["epd_sourceName", "epd_id", "id"])
+
+
+def _repoint_category_associations(bind, duplicates) -> None:
+    """Move the product associations of removed rows to the kept row, dropping those it already has."""
+    associations = sa.table(
+        "category_associations", sa.column("id"), sa.column("category_id"), sa.column("entity_id"), sa.column("entity_type")
+    )
+    product_ids = list(duplicates) + list(set(duplicates.values()))
+    rows = bind.execute(
+        sa.select(associations.c.id, associations.c.category_id, associations.c.entity_id)
+        .where(associations.c.entity_type == "product", associations.c.entity_id.in_(product_ids))
+        .order_by(associations.c.id)
+    ).all()
+    kept = {(category_id, entity_id) for _, category_id, entity_id in rows if entity_id not in duplicates}
+    for id, category_id, entity_id in rows:
+        if entity_id not in duplicates:
+            continue
+        target = (category_id, duplicates[entity_id])
+        if target in kept:
+            bind.execute(sa.delete(associations).where(associations.c.id == id))
+        else:
+            kept.add(target)
+            bind.execute(sa.update(associations).where(associations.c.id == id).values(entity_id=target[1]))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_source_epd_id", table_name="products")
+    op.drop_index("uq_products_source_epd_version", table_name="products")
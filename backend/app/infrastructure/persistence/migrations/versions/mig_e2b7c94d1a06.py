@@ -0,0 +1,42 @@
+"""buildup results table
+
+Revision ID: e2b7c94d1a06
+Revises: a4c81f6e2b93
+Create Date: 2026-10-18 12:00:00.000000
+
+The computed impacts of each buildup with a fingerprint of what they were computed from, so
+that opening a buildup does not resolve and evaluate its products again until the buildup or
+one of them changes. Filled on the first read of every buildup.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c94d1a06'
+down_revision: Union[str, None] = 'a4c81f6e2b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("buildup_results"):
+        return
+    op.create_table(
+        "buildup_results",
+        sa.Column("buildup_id", sa.Integer(), sa.ForeignKey("buildups.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("buildup_updated_at", sa.String(length=64), nullable=False),
+        sa.Column("products_stamp", sa.String(length=255), nullable=True),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("uris", sa.JSON(), nullable=False),
+        sa.Column("impacts", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("buildup_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("buildup_results")
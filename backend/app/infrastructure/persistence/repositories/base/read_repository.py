@@ -1,11 +1,25 @@
 # app/infrastructure/persistence/repositories/base/read_repository.py
-from typing import List, Optional, TypeVar, Generic, Type
-from sqlalchemy import select
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Generic, Type
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+from app.core.application.dtos.page.page_dto import Page_DTO
 from app.core.application.repositories.base.iread_repository import IReadRepository
 from app.infrastructure.persistence.contexts.dbcontext import DBContext
 
 T = TypeVar('T')
 
+# filter keys are <column> or <column>__<operator>
+FILTER_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "in": lambda column, value: column.in_(value),
+    "gte": lambda column, value: column >= value,
+    "lte": lambda column, value: column <= value,
+}
+
 class ReadRepository(IReadRepository[T], Generic[T]):
     def __init__(self, db_context: DBContext, entity_type: Type[T]):
         self.db = db_context
@@ -19,6 +33,18 @@ class ReadRepository(IReadRepository[T], Generic[T]):
             )
             return result.scalar_one_or_none()
 
+    def get_by_ids(self, ids: List[int]) -> List[T]:
+        """The rows with these ids in one IN query, ids that do not exist are left out."""
+        if not ids:
+            return []
+        with self.db.session() as session:
+            result = session.execute(
+                select(self._entity_type)
+                .where(self._entity_type.id.in_(set(ids)))
+                .order_by(self._entity_type.id)
+            )
+            return list(result.scalars().all())
+
     def get_all(self) -> List[T]:
         with self.db.session() as session:
             result = session.execute(select(self._entity_type))
@@ -30,4 +56,124 @@ class ReadRepository(IReadRepository[T], Generic[T]):
             for key, value in kwargs.items():
                 query = query.filter(getattr(self._entity_type, key) == value)
             result = session.execute(query)
-            return list(result.scalars().all())
\ No newline at end of file
+            return list(result.scalars().all())
+
+    def _column(self, name: str):
+        column = self._entity_type.__table__.columns.get(name)
+        if column is None:
+            raise ValueError(f"{self._entity_type.__name__} has no column {name}")
+        return getattr(self._entity_type, name)
+
+    def _apply_filters(self, query: Select, filters: Optional[Dict[str, Any]]) -> Select:
+        """Add a where clause per filter, filters with a None value are ignored."""
+        for key, value in (filters or {}).items():
+            if value is None:
+                continue
+            name, _, operator = key.partition("__")
+            operator = operator or ("in" if isinstance(value, (list, tuple, set)) else "eq")
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"unsupported filter operator {operator}")
+            query = query.where(FILTER_OPERATORS[operator](self._column(name), value))
+        return query
+
+    @staticmethod
+    def _encode_cursor(sort_value: Any, id: int) -> str:
+        if isinstance(sort_value, datetime):
+            payload = [sort_value.isoformat(), id, "datetime"]
+        else:
+            payload = [sort_value, id]
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[Any, int]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            sort_value, id = payload[0], int(payload[1])
+            if len(payload) > 2 and payload[2] == "datetime":
+                sort_value = datetime.fromisoformat(sort_value)
+            return sort_value, id
+        except (ValueError, TypeError, IndexError) as e:
+            raise ValueError(f"invalid cursor: {cursor}") from e
+
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        with self.db.session() as session:
+            query = self._apply_filters(select(func.count()).select_from(self._entity_type), filters)
+            return session.execute(query).scalar_one()
+
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        """
+        A string that changes whenever the table (or the row with this id) changes, from one aggregate
+        query that loads no entities: row count, sum of row_version, highest id and latest updated_at, so
+        that inserts, updates and deletes all show. row_version is incremented by every update, so edits
+        within one second of updated_at change the stamp too; updated_at catches a deleted last row
+        replaced by one with the same id, which sqlite reuses. None if the row does not exist.
+        """
+        with self.db.session() as session:
+            if id is not None:
+                row = session.execute(
+                    select(self._entity_type.id, self._entity_type.row_version).where(self._entity_type.id == id)
+                ).one_or_none()
+            else:
+                row = session.execute(select(
+                    func.count(self._entity_type.id), func.sum(self._entity_type.row_version),
+                    func.max(self._entity_type.id), func.max(self._entity_type.updated_at),
+                )).one()
+        if row is None:
+            return None
+        return ":".join([self._entity_type.__tablename__, *(str(value) for value in row)])
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False,
+        columns: Optional[List[str]] = None
+    ) -> Page_DTO:
+        """
+        Keyset pagination: the cursor holds the sort value and id of the last row of the previous
+        page, so every page costs the same index range scan no matter how deep it is, and rows
+        inserted meanwhile do not shift pages. The id breaks ties, so the order is stable.
+
+        Args:
+            sort_by: a non nullable column, NULLs have no place in a keyset order
+            filters: {column: value}, {column: [values]} or {column__gte / column__lte: value}
+            columns: only load these columns, the others are deferred. The returned entities are
+                detached, so deferred columns must not be accessed on them.
+        """
+        sort_column = self._column(sort_by)
+        if self._entity_type.__table__.columns[sort_by].nullable:
+            raise ValueError(f"cannot page by nullable column {sort_by}")
+        id_column = self._entity_type.id
+        query = self._apply_filters(select(self._entity_type), filters)
+        if columns:
+            # id and the sort column are needed for the cursor
+            names = {*columns, "id", sort_by}
+            query = query.options(load_only(*(self._column(name) for name in names), raiseload=True))
+
+        if cursor:
+            sort_value, last_id = self._decode_cursor(cursor)
+            after = (lambda column, value: column < value) if descending else (lambda column, value: column > value)
+            if sort_by == "id":
+                query = query.where(after(id_column, last_id))
+            else:
+                query = query.where(or_(
+                    after(sort_column, sort_value),
+                    and_(sort_column == sort_value, after(id_column, last_id)),
+                ))
+        if descending:
+            query = query.order_by(sort_column.desc(), id_column.desc())
+        else:
+            query = query.order_by(sort_column.asc(), id_column.asc())
+
+        with self.db.session() as session:
+            # one extra row tells whether there is a next page without counting
+            rows = list(session.execute(query.limit(limit + 1)).scalars().all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(getattr(rows[-1], sort_by), rows[-1].id)
+        total = self.count(filters) if include_total else None
+        return Page_DTO(items=rows, limit=limit, next_cursor=next_cursor, total=total)
@@ -1,9 +1,25 @@
 # app/infrastructure/persistence/repositories/buildup/buildup_read_repository.py
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+
 from app.infrastructure.persistence.contexts.dbcontext import DBContext
-from app.core.domain.entities import Buildup
+from app.core.domain.entities import Buildup, BuildupResult
 from app.core.application.repositories.buildup.ibuildup_read_repository import IBuildupReadRepository
 from app.infrastructure.persistence.repositories.base.read_repository import ReadRepository
 
 class BuildupReadRepository(ReadRepository[Buildup], IBuildupReadRepository):
     def __init__(self, db_context: DBContext):
-        super().__init__(db_context, Buildup)
\ No newline at end of file
+        super().__init__(db_context, Buildup)
+
+    def get_results(self, ids: List[int]) -> List[Tuple[int, int, Optional[BuildupResult]]]:
+        """(id, row_version, stored result or None) of the buildups with these ids in one query, without loading the buildups."""
+        if not ids:
+            return []
+        with self.db.session() as session:
+            result = session.execute(
+                select(Buildup.id, Buildup.row_version, BuildupResult)
+                .outerjoin(BuildupResult, BuildupResult.buildup_id == Buildup.id)
+                .where(Buildup.id.in_(list(set(ids))))
+            )
+            return [tuple(row) for row in result.all()]
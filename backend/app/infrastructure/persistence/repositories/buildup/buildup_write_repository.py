@@ -1,9 +1,35 @@
 # app/infrastructure/persistence/repositories/buildup/buildup_write_repository.py
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, insert, select, update
+
 from app.infrastructure.persistence.contexts.dbcontext import DBContext
-from app.core.domain.entities import Buildup
+from app.core.domain.entities import Buildup, BuildupResult
 from app.core.application.repositories.buildup.ibuildup_write_repository import IBuildupWriteRepository
 from app.infrastructure.persistence.repositories.base.write_repository import WriteRepository
 
 class BuildupWriteRepository(WriteRepository[Buildup], IBuildupWriteRepository):
     def __init__(self, db_context: DBContext):
-        super().__init__(db_context, Buildup)
\ No newline at end of file
+        super().__init__(db_context, Buildup)
+
+    def delete(self, id: int) -> None:
+        with self._db.session() as session:
+            # explicitly, sqlite only cascades with foreign keys switched on
+            session.execute(delete(BuildupResult).where(BuildupResult.buildup_id == id))
+            entity = session.execute(select(Buildup).filter(Buildup.id == id)).scalar_one()
+            session.delete(entity)
+
+    def save_results(self, rows: List[Dict[str, Any]]) -> None:
+        """Replace the stored results of these buildups, rows are buildup_results columns."""
+        if not rows:
+            return
+        with self._db.session() as session:
+            session.execute(delete(BuildupResult).where(BuildupResult.buildup_id.in_([row["buildup_id"] for row in rows])))
+            session.execute(insert(BuildupResult), rows)
+
+    def touch_results(self, ids: List[int], products_stamp: str) -> None:
+        """Mark the results of these buildups as checked against this product stamp."""
+        if not ids:
+            return
+        with self._db.session() as session:
+            session.execute(update(BuildupResult).where(BuildupResult.buildup_id.in_(ids)).values(products_stamp=products_stamp))
@@ -1,9 +1,297 @@
 # app/infrastructure/persistence/repositories/product/product_read_repository.py
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, column, func, literal_column, or_, select, table, true, tuple_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import load_only
+
 from app.infrastructure.persistence.contexts.dbcontext import DBContext
-from app.core.domain.entities import Product
+from app.core.application.dtos.page.page_dto import Page_DTO
+from app.core.domain.entities import Product, ProductImpact
+from app.core.domain.entities.product_search import (PRODUCT_SEARCH_COLUMNS, PRODUCT_SEARCH_TABLE,
+                                                     PRODUCT_SEARCH_WEIGHTS)
 from app.core.application.repositories.product.iproduct_read_repository import IProductReadRepository
 from app.infrastructure.persistence.repositories.base.read_repository import ReadRepository
 
+# innodb_ft_min_token_size, shorter words are not in a mysql FULLTEXT index
+MYSQL_MIN_TOKEN_SIZE = 3
+
+
+def search_terms(query: str) -> List[str]:
+    """The words of a search query, "Transportbeton C30/37" -> ["transportbeton", "c30", "37"]."""
+    return re.findall(r"\w+", query.lower())
+
+
 class ProductReadRepository(ReadRepository[Product], IProductReadRepository):
     def __init__(self, db_context: DBContext):
-        super().__init__(db_context, Product)
\ No newline at end of file
+        super().__init__(db_context, Product)
+
+    def get_versions_by_source(self, epd_sourceName: str) -> Dict[str, List[Tuple[int, str]]]:
+        """Map every epd_id of a source to its stored (id, epd_version) rows, in one query."""
+        with self.db.session() as session:
+            result = session.execute(
+                select(Product.id, Product.epd_id, Product.epd_version)
+                .filter(Product.epd_sourceName == epd_sourceName)
+                .order_by(Product.id)
+            )
+            versions: Dict[str, List[Tuple[int, str]]] = {}
+            for id, epd_id, epd_version in result.all():
+                versions.setdefault(epd_id, []).append((id, epd_version))
+            return versions
+
+    def get_existing_keys(self, keys: List[Tuple[str, str, str]]) -> Set[Tuple[str, str, str]]:
+        """Return which of the (epd_sourceName, epd_id, epd_version) keys are stored, in one query."""
+        if not keys:
+            return set()
+        with self.db.session() as session:
+            result = session.execute(
+                select(Product.epd_sourceName, Product.epd_id, Product.epd_version)
+                .where(tuple_(Product.epd_sourceName, Product.epd_id, Product.epd_version).in_(keys))
+            )
+            return {tuple(row) for row in result.all()}
+
+    def get_by_uri(self, epd_sourceName: str, epd_id: str, epd_version: Optional[str] = None) -> Optional[Product]:
+        """
+        Resolve a product by source and epd id, the latest stored row unless a version is given.
+        Served by the uq_products_source_epd_version and ix_products_source_epd_id indexes.
+        """
+        with self.db.session() as session:
+            query = select(Product).filter(Product.epd_sourceName == epd_sourceName, Product.epd_id == epd_id)
+            if epd_version is not None:
+                query = query.filter(Product.epd_version == epd_version)
+            result = session.execute(query.order_by(Product.id.desc()).limit(1))
+            return result.scalar_one_or_none()
+
+    def get_by_uris(self, uris: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Product]]:
+        """
+        Every stored row of many (epd_sourceName, epd_id) pairs, oldest first, in one IN query
+        on ix_products_source_epd_id. Pairs that are not stored are left out.
+        """
+        if not uris:
+            return {}
+        with self.db.session() as session:
+            result = session.execute(
+                select(Product)
+                .where(tuple_(Product.epd_sourceName, Product.epd_id).in_(list(set(uris))))
+                .order_by(Product.id)
+            )
+            products: Dict[Tuple[str, str], List[Product]] = {}
+            for product in result.scalars().all():
+                products.setdefault((product.epd_sourceName, product.epd_id), []).append(product)
+            return products
+
+    def get_uri_versions(self, uris: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """
+        (id, row_version) of the latest stored row of many (epd_sourceName, epd_id) pairs, what
+        get_by_uris would resolve them to, without loading the rows. Pairs that are not stored are left out.
+        """
+        if not uris:
+            return {}
+        with self.db.session() as session:
+            result = session.execute(
+                select(Product.epd_sourceName, Product.epd_id, Product.id, Product.row_version)
+                .where(tuple_(Product.epd_sourceName, Product.epd_id).in_(list(set(uris))))
+                .order_by(Product.id)
+            )
+            return {(source, epd_id): (id, row_version) for source, epd_id, id, row_version in result.all()}
+
+    def rank_by_impact(
+        self,
+        indicator: str,
+        stage: str,
+        limit: int,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        (product id, value) of one impact indicator and stage, ordered by value, optionally within a range
+        and of the products matching the filters. Served by ix_product_impacts_indicator_stage_value,
+        products are only joined when there is a filter, no epdx is parsed.
+        """
+        with self.db.session() as session:
+            query = select(ProductImpact.product_id, ProductImpact.value).filter(
+                ProductImpact.indicator == indicator, ProductImpact.stage == stage
+            )
+            if any(value is not None for value in (filters or {}).values()):
+                query = self._apply_filters(query.join(Product, Product.id == ProductImpact.product_id), filters)
+            if min_value is not None:
+                query = query.filter(ProductImpact.value >= min_value)
+            if max_value is not None:
+                query = query.filter(ProductImpact.value <= max_value)
+            order = ProductImpact.value.desc() if descending else ProductImpact.value
+            result = session.execute(query.order_by(order, ProductImpact.product_id).limit(limit))
+            return [tuple(row) for row in result.all()]
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Page_DTO:
+        """
+        Products whose name, description, comment or source contain every word of the query as a prefix,
+        best match first. Uses the sqlite fts5 table (bm25) or the mysql FULLTEXT index, other databases
+        fall back to LIKE without ranking. The cursor is the offset of the next page.
+        """
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            offset = -1
+        if offset < 0:
+            raise ValueError("invalid cursor")
+        terms = search_terms(query)
+
+        with self.db.session() as session:
+            dialect = session.get_bind().dialect.name
+            if dialect in ("mysql", "mariadb"):
+                terms = [term for term in terms if len(term) >= MYSQL_MIN_TOKEN_SIZE] or terms
+            if not terms:
+                return Page_DTO(items=[], limit=limit, next_cursor=None)
+
+            stmt = self._apply_filters(select(Product), filters)
+            if columns:
+                stmt = stmt.options(load_only(*(self._column(name) for name in {*columns, "id"}), raiseload=True))
+            if dialect == "sqlite":
+                fts = table(PRODUCT_SEARCH_TABLE, column("rowid"))
+                # every term quoted, so that punctuation is not read as fts5 syntax, and matched as a prefix
+                expression = " ".join(f'"{term}"*' for term in terms)
+                stmt = (
+                    stmt.join(fts, fts.c.rowid == Product.id)
+                    .where(literal_column(PRODUCT_SEARCH_TABLE).op("MATCH")(expression))
+                    .order_by(func.bm25(literal_column(PRODUCT_SEARCH_TABLE), *PRODUCT_SEARCH_WEIGHTS), Product.id)
+                )
+            elif dialect in ("mysql", "mariadb"):
+                score = match(
+                    *(getattr(Product, name) for name in PRODUCT_SEARCH_COLUMNS),
+                    against=" ".join(f"+{term}*" for term in terms),
+                ).in_boolean_mode()
+                stmt = stmt.where(score).order_by(score.desc(), Product.id)
+            else:
+                stmt = stmt.where(and_(*(
+                    or_(*(getattr(Product, name).ilike(f"%{term}%") for name in PRODUCT_SEARCH_COLUMNS))
+                    for term in terms
+                ))).order_by(Product.id)
+
+            # one extra row tells whether there is a next page without counting
+            rows = list(session.execute(stmt.limit(limit + 1).offset(offset)).scalars().all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = str(offset + limit)
+        return Page_DTO(items=rows, limit=limit, next_cursor=next_cursor)
+
+    def get_impact_rows(
+        self,
+        ids: Optional[List[int]] = None,
+        batch_size: int = 1000
+    ) -> Tuple[List[int], List[Tuple[int, str, str, Optional[float]]]]:
+        """
+        The ids of the products that exist, of all products if ids is None, and their product_impacts
+        rows as (product id, indicator, stage, value). Columns only, no entity and no epdx is loaded;
+        ids are looked up batch_size at a time.
+        """
+        with self.db.session() as session:
+            impacts = select(ProductImpact.product_id, ProductImpact.indicator, ProductImpact.stage, ProductImpact.value)
+            if ids is None:
+                return list(session.execute(select(Product.id)).scalars()), [tuple(row) for row in session.execute(impacts)]
+            found: List[int] = []
+            rows: List[Tuple[int, str, str, Optional[float]]] = []
+            wanted = list(dict.fromkeys(ids))
+            for start in range(0, len(wanted), batch_size):
+                chunk = wanted[start:start + batch_size]
+                found.extend(session.execute(select(Product.id).where(Product.id.in_(chunk))).scalars())
+                rows.extend(tuple(row) for row in session.execute(impacts.where(ProductImpact.product_id.in_(chunk))))
+            return found, rows
+
+    def get_column_rows(
+        self,
+        columns: List[str],
+        ids: Optional[List[int]] = None,
+        batch_size: int = 1000
+    ) -> List[Tuple[Any, ...]]:
+        """(id, *columns) of these products, of all products if ids is None, without loading entities."""
+        selected = [Product.id, *(self._column(name) for name in columns)]
+        with self.db.session() as session:
+            if ids is None:
+                return [tuple(row) for row in session.execute(select(*selected).order_by(Product.id))]
+            wanted = list(dict.fromkeys(ids))
+            rows: List[Tuple[Any, ...]] = []
+            for start in range(0, len(wanted), batch_size):
+                query = select(*selected).where(Product.id.in_(wanted[start:start + batch_size]))
+                rows.extend(tuple(row) for row in session.execute(query))
+            return rows
+
+    def get_impact_change_stamp(self) -> str:
+        """
+        get_change_stamp of products joined with one of product_impacts (row count, highest product id
+        and sum of the values), both aggregates from one query. product_impacts can be rebuilt without
+        touching products, the values sum shows a rebuild that rewrites the same rows with other values.
+        """
+        products = select(
+            func.count(Product.id), func.sum(Product.row_version), func.max(Product.id), func.max(Product.updated_at)
+        ).subquery()
+        impacts = select(func.count(), func.max(ProductImpact.product_id), func.sum(ProductImpact.value)).subquery()
+        with self.db.session() as session:
+            row = session.execute(select(products, impacts).select_from(products.join(impacts, true()))).one()
+        return ":".join([Product.__tablename__, *(str(value) for value in row[:4]),
+                         ProductImpact.__tablename__, *(str(value) for value in row[4:])])
+
+    def get_impact_keys(self, indicators: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        """The distinct (indicator, stage) pairs of product_impacts, sorted, optionally of some indicators only."""
+        with self.db.session() as session:
+            query = select(ProductImpact.indicator, ProductImpact.stage).distinct()
+            if indicators:
+                query = query.where(ProductImpact.indicator.in_(indicators))
+            result = session.execute(query.order_by(ProductImpact.indicator, ProductImpact.stage))
+            return [tuple(row) for row in result.all()]
+
+    def stream(
+        self,
+        columns: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        with_impacts: bool = False,
+        indicators: Optional[List[str]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[Tuple[str, str], float]]]:
+        """
+        Every matching product as ({column: value}, {(indicator, stage): value}) in id order, fetched
+        batch_size rows at a time from a server side cursor, so memory does not grow with the catalog.
+        The impacts of each batch come from one IN query on product_impacts, rather than a join that
+        would repeat every product row, epdx and all, once per impact.
+        The query is built, and unknown columns or filters raise, before the first row is fetched;
+        the session stays open until the iterator is exhausted or closed.
+        """
+        selected = [self._column(name) for name in dict.fromkeys(["id", *columns])]
+        query = self._apply_filters(select(*selected), filters).order_by(Product.id)
+        return self._stream(query.execution_options(yield_per=batch_size), [column.key for column in selected], with_impacts, indicators)
+
+    def _stream(
+        self,
+        query,
+        names: List[str],
+        with_impacts: bool,
+        indicators: Optional[List[str]]
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[Tuple[str, str], float]]]:
+        with self.db.session() as session:
+            for rows in session.execute(query).partitions():
+                impacts = self._get_impacts([row[0] for row in rows], indicators) if with_impacts else {}
+                for row in rows:
+                    yield dict(zip(names, row)), impacts.get(row[0], {})
+
+    def _get_impacts(self, ids: List[int], indicators: Optional[List[str]]) -> Dict[int, Dict[Tuple[str, str], float]]:
+        # a session of its own, on mysql the connection of the streaming cursor cannot run another query
+        with self.db.session() as session:
+            query = select(ProductImpact.product_id, ProductImpact.indicator, ProductImpact.stage, ProductImpact.value).where(
+                ProductImpact.product_id.in_(ids)
+            )
+            if indicators:
+                query = query.where(ProductImpact.indicator.in_(indicators))
+            impacts: Dict[int, Dict[Tuple[str, str], float]] = {}
+            for product_id, indicator, stage, value in session.execute(query):
+                impacts.setdefault(product_id, {})[(indicator, stage)] = value
+            return impacts
@@ -1,9 +1,150 @@
 # app/infrastructure/persistence/repositories/product/product_write_repository.py
+import math
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, delete, insert, select, text, tuple_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
 from app.infrastructure.persistence.contexts.dbcontext import DBContext
-from app.core.domain.entities import Product
+from app.core.domain.entities import Product, ProductImpact
+from app.core.domain.entities.product_search import PRODUCT_SEARCH_COLUMNS, PRODUCT_SEARCH_TABLE
 from app.core.application.repositories.product.iproduct_write_repository import IProductWriteRepository
 from app.infrastructure.persistence.repositories.base.write_repository import WriteRepository
 
+
+def impact_rows(product_id: int, epdx: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten epdx["impacts"][indicator][stage] into product_impacts rows, values that are not numbers are left out."""
+    impacts = (epdx or {}).get("impacts") or {}
+    rows = []
+    for indicator, stages in impacts.items():
+        if not isinstance(stages, dict):
+            continue
+        for stage, value in stages.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                continue
+            rows.append({"product_id": product_id, "indicator": indicator, "stage": stage, "value": float(value)})
+    return rows
+
+
 class ProductWriteRepository(WriteRepository[Product], IProductWriteRepository):
     def __init__(self, db_context: DBContext):
-        super().__init__(db_context, Product)
\ No newline at end of file
+        super().__init__(db_context, Product)
+
+    @staticmethod
+    def _insert_ignore(session: Session, table):
+        """An insert that leaves rows colliding with a unique key alone instead of failing the whole statement."""
+        dialect = session.get_bind().dialect.name
+        if dialect == "sqlite":
+            return sqlite_insert(table).on_conflict_do_nothing()
+        if dialect in ("mysql", "mariadb"):
+            key = table.primary_key.columns[0]
+            return mysql_insert(table).on_duplicate_key_update({key.name: key})   # no-op update, keeps the stored row
+        return insert(table)
+
+    @staticmethod
+    def _replace_impacts(session: Session, epdx_by_id: Dict[int, Optional[Dict[str, Any]]]) -> None:
+        """Rewrite the product_impacts rows of the given products from their epdx, in the caller's transaction."""
+        if not epdx_by_id:
+            return
+        session.execute(delete(ProductImpact).where(ProductImpact.product_id.in_(list(epdx_by_id))))
+        rows = [row for id, epdx in epdx_by_id.items() for row in impact_rows(id, epdx)]
+        if rows:
+            session.execute(insert(ProductImpact.__table__), rows)
+
+    @staticmethod
+    def _reindex_search(session: Session, ids: List[int], remove_only: bool = False) -> None:
+        """
+        Copy the searchable text of the given products into the sqlite fts5 table, in the caller's transaction.
+        The mysql FULLTEXT index is maintained by innodb, nothing to do there.
+        """
+        if not ids or session.get_bind().dialect.name != "sqlite":
+            return
+        columns = ", ".join(f'"{column}"' for column in PRODUCT_SEARCH_COLUMNS)
+        session.execute(
+            text(f"DELETE FROM {PRODUCT_SEARCH_TABLE} WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True)),
+            {"ids": ids},
+        )
+        if not remove_only:
+            session.execute(
+                text(
+                    f"INSERT INTO {PRODUCT_SEARCH_TABLE} (rowid, {columns}) SELECT id, {columns} FROM products WHERE id IN :ids"
+                ).bindparams(bindparam("ids", expanding=True)),
+                {"ids": ids},
+            )
+
+    def create(self, product: Product) -> Product:
+        with self._db.session() as session:
+            session.add(product)
+            session.flush()
+            session.refresh(product)
+            self._replace_impacts(session, {product.id: product.epdx})
+            self._reindex_search(session, [product.id])
+            return product
+
+    def update(self, product: Product) -> Product:
+        with self._db.session() as session:
+            merged = session.merge(product)
+            session.flush()
+            self._replace_impacts(session, {merged.id: merged.epdx})
+            self._reindex_search(session, [merged.id])
+            return merged
+
+    def delete(self, id: int) -> None:
+        with self._db.session() as session:
+            # explicitly, sqlite only cascades with foreign keys switched on
+            session.execute(delete(ProductImpact).where(ProductImpact.product_id == id))
+            self._reindex_search(session, [id], remove_only=True)
+            entity = session.execute(select(Product).filter(Product.id == id)).scalar_one()
+            session.delete(entity)
+
+    def update_status(self, ids: List[int], status: str) -> int:
+        """Set the status of many products in a single statement, returns the number of updated rows."""
+        if not ids:
+            return 0
+        with self._db.session() as session:
+            result = session.execute(
+                update(Product).where(Product.id.in_(ids)).values(status=status)
+            )
+            return result.rowcount
+
+    def bulk_insert(self, rows: List[Dict[str, Any]], skip_conflicts: bool = True) -> int:
+        """
+        Insert many products with one executemany, returns the number of inserted rows.
+        With skip_conflicts rows that collide with a unique key are left alone instead of failing
+        the whole statement; without it the statement inserts every row or raises and inserts none.
+        The product_impacts rows and the search index are written in the same transaction.
+        """
+        if not rows:
+            return 0
+        with self._db.session() as session:
+            statement = self._insert_ignore(session, Product.__table__) if skip_conflicts else insert(Product.__table__)
+            result = session.execute(statement, rows)
+            inserted = result.rowcount
+
+            epdx_by_key = {(row["epd_sourceName"], row["epd_id"], row["epd_version"]): row.get("epdx") for row in rows}
+            ids = session.execute(
+                select(Product.id, Product.epd_sourceName, Product.epd_id, Product.epd_version)
+                .where(tuple_(Product.epd_sourceName, Product.epd_id, Product.epd_version).in_(list(epdx_by_key)))
+            ).all()
+            impacts = [impact for id, *key in ids for impact in impact_rows(id, epdx_by_key[tuple(key)])]
+            if impacts:
+                # products that were already stored keep their impacts
+                session.execute(self._insert_ignore(session, ProductImpact.__table__), impacts)
+            self._reindex_search(session, [id for id, *_ in ids])
+            return inserted
+
+    def rebuild_impacts(self, batch_size: int = 500) -> int:
+        """Rewrite product_impacts for every product from its epdx, batch by batch, returns the number of products."""
+        last_id, products = 0, 0
+        while True:
+            with self._db.session() as session:
+                batch = session.execute(
+                    select(Product.id, Product.epdx).where(Product.id > last_id).order_by(Product.id).limit(batch_size)
+                ).all()
+                if not batch:
+                    return products
+                self._replace_impacts(session, {id: epdx for id, epdx in batch})
+            last_id = batch[-1].id
+            products += len(batch)
@@ -1,29 +1,43 @@
 #backend/app/infrastructure/persistence/services/buildup_service.py
 
-from typing import Collection, List, Optional, TypeVar, Union
+import hashlib
+import json
+import math
+from typing import Any, Collection, Dict, List, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 
 from app.core.application.dtos.buildup.buildup_dto import BuildupCreate_DTO, BuildupResponse_DTO, BuildupUpdate_DTO, MappedBuildup_DTO
+from app.core.application.dtos.buildup.buildup_impact_dto import BuildupImpact_DTO, ProductContribution_DTO
+from app.core.application.dtos.product.product_dto import Product_DTO
 from app.core.application.mappers.ibuildup_mapper import IBuildupMapper
 from app.core.application.repositories.buildup.ibuildup_read_repository import IBuildupReadRepository
 from app.core.application.repositories.buildup.ibuildup_write_repository import IBuildupWriteRepository
 from app.core.application.services.ibuildup_service import IBuildupService
 from app.core.application.services.iproduct_service import IProductService
+from app.core.domain.values.impact_vector import ImpactVector, _key
 
 
 T = TypeVar ('T', BuildupResponse_DTO, BuildupCreate_DTO, BuildupUpdate_DTO, MappedBuildup_DTO)
 
+# part of every stored result's fingerprint, raise it when _calculate changes so older results are recomputed
+RESULTS_VERSION = 2
+
 class BuildupService(IBuildupService):
     def __init__(
         self,
         buildup_read_repository: IBuildupReadRepository,
         buildup_write_repository: IBuildupWriteRepository,
         buildup_mapper : IBuildupMapper,
-        product_service : IProductService
+        product_service : IProductService,
+        materialise_results : bool = True
     ):
         self._read_repo = buildup_read_repository
         self._write_repo = buildup_write_repository
         self._mapper = buildup_mapper
         self._product_service = product_service
+        self._materialise_results = materialise_results
 
     def _validate_buildup(self, buildup_dto : Union[BuildupCreate_DTO, BuildupUpdate_DTO]):
         # insert buildup validation logic here
@@ -45,8 +59,237 @@ class BuildupService(IBuildupService):
         # all products should have valid date
         return True
 
-    def get_impact_from_buildup_dto(self, buildup_dto : Union[BuildupResponse_DTO, MappedBuildup_DTO]):
-        pass
+    @staticmethod
+    def _is_number(value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+    @staticmethod
+    def _element_id(meta_data: Any) -> Optional[str]:
+        # meta_data of an override is sometimes stored as a json string
+        if isinstance(meta_data, str):
+            try:
+                meta_data = json.loads(meta_data)
+            except ValueError:
+                return None
+        return meta_data.get("model_mapping_element_id") if isinstance(meta_data, dict) else None
+
+    def _resolve_references(self, buildup_dtos: List[Any]) -> Dict[str, Union[Tuple[Product_DTO, ImpactVector], str]]:
+        """
+        The stored product and the impact vector of its validated epdx for every uri referenced by
+        the buildups, from one batch query, or why it could not be used. Like the client, a reference
+        resolves to the latest stored version of its uri.
+        """
+        uris = sorted({uri for buildup_dto in buildup_dtos for uri in self._uris(buildup_dto)})
+        if not uris:
+            return {}
+        batch = self._product_service.get_products_by_uris([(uri, None) for uri in uris])
+        resolved: Dict[str, Union[Tuple[Product_DTO, ImpactVector], str]] = {}
+        for uri in uris:
+            product_dto = batch.products.get(uri)
+            if product_dto is None:
+                resolved[uri] = f"product {uri} is not stored" if uri in batch.missing else f"invalid uri {uri}"
+                continue
+            try:
+                resolved[uri] = (product_dto, self._product_service.get_impact_vector_from_product_dto(product_dto))
+            except Exception as e:
+                resolved[uri] = f"product {uri} has no valid epdx: {type(e).__name__}"
+        return resolved
+
+    @classmethod
+    def _uris(cls, buildup_dto: Any) -> List[str]:
+        """The uris of the products the buildup references, sorted."""
+        return sorted({
+            product.get("uri") for product in cls._products(buildup_dto).values()
+            if product.get("type") == "reference" and isinstance(product.get("uri"), str)
+        })
+
+    @staticmethod
+    def _products(buildup_dto: Any) -> Dict[str, Dict]:
+        products = getattr(buildup_dto, "products", None) or {}
+        return {
+            key: product.model_dump(by_alias=True, mode="json") if isinstance(product, BaseModel) else product
+            for key, product in products.items() if isinstance(product, (dict, BaseModel))
+        }
+
+    def _calculate(
+        self,
+        buildup_dto: Any,
+        references: Dict[str, Union[Tuple[Product_DTO, ImpactVector], str]],
+        indicators: Optional[List[str]],
+        with_contributions: bool
+    ) -> BuildupImpact_DTO:
+        results = getattr(buildup_dto, "results", None) or {}
+        impact = BuildupImpact_DTO(
+            id=buildup_dto.id, name=buildup_dto.name, quantity=getattr(buildup_dto, "quantity", None),
+            unit=getattr(getattr(buildup_dto, "unit", None), "value", getattr(buildup_dto, "unit", None)),
+        )
+        vectors = []
+        for key, product in self._products(buildup_dto).items():
+            result = results.get(key)
+            quantity = result.get("quantity") if isinstance(result, dict) else None
+            if not self._is_number(quantity):
+                impact.errors[key] = "no quantity in results"
+                continue
+
+            contribution = ProductContribution_DTO(key=key, type=str(product.get("type")), quantity=quantity)
+            if product.get("type") == "reference":
+                contribution.uri = product.get("uri")
+                contribution.element_id = self._element_id((product.get("overrides") or {}).get("meta_data"))
+                reference = references.get(contribution.uri, f"invalid uri {contribution.uri}")
+                if isinstance(reference, str):
+                    impact.errors[key] = reference
+                    continue
+                product_dto, vector = reference
+                contribution.product_id = product_dto.id
+                contribution.epd_version = product_dto.epd_version
+                contribution.name = product_dto.epd_name
+                contribution.declared_unit = product_dto.epd_declaredUnit
+            elif product.get("type") == "actual":
+                vector = ImpactVector.from_impacts(product.get("impacts"))
+                contribution.element_id = self._element_id(product.get("metaData", product.get("meta_data")))
+                contribution.name = product.get("name")
+                contribution.declared_unit = product.get("declaredUnit", product.get("declared_unit"))
+            else:
+                impact.errors[key] = f"unsupported product type {product.get('type')}"
+                continue
+
+            vector = vector.scale(quantity)
+            if indicators:
+                vector = vector.select(indicators=indicators)
+            vectors.append(vector)
+            if with_contributions:
+                contribution.stages, contribution.phases = vector.to_dict(), vector.phases_to_dict()
+                impact.contributions.append(contribution)
+
+        total = ImpactVector.sum(vectors)
+        impact.stages, impact.phases = total.to_dict(), total.phases_to_dict()
+        impact.complete = not impact.errors
+        return impact
+
+    def get_impacts_from_buildup_dtos(
+        self,
+        buildup_dtos: List[Union[BuildupResponse_DTO, MappedBuildup_DTO]],
+        indicators: Optional[List[str]] = None,
+        with_contributions: bool = True
+    ) -> List[BuildupImpact_DTO]:
+        """
+        Impact totals per indicator and stage and per life cycle phase of each buildup, the products
+        multiplied by their results quantities. The referenced products of all buildups are resolved
+        in one batch; products that cannot be used are listed in errors and left out of the totals.
+        """
+        references = self._resolve_references(buildup_dtos)
+        return [self._calculate(buildup_dto, references, indicators, with_contributions) for buildup_dto in buildup_dtos]
+
+    def get_impact_from_buildup_dto(
+        self,
+        buildup_dto : Union[BuildupResponse_DTO, MappedBuildup_DTO],
+        indicators: Optional[List[str]] = None,
+        with_contributions: bool = True
+    ) -> BuildupImpact_DTO:
+        return self.get_impacts_from_buildup_dtos([buildup_dto], indicators, with_contributions)[0]
+
+    @staticmethod
+    def _fingerprint(buildup_version: int, uris: List[str], versions: Dict[str, str]) -> str:
+        """Of everything a result is computed from: the buildup, and the product row each of its uris resolves to."""
+        inputs = [RESULTS_VERSION, buildup_version, [[uri, versions.get(uri)] for uri in uris]]
+        return hashlib.sha256(json.dumps(inputs).encode()).hexdigest()
+
+    @staticmethod
+    def _view(impact: BuildupImpact_DTO, indicators: Optional[List[str]], with_contributions: bool) -> BuildupImpact_DTO:
+        """A stored result, which has every indicator and the contributions, as get_impacts_from_buildup_dtos would return it."""
+        if indicators:
+            keys = {_key(indicator) for indicator in indicators}
+            impact.stages = {name: values for name, values in impact.stages.items() if name in keys}
+            impact.phases = {name: values for name, values in impact.phases.items() if name in keys}
+            for contribution in impact.contributions:
+                contribution.stages = {name: values for name, values in contribution.stages.items() if name in keys}
+                contribution.phases = {name: values for name, values in contribution.phases.items() if name in keys}
+        if not with_contributions:
+            impact.contributions = []
+        return impact
+
+    def _compute_results(self, ids: List[int], products_stamp: Optional[str]) -> Dict[int, BuildupImpact_DTO]:
+        """
+        Compute and store the results of these buildups, ids that do not exist are left out.
+        products_stamp has to be read before this is called, and the product versions are read
+        before the products are resolved, so that a product written in between shows as a change.
+        """
+        entities, buildup_dtos = [], []
+        for entity in self._read_repo.get_by_ids(ids):
+            buildup_dto = self._mapper.buildup_response_from_entity(entity)
+            if buildup_dto is not None:
+                entities.append(entity)
+                buildup_dtos.append(buildup_dto)
+        uris = {entity.id: self._uris(buildup_dto) for entity, buildup_dto in zip(entities, buildup_dtos)}
+        versions = self._product_service.get_uri_versions(sorted({uri for entity_uris in uris.values() for uri in entity_uris}))
+        impacts = {impact.id: impact for impact in self.get_impacts_from_buildup_dtos(buildup_dtos)}
+        rows = [{
+            "buildup_id": entity.id,
+            "buildup_version": entity.row_version,
+            "products_stamp": products_stamp,
+            "fingerprint": self._fingerprint(entity.row_version, uris[entity.id], versions),
+            "uris": uris[entity.id],
+            "impacts": impacts[entity.id].model_dump(mode="json"),
+        } for entity in entities]
+        try:
+            self._write_repo.save_results(rows)
+        except IntegrityError as e:
+            # another request stored them first, or the buildup was deleted; these are served all the same
+            print(f"error storing buildup results: {str(e)}")
+        return impacts
+
+    def _get_results(self, ids: List[int]) -> Dict[int, BuildupImpact_DTO]:
+        """
+        The full results of the stored buildups, from buildup_results while their fingerprint
+        holds. While neither the buildup nor the product table changed that takes one query and
+        one product stamp; after product writes the uris of the stored results are checked in one
+        more query, and only buildups whose inputs changed are computed again.
+        """
+        products_stamp = self._product_service.get_change_stamp()
+        stored, unchecked, stale = {}, [], []
+        for id, version, result in self._read_repo.get_results(ids):
+            if result is None or result.buildup_version != version:
+                stale.append(id)
+            elif result.products_stamp == products_stamp:
+                stored[id] = result
+            else:
+                unchecked.append(result)
+        if unchecked:
+            versions = self._product_service.get_uri_versions(sorted({uri for result in unchecked for uri in result.uris}))
+            for result in unchecked:
+                if result.fingerprint == self._fingerprint(result.buildup_version, result.uris, versions):
+                    stored[result.buildup_id] = result
+                else:
+                    stale.append(result.buildup_id)
+            self._write_repo.touch_results([result.buildup_id for result in unchecked if result.buildup_id in stored], products_stamp)
+        impacts = {id: BuildupImpact_DTO.model_validate(result.impacts) for id, result in stored.items()}
+        if stale:
+            impacts.update(self._compute_results(stale, products_stamp))
+        return impacts
+
+    def get_buildup_impacts(
+        self,
+        ids: List[int],
+        indicators: Optional[List[str]] = None,
+        with_contributions: bool = True
+    ) -> Dict[int, BuildupImpact_DTO]:
+        """
+        The impacts of the stored buildups with these ids, ids that do not exist are left out.
+        With materialise_results they are read from buildup_results and only computed again after
+        the buildup, a product it references or the product a reference resolves to changed.
+        """
+        if not self._materialise_results:
+            buildup_dtos = [self._mapper.buildup_response_from_entity(entity) for entity in self._read_repo.get_by_ids(ids)]
+            impacts = self.get_impacts_from_buildup_dtos([dto for dto in buildup_dtos if dto is not None], indicators, with_contributions)
+            return {impact.id: impact for impact in impacts}
+        return {id: self._view(impact, indicators, with_contributions) for id, impact in self._get_results(ids).items()}
+
+    def get_impact_stamp(self, id: int) -> Optional[str]:
+        """Changes whenever the buildup or any product changes, None if the buildup does not exist."""
+        stamp = self._read_repo.get_change_stamp(id)
+        if stamp is None:
+            return None
+        return f"{stamp}|{self._product_service.get_change_stamp()}"
 
     def get_all_buildups(self) -> Optional[List[BuildupResponse_DTO]] :
         entity_list= self._read_repo.get_all()
@@ -101,6 +344,10 @@ class BuildupService(IBuildupService):
         except Exception as e:
             print(f"error creating buildup {buildup_dto.name}: {str(e)}")
    
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        """Changes whenever the buildups (or the buildup with this id) change, for conditional GETs."""
+        return self._read_repo.get_change_stamp(id)
+
     def get_buildup_by_id(self, id: int):
         entity = self._read_repo.get_by_id(id)
         return self._mapper.buildup_response_from_entity(entity)
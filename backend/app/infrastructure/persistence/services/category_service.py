@@ -79,6 +79,10 @@ class CategoryService(ICategoryService):
             for category_entity in category_entity_list
         ]
 
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        """Changes whenever the categories (or the category with this id) change, for conditional GETs."""
+        return self._read_repo.get_change_stamp(id)
+
     def get_category_property_by_id(
         self, categoryResponseDTO: CategoryResponseDTO, property_id: int
     ) -> CategoryProperty:
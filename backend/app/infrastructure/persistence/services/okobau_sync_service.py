@@ -0,0 +1,92 @@
+# app/infrastructure/persistence/services/okobau_sync_service.py
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import Config
+from app.core.application.dtos.okobau.okobau_dto import EPDResponse, OkobauSyncReport_DTO
+from app.core.application.services.iepdx_service import IEpdxService
+from app.core.application.services.iokobau_service import IOkobauService
+from app.core.application.services.iokobau_sync_service import IOkobauSyncService
+from app.core.application.services.iproduct_service import IProductService
+
+RETIRED_STATUS = "retired"
+
+
+class OkobauSyncService(IOkobauSyncService):
+    """Brings the products table in line with the okobaudat datastock, fetching only new or changed EPDs."""
+    def __init__(
+        self,
+        okobau_service: IOkobauService,
+        epdx_service: IEpdxService,
+        product_service: IProductService
+    ):
+        self._okobau_service = okobau_service
+        self._epdx_service = epdx_service
+        self._product_service = product_service
+
+    def diff(self, remote_epds: Iterable[EPDResponse]) -> Tuple[List[EPDResponse], List[Tuple[EPDResponse, int]], List[Tuple[str, List[int]]], int]:
+        """
+        Compare the remote (uuid, version) list with the stored products of the source.
+
+        Returns:
+            new epds, changed epds with the id of the product row to update,
+            retired uuids with their product ids, and the number of unchanged epds.
+        """
+        local = self._product_service.get_product_versions_by_source(Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME)
+        new: List[EPDResponse] = []
+        changed: List[Tuple[EPDResponse, int]] = []
+        unchanged = 0
+        seen = set()
+        for epd in remote_epds:
+            seen.add(epd.uuid)
+            rows = local.get(epd.uuid)
+            if not rows:
+                new.append(epd)
+            elif epd.version in {version for _, version in rows}:
+                unchanged += 1
+            else:
+                changed.append((epd, rows[-1][0]))   # update the most recent row of that uuid
+        retired = [(uuid, [id for id, _ in rows]) for uuid, rows in local.items() if uuid not in seen]
+        return new, changed, retired, unchanged
+
+    def sync(self, user_id: Optional[int] = None, mark_retired: bool = False, dry_run: bool = False) -> OkobauSyncReport_DTO:
+        start_time = time.perf_counter()
+        new, changed, retired, unchanged = self.diff(self._okobau_service.iter_epd_responses())
+        report = OkobauSyncReport_DTO(retired=[uuid for uuid, _ in retired], unchanged=unchanged, dry_run=dry_run)
+        if dry_run:
+            report.added = [epd.uuid for epd in new]
+            report.updated = [epd.uuid for epd, _ in changed]
+            return report
+
+        update_ids: Dict[str, int] = {epd.uuid: id for epd, id in changed}
+        for result in self._okobau_service.iter_epdx([*new, *(epd for epd, _ in changed)]):
+            uuid = result.item.uuid
+            if not result.ok:
+                report.failed[uuid] = f"{result.error_type}: {result.error}"
+                continue
+            try:
+                product_dto = self._epdx_service.from_epdx_to_product(result.value)
+                if uuid in update_ids:
+                    existing = self._product_service.get_product_by_id(update_ids[uuid])
+                    product_dto.user_id_created = existing.user_id_created if existing else user_id
+                    product_dto.user_id_updated = user_id
+                    saved = self._product_service.update_product(update_ids[uuid], product_dto)
+                    target = report.updated
+                else:
+                    saved = self._product_service.create_product_from_dto(product_dto, user_id=user_id)
+                    target = report.added
+                if saved is None:
+                    report.failed[uuid] = "product failed validation"
+                else:
+                    target.append(uuid)
+            except Exception as e:
+                report.failed[uuid] = f"{type(e).__name__}: {e}"
+
+        if mark_retired:
+            self._product_service.set_products_status([id for _, ids in retired for id in ids], RETIRED_STATUS)
+
+        time_diff = time.perf_counter() - start_time
+        print(
+            f"syncing okobaudat took: {int(time_diff // 60)} minutes and {int(time_diff % 60)} seconds"
+        )
+        return report
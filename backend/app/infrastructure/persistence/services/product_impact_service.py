@@ -0,0 +1,169 @@
+# app/infrastructure/persistence/services/product_impact_service.py
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.application.dtos.epdx.epdx_dto import ConversionType
+from app.core.application.dtos.product.product_dto import ProductImpactTable_DTO
+from app.core.application.repositories.product.iproduct_read_repository import IProductReadRepository
+from app.core.application.services.iproduct_impact_service import IProductImpactService
+from app.core.domain.values.impact_matrix import TABLE_REDUCTIONS, ImpactMatrix
+from app.core.domain.values.unit_conversion import conversion_factors
+
+# product columns holding a conversion, by ConversionType name, as EpdxMapper.to_epdx writes them
+CONVERSION_COLUMNS: Dict[str, str] = {
+    "epd_linear_density": ConversionType.LINEAR_DENSITY.value,
+    "epd_gross_density": ConversionType.GROSS_DENSITY.value,
+    "epd_grammage": ConversionType.GRAMMAGE.value,
+    "epd_layer_thickness": ConversionType.LAYER_THICKNESS.value,
+    "epd_bulk_density": ConversionType.BULK_DENSITY.value,
+    "epd_weight_per_piece": ConversionType.WEIGHT_PER_PIECE.value,
+}
+
+
+class _UnitTable:
+    """Declared unit and conversion parameters of the rows of a matrix, nan where a product has none."""
+    __slots__ = ("declared", "parameters")
+
+    def __init__(self, ids: np.ndarray, rows: Sequence[Tuple[Any, ...]]):
+        self.declared = np.full(len(ids), None, dtype=object)
+        self.parameters = {name: np.full(len(ids), np.nan) for name in CONVERSION_COLUMNS.values()}
+        if not rows or not len(ids):
+            return
+        row_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        positions = np.minimum(np.searchsorted(ids, row_ids), len(ids) - 1)
+        found = ids[positions] == row_ids
+        positions = positions[found]
+        rows = [row for row, keep in zip(rows, found.tolist()) if keep]
+        self.declared[positions] = [row[1] for row in rows]
+        for index, name in enumerate(CONVERSION_COLUMNS.values(), start=2):
+            self.parameters[name][positions] = np.array([row[index] for row in rows], dtype=np.float64)
+
+    def factors(self, to_unit: Any) -> Tuple[np.ndarray, Dict[int, str]]:
+        """Per row, how many declared units one to_unit is, nan with the reason by row where there is no conversion."""
+        return conversion_factors([to_unit] * len(self.declared), self.declared.tolist(), self.parameters)
+
+    def take(self, positions: np.ndarray) -> "_UnitTable":
+        table = _UnitTable.__new__(_UnitTable)
+        table.declared = self.declared[positions]
+        table.parameters = {name: values[positions] for name, values in self.parameters.items()}
+        return table
+
+
+class ProductImpactService(IProductImpactService):
+    """
+    Impacts of many products at once, from product_impacts rather than one parsed epdx per product.
+    With cache_catalog the impacts of the whole catalog are kept as one ImpactMatrix, with the
+    declared units and conversion columns of its products, rebuilt when the change stamp of products
+    or product_impacts moves, and a request only slices and scales it; without it every request loads
+    its products.
+    """
+    def __init__(
+        self,
+        product_read_repository: IProductReadRepository,
+        cache_catalog: bool = True,
+        batch_size: int = 1000
+    ):
+        self._read_repo = product_read_repository
+        self._cache_catalog = cache_catalog
+        self._batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._catalog: Optional[Tuple[str, ImpactMatrix, _UnitTable]] = None    # change stamp, matrix, units
+
+    def _load(self, ids: Optional[List[int]]) -> Tuple[ImpactMatrix, _UnitTable]:
+        matrix = ImpactMatrix.from_rows(*self._read_repo.get_impact_rows(ids, self._batch_size))
+        rows = self._read_repo.get_column_rows(["epd_declaredUnit", *CONVERSION_COLUMNS], ids, self._batch_size)
+        return matrix, _UnitTable(matrix.ids, rows)
+
+    def _get_catalog(self) -> Tuple[ImpactMatrix, _UnitTable]:
+        # product_impacts too, flask seed product-impacts rewrites it without changing products
+        stamp = self._read_repo.get_impact_change_stamp()
+        with self._lock:
+            if self._catalog is not None and self._catalog[0] == stamp:
+                return self._catalog[1], self._catalog[2]
+        # loaded outside the lock, two threads may both load a changed catalog once
+        matrix, units = self._load(None)
+        with self._lock:
+            self._catalog = (stamp, matrix, units)
+        return matrix, units
+
+    def _get_matrix(self, ids: Optional[Sequence[int]]) -> Tuple[ImpactMatrix, _UnitTable, List[int]]:
+        if ids is not None:
+            ids = list(dict.fromkeys(ids))
+        matrix, units = self._get_catalog() if self._cache_catalog else self._load(ids)
+        if ids is None:
+            return matrix, units, []
+        positions, missing = matrix.positions(ids)
+        taken, _ = matrix.take(ids)
+        return taken, units.take(positions), missing
+
+    def get_impact_matrix(self, ids: Optional[Sequence[int]] = None) -> Tuple[ImpactMatrix, List[int]]:
+        """The impacts of these products in the given order, of the whole catalog if ids is None, and the ids not stored."""
+        matrix, _, missing = self._get_matrix(ids)
+        return matrix, missing
+
+    @staticmethod
+    def _factors(ids: np.ndarray, quantities: Optional[Mapping[int, float]], conversion_factors: Optional[Mapping[int, float]]) -> Optional[np.ndarray]:
+        """Quantity x conversion factor per row, 1 where a product has none, nan where it is None."""
+        if not quantities and not conversion_factors:
+            return None
+        factors = np.ones(len(ids))
+        for mapping in (quantities, conversion_factors):
+            if mapping:
+                values = (mapping.get(id, 1.0) for id in ids.tolist())
+                factors *= np.fromiter((np.nan if value is None else value for value in values), dtype=np.float64, count=len(ids))
+        return factors
+
+    def evaluate_matrix(
+        self,
+        ids: Optional[Sequence[int]] = None,
+        quantities: Optional[Mapping[int, float]] = None,
+        conversion_factors: Optional[Mapping[int, float]] = None,
+        indicators: Optional[Sequence[Any]] = None,
+        stages: Optional[Sequence[Any]] = None,
+        to_unit: Optional[Any] = None
+    ) -> Tuple[ImpactMatrix, List[int], Dict[int, str]]:
+        """
+        The impacts of the products multiplied by their quantity and conversion factor, keyed by
+        product id, on the selected indicators and stages, the ids not stored and the products that
+        could not be converted. With to_unit the quantities are in that unit, and every product's
+        impacts per declared unit are converted to it over its conversion columns, one compiled
+        conversion per group of products with the same declared unit and conversions.
+        A factor that is None or not finite, or a failed conversion, leaves the row undeclared.
+        """
+        matrix, units, missing = self._get_matrix(ids)
+        factors = self._factors(matrix.ids, quantities, conversion_factors)
+        errors: Dict[int, str] = {}
+        if to_unit is not None:
+            # impacts per declared unit times declared units per to_unit
+            unit_factors, failed = units.factors(to_unit)
+            factors = unit_factors if factors is None else factors * unit_factors
+            errors = {int(matrix.ids[row]): reason for row, reason in failed.items()}
+        return matrix.evaluate(factors, indicators, stages), missing, errors
+
+    def evaluate_impacts(
+        self,
+        ids: Optional[Sequence[int]] = None,
+        quantities: Optional[Mapping[int, float]] = None,
+        conversion_factors: Optional[Mapping[int, float]] = None,
+        indicators: Optional[Sequence[Any]] = None,
+        stages: Optional[Sequence[Any]] = None,
+        by: str = "total",
+        to_unit: Optional[Any] = None
+    ) -> ProductImpactTable_DTO:
+        """evaluate_matrix flattened to a table by indicator, phase or stage, see ImpactMatrix.table."""
+        if by not in TABLE_REDUCTIONS:
+            raise ValueError(f"by must be one of {', '.join(TABLE_REDUCTIONS)}")
+        matrix, missing, errors = self.evaluate_matrix(ids, quantities, conversion_factors, indicators, stages, to_unit)
+        columns, values, mask = matrix.table(by)
+        cells = values.astype(object)
+        cells[~mask] = None
+        # built from checked arrays, validating every cell again would cost more than the evaluation
+        return ProductImpactTable_DTO.model_construct(by=by, columns=columns, product_ids=matrix.ids.tolist(), values=cells.tolist(),
+                                                      missing=missing, errors=errors)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalog = None
+
@@ -1,20 +1,26 @@
 # app/infrastructure/persistence/services/product_service.py
 import json
 import time
-from typing import Collection, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from app.core.application.dtos.epdx.epdx_dto import EPD, Conversion, ConversionUnit, ImpactCategoryKey, LifeCycleStage
+from app.core.application.dtos.page.page_dto import Page_DTO
 from app.core.application.dtos.product.product_dto import (Product_DTO,
+                                                           ProductBulkReport_DTO,
                                                            ProductDensity_DTO,
                                                            ProductEPD_DTO,
-                                                           ProductHeader_DTO)
+                                                           ProductHeader_DTO,
+                                                           ProductImpactRank_DTO,
+                                                           ProductUriBatch_DTO)
 from app.core.application.mappers.iproduct_mapper import IProductMapper
 from app.core.application.repositories.product.iproduct_read_repository import \
     IProductReadRepository
 from app.core.application.repositories.product.iproduct_write_repository import \
     IProductWriteRepository
+from app.core.application.services.iepd_cache_service import IEpdCacheService
 from app.core.application.services.iepdx_service import IEpdxService
 from app.core.application.services.iproduct_service import IProductService
+from app.core.domain.values.impact_vector import ImpactVector
 
 
 class ProductService(IProductService):
@@ -23,12 +29,18 @@ class ProductService(IProductService):
         product_read_repository: IProductReadRepository,
         product_write_repository: IProductWriteRepository,
         product_mapper : IProductMapper,
-        epdx_service: IEpdxService
+        epdx_service: IEpdxService,
+        bulk_batch_size: int = 500,
+        epd_cache_service: Optional[IEpdCacheService] = None,
+        stream_batch_size: int = 1000
     ):
         self._read_repo = product_read_repository
         self._write_repo = product_write_repository
         self._product_mapper = product_mapper
         self._epdx_service = epdx_service
+        self._bulk_batch_size = max(1, bulk_batch_size)
+        self._epd_cache = epd_cache_service
+        self._stream_batch_size = max(1, stream_batch_size)
         
     
 
@@ -56,40 +68,191 @@ class ProductService(IProductService):
     conversion : Conversion = None,
     conversion_factor : float = 1,    #give the option to just provide a factor, if available. 
     normalize_to : float = 1 ) -> float:
-        epd = EPD.model_validate(EPD(**product_dto.epdx))
-        return self._epdx_service.get_impact_value_from_EPD(epd, impact, life_cycle_stages, conversion, conversion_factor, normalize_to)
+        # one cache lookup for both, or one validation without the cache
+        if self._epd_cache is None:
+            epd = EPD.model_validate(product_dto.epdx)
+            impact_vector = ImpactVector.from_epd(epd)
+        else:
+            epd, impact_vector = self._epd_cache.get_epd_and_impact_vector(product_dto)
+        return self._epdx_service.get_impact_value_from_EPD(epd, impact, life_cycle_stages, conversion, conversion_factor, normalize_to,
+                                                            impact_vector=impact_vector)
+
+
+    def get_epd_from_product_dto(self, product_dto : Product_DTO) -> EPD:
+        """The validated epdx of a product, from the parsed epd cache for stored products."""
+        if self._epd_cache is None:
+            return EPD.model_validate(product_dto.epdx)
+        return self._epd_cache.get_epd(product_dto)
 
+    def get_impact_vector_from_product_dto(self, product_dto : Product_DTO) -> ImpactVector:
+        """The impacts of a product as an ImpactVector, built once per cached epd."""
+        if self._epd_cache is None:
+            return ImpactVector.from_epd(self.get_epd_from_product_dto(product_dto))
+        return self._epd_cache.get_impact_vector(product_dto)
+
+    def get_epd_cache_stats(self) -> Dict[str, Any]:
+        return self._epd_cache.get_stats() if self._epd_cache is not None else {}
 
     def get_product_by_dto(self, product_dto : ProductHeader_DTO) ->  Optional[Product_DTO]:
-        existing_product_list = self._read_repo.filter(epd_sourceName = product_dto.epd_sourceName, epd_id = product_dto.epd_id, epd_version = product_dto.epd_version)
-        if len(existing_product_list) > 0:
-            return [self._product_mapper.entity_to_product_dto(existing_product) for existing_product in existing_product_list]
+        entity = self._read_repo.get_by_uri(product_dto.epd_sourceName, product_dto.epd_id, product_dto.epd_version)
+        if entity:
+            return self._product_mapper.entity_to_product_dto(entity)
     
     def get_all_products(self) -> List[Product_DTO]:
         entity_list= self._read_repo.get_all()
         return [self._product_mapper.entity_to_product_dto(entity) for entity in entity_list]
     
+    def get_products_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False
+    ) -> Page_DTO:
+        page = self._read_repo.get_page(limit, cursor, sort_by, descending, filters, include_total)
+        page.items = [self._product_mapper.entity_to_product_dto(entity) for entity in page.items]
+        return page
+
+    def get_product_headers_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False
+    ) -> Page_DTO:
+        """Like get_products_page, without loading the epdx column."""
+        page = self._read_repo.get_page(
+            limit, cursor, sort_by, descending, filters, include_total, columns=self._product_mapper.header_columns()
+        )
+        page.items = [self._product_mapper.entity_to_product_header_dto(entity) for entity in page.items]
+        return page
+
+    def search_products(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Page_DTO:
+        """Full-text search over the product headers, best match first."""
+        page = self._read_repo.search(query, limit, cursor, filters, columns=self._product_mapper.header_columns())
+        page.items = [self._product_mapper.entity_to_product_header_dto(entity) for entity in page.items]
+        return page
+
+    def rank_products_by_impact(
+        self,
+        indicator: str,
+        stage: str,
+        limit: int,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ProductImpactRank_DTO]:
+        """The product headers ordered by their value of one indicator and stage, from product_impacts and the header columns."""
+        ranked = self._read_repo.rank_by_impact(indicator, stage, limit, min_value, max_value, descending, filters)
+        columns = self._product_mapper.header_columns()
+        headers = {row[0]: dict(zip(columns, row[1:])) for row in self._read_repo.get_column_rows(columns, [id for id, _ in ranked])}
+        return [
+            ProductImpactRank_DTO(value=value, product=ProductHeader_DTO.model_validate(headers[id]))
+            for id, value in ranked if id in headers
+        ]
+
+    def export_products(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        with_impacts: bool = False,
+        indicators: Optional[List[str]] = None
+    ) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """
+        The field names and a lazy iterator of flat rows of every matching product, for exports.
+        Impacts are flattened into one "<indicator>.<stage>" field per pair found in product_impacts.
+        Rows are read from the database as they are consumed, unknown columns raise ValueError up front.
+        """
+        # the header columns and the unit the impact values refer to, the epdx document is left out
+        columns = columns or [*self._product_mapper.header_columns(), "epd_declaredUnit"]
+        impact_keys = self._read_repo.get_impact_keys(indicators) if with_impacts else []
+        fieldnames = [*dict.fromkeys(["id", *columns]), *(f"{indicator}.{stage}" for indicator, stage in impact_keys)]
+        stream = self._read_repo.stream(columns, filters, with_impacts, indicators, self._stream_batch_size)
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            for row, impacts in stream:
+                for (indicator, stage), value in impacts.items():
+                    row[f"{indicator}.{stage}"] = value
+                yield row
+        return fieldnames, rows()
+
+    def get_change_stamp(self, id: Optional[int] = None) -> Optional[str]:
+        """Changes whenever the products (or the product with this id) change, for conditional GETs."""
+        return self._read_repo.get_change_stamp(id)
+
     def get_product_by_id(self, id: int) -> Optional[Product_DTO]:
         entity = self._read_repo.get_by_id(id)
         return self._product_mapper.entity_to_product_dto(entity)
 
+    def get_product_versions_by_source(self, epd_sourceName : str) -> Dict[str, List[Tuple[int, str]]]:
+        return self._read_repo.get_versions_by_source(epd_sourceName)
+
+    @staticmethod
+    def _split_uri(uri : str) -> Optional[Tuple[str, str]]:
+        epd_sourceName, _, epd_id = uri.partition('.')
+        if not epd_sourceName or not epd_id:
+            return None
+        return epd_sourceName, epd_id
+
     def get_product_by_uri(self, uri : str) -> Optional[Product_DTO]:    
-        try:
-            epd_sourceName, epd_id = uri.split('.')
-        except ValueError:
+        key = self._split_uri(uri)
+        if key is None:
             # Handle the case where the URI is not in the expected format
             print("uri is not formatted as expected - should be <epd_sourceName>.<epd_id>")
             return None
 
-        # Use the filter method to find the product by epd_sourceName and epd_id
-        entities = self._read_repo.filter(epd_sourceName=epd_sourceName, epd_id=epd_id)
-
-        # Since the combination is unique, we expect at most one result
-        if entities:
-            entity = entities[0]
+        # indexed lookup, the latest stored version if there are several
+        entity = self._read_repo.get_by_uri(*key)
+        if entity:
             return self._product_mapper.entity_to_product_dto(entity)
         else:
             return None
+
+    def get_products_by_uris(self, references: List[Tuple[str, Optional[str]]]) -> ProductUriBatch_DTO:
+        """
+        Resolve many (uri, version) references with one query, the latest stored version where
+        the version is None. Results are keyed by the uri, or <uri>@<version> for a version.
+        """
+        batch = ProductUriBatch_DTO()
+        wanted: Dict[str, Tuple[Tuple[str, str], Optional[str]]] = {}
+        for uri, version in references:
+            name = f"{uri}@{version}" if version else uri
+            key = self._split_uri(uri)
+            if key is None:
+                if name not in batch.invalid:
+                    batch.invalid.append(name)
+            else:
+                wanted[name] = (key, version)
+
+        stored = self._read_repo.get_by_uris([key for key, _ in wanted.values()])
+        for name, (key, version) in wanted.items():
+            rows = [row for row in stored.get(key, []) if version is None or row.epd_version == version]
+            if rows:
+                batch.products[name] = self._product_mapper.entity_to_product_dto(rows[-1])
+            else:
+                batch.missing.append(name)
+        return batch
+    
+    def get_uri_versions(self, uris: List[str]) -> Dict[str, str]:
+        """
+        <id>:<row_version> of the product each uri resolves to, in one query that loads no epdx.
+        Changes whenever a uri resolves to another row or its row is written; uris that are
+        invalid or not stored are left out.
+        """
+        keys = {uri: self._split_uri(uri) for uri in uris}
+        versions = self._read_repo.get_uri_versions([key for key in keys.values() if key is not None])
+        return {uri: f"{versions[key][0]}:{versions[key][1]}" for uri, key in keys.items() if key in versions}
     
     def create_product(self, product_dto: Product_DTO) -> Product_DTO:
         if not self._validate_product_dto(product_dto):
@@ -106,44 +269,97 @@ class ProductService(IProductService):
         existing_product = self.get_product_by_dto(product_dto)
         if existing_product:
             return existing_message
-        if isinstance(existing_product, Collection) and len(existing_product) > 0:  # this shouldn´t be necessary but the response from Filter trips the truthy / falsy condition somehow
-            return existing_message
         try:
             return self.create_product(product_dto)
         except Exception as e:
             print(f"error creating product {product_dto.epd_id}: {str(e)}")
 
 
-    def create_product_from_dto_list(self, product_dtos : list[Product_DTO], user_id: Optional[int] = None) -> list[Product_DTO]:
+    @staticmethod
+    def _uri(product_dto: ProductHeader_DTO) -> str:
+        return f"{product_dto.epd_sourceName}.{product_dto.epd_id}"
+
+    def _insert_rows(self, rows: List[Tuple[str, dict]], report: ProductBulkReport_DTO) -> None:
+        """
+        Insert the rows with one statement that stores all of them or raises, so a statement that
+        succeeds created exactly its rows. A failing batch is split in halves until the offending
+        rows are isolated, about log2(len(rows)) statements per bad row instead of one per row.
+        A single row that fails because its key was stored since the existence check is a conflict.
+        """
+        if not rows:
+            return
+        try:
+            inserted = self._write_repo.bulk_insert([row for _, row in rows], skip_conflicts=False)
+        except Exception as e:
+            if len(rows) == 1:
+                name, row = rows[0]
+                if self._read_repo.get_existing_keys([(row["epd_sourceName"], row["epd_id"], row["epd_version"])]):
+                    report.conflicts.append(name)
+                else:
+                    report.failed[name] = f"{type(e).__name__}: {e}"
+                return
+            middle = len(rows) // 2
+            self._insert_rows(rows[:middle], report)
+            self._insert_rows(rows[middle:], report)
+            return
+        if inserted not in (-1, len(rows)):   # -1: the driver does not count executemany rows
+            raise RuntimeError(f"inserted {inserted} of {len(rows)} products")
+        report.created.extend(name for name, _ in rows)
+
+    def create_product_from_dto_list(self, product_dtos : list[Product_DTO], user_id: Optional[int] = None) -> ProductBulkReport_DTO:
+        """
+        Insert the products that are not stored yet, batch by batch, reported as <uri>@<epd_version>.
+        Each batch costs one existence query on (epd_sourceName, epd_id, epd_version) and one insert statement.
+        """
         start_time = time.perf_counter()
-        product_list = []
-        existing_product_list = []
-        failed_product_list = []
-        for dto in product_dtos:
-            try:
+        report = ProductBulkReport_DTO()
+        seen = set()
+        for offset in range(0, len(product_dtos), self._bulk_batch_size):
+            batch = product_dtos[offset:offset + self._bulk_batch_size]
+            existing = self._read_repo.get_existing_keys(
+                list({(dto.epd_sourceName, dto.epd_id, dto.epd_version) for dto in batch})
+            )
+            rows = []
+            for product_dto in batch:
+                key = (product_dto.epd_sourceName, product_dto.epd_id, product_dto.epd_version)
+                uri = f"{self._uri(product_dto)}@{product_dto.epd_version}"
+                if key in existing or key in seen:
+                    report.skipped.append(uri)
+                    continue
+                if not self._validate_product_dto(product_dto):
+                    report.failed[uri] = "invalid epdx"
+                    continue
+                seen.add(key)
                 if user_id:
-                    product = self.create_product_from_dto(dto, user_id)
-                else:
-                    product = self.create_product_from_dto(dto)
-                if product:
-                    product_list.append(product)
-                else:
-                    existing_product_list.append(dto)
-            except Exception as e:
-                print(f"error creating Product {dto.epd_id} : {e} ")
-                failed_product_list.append(dto)
-        end_time = time.perf_counter()
-        time_diff = end_time - start_time
-        minutes = int(time_diff // 60)
-        seconds = int(time_diff % 60)
-        print(
-            f"attempting to write {len(product_dtos)} to database took: {minutes} minutes and {seconds} seconds"
-        )
-        print(f"successfully added new products: {len(product_list)}")
-        print(f"products already in database that were not updated: {len(existing_product_list)}")
-        print(f"products that generated an error: {len(failed_product_list)}")
-        print(f"failed products: \n {[product.epd_id for product in failed_product_list]}")
-    
+                    product_dto.user_id_created = user_id
+                    product_dto.user_id_updated = user_id
+                rows.append((uri, self._product_mapper.dto_to_product_row(product_dto)))
+            self._insert_rows(rows, report)
+        report.elapsed_s = round(time.perf_counter() - start_time, 2)
+        return report
+
+    def create_validated_product_list(self, product_dtos: List[Product_DTO], user_id: Optional[int] = None) -> int:
+        """
+        Write a batch of products in one statement, returns the number of new rows.
+        Skips the per product validation, so the caller has to do it. Rows already stored are left
+        out after one existence query and the new ones are counted from it, not from the driver
+        rowcount: mysql counts skipped duplicates as affected rows and some drivers report -1.
+        """
+        keys = [(product_dto.epd_sourceName, product_dto.epd_id, product_dto.epd_version) for product_dto in product_dtos]
+        seen = self._read_repo.get_existing_keys(list(set(keys)))
+        rows = []
+        for key, product_dto in zip(keys, product_dtos):
+            if key in seen:
+                continue
+            seen.add(key)
+            if user_id:
+                product_dto.user_id_created = user_id
+                product_dto.user_id_updated = user_id
+            rows.append(self._product_mapper.dto_to_product_row(product_dto))
+        # a row another writer stores in between is still skipped by the insert
+        self._write_repo.bulk_insert(rows)
+        return len(rows)
+
     def update_product(self, id: int, product_dto: Product_DTO) -> Optional[Product_DTO]:
 
         existing_product = self._read_repo.get_by_id(id)
@@ -154,10 +370,22 @@ class ProductService(IProductService):
             return None
         product_dto.id = id  # Ensure ID matches
         entity = self._write_repo.update(self._product_mapper.dto_to_product_entity(product_dto))
+        if self._epd_cache is not None:
+            self._epd_cache.invalidate(id)
         return self._product_mapper.entity_to_product_dto(entity)
     
+    def set_products_status(self, ids: List[int], status: str) -> int:
+        return self._write_repo.update_status(ids, status)
+
     def delete_product(self, id: int) -> bool:
         existing_product = self._read_repo.get_by_id(id)
         if not existing_product:
             return False           
-        return self._write_repo.delete(id)
\ No newline at end of file
+        self._write_repo.delete(id)
+        if self._epd_cache is not None:
+            self._epd_cache.invalidate(id)
+        return True
+
+    def rebuild_product_impacts(self) -> int:
+        """Fill the product_impacts table from the stored epdx documents, returns the number of products."""
+        return self._write_repo.rebuild_impacts(self._bulk_batch_size)
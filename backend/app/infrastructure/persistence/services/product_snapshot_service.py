@@ -0,0 +1,184 @@
+# app/infrastructure/persistence/services/product_snapshot_service.py
+import json
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import Float, Integer
+
+from app.core.application.mappers.iproduct_mapper import IProductMapper
+from app.core.application.repositories.product.iproduct_read_repository import IProductReadRepository
+from app.core.application.repositories.product.iproduct_write_repository import IProductWriteRepository
+from app.core.application.services.iproduct_snapshot_service import IProductSnapshotService
+from app.core.domain.entities import Product
+
+# schema metadata key, the [indicator, stage] pair of every impact column in column order
+SNAPSHOT_IMPACTS_KEY = b"carbonitor.impacts"
+# a product can only be stored again with these
+SNAPSHOT_REQUIRED_COLUMNS = ("status", "epd_sourceName", "epd_id", "epd_version", "epdx")
+
+
+def _pyarrow():
+    """pyarrow is only needed for snapshots, so it is imported when one is written or read."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("parquet snapshots need pyarrow, install it with pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+
+def impact_column(indicator: str, stage: str) -> str:
+    return f"{indicator}.{stage}"
+
+
+class _ChunkSink:
+    """A write only file for ParquetWriter that hands out what was written since the last take()."""
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+
+class ProductSnapshotService(IProductSnapshotService):
+    """
+    Columnar parquet snapshots of the products: one row per product with its scalar columns, the
+    epdx as a json string if asked for, and a float64 column per indicator and stage of product_impacts.
+    Written and read one row group at a time, so neither side holds the whole catalog.
+    """
+    def __init__(
+        self,
+        product_read_repository: IProductReadRepository,
+        product_write_repository: IProductWriteRepository,
+        product_mapper: IProductMapper,
+        row_group_size: int = 10000,
+        bulk_batch_size: int = 500,
+        stream_batch_size: int = 1000
+    ):
+        self._read_repo = product_read_repository
+        self._write_repo = product_write_repository
+        self._product_mapper = product_mapper
+        self._row_group_size = max(1, row_group_size)
+        self._bulk_batch_size = max(1, bulk_batch_size)
+        self._stream_batch_size = max(1, stream_batch_size)
+
+    def _columns(self, with_epdx: bool) -> List[str]:
+        return ["id", *(name for name in self._product_mapper.row_columns() if with_epdx or name != "epdx")]
+
+    @staticmethod
+    def _arrow_type(pa, name: str):
+        if name == "epdx":
+            return pa.string()
+        column_type = Product.__table__.columns[name].type
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        if isinstance(column_type, Float):
+            return pa.float64()
+        return pa.string()
+
+    def _tables(self, with_epdx: bool, filters: Optional[Dict[str, Any]]) -> Tuple[Any, Iterator[Any]]:
+        """The snapshot schema and its row groups as arrow tables, read lazily from the database."""
+        pa, _ = _pyarrow()
+        columns = self._columns(with_epdx)
+        impact_keys = self._read_repo.get_impact_keys()
+        schema = pa.schema(
+            [(name, self._arrow_type(pa, name)) for name in columns]
+            + [(impact_column(indicator, stage), pa.float64()) for indicator, stage in impact_keys],
+            metadata={SNAPSHOT_IMPACTS_KEY: json.dumps(impact_keys).encode()},
+        )
+        stream = self._read_repo.stream(columns, filters, True, None, self._stream_batch_size)
+
+        def tables() -> Iterator[Any]:
+            batch = []
+            for row, impacts in stream:
+                if with_epdx:
+                    row["epdx"] = json.dumps(row["epdx"]) if row["epdx"] is not None else None
+                for (indicator, stage), value in impacts.items():
+                    row[impact_column(indicator, stage)] = value
+                batch.append(row)
+                if len(batch) >= self._row_group_size:
+                    yield pa.Table.from_pylist(batch, schema=schema)
+                    batch = []
+            if batch:
+                yield pa.Table.from_pylist(batch, schema=schema)
+        return schema, tables()
+
+    def write_snapshot(
+        self,
+        target: Union[str, BinaryIO],
+        with_epdx: bool = True,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Write a snapshot to a path or binary file, returns the number of products."""
+        _, pq = _pyarrow()
+        schema, tables = self._tables(with_epdx, filters)
+        products = 0
+        with pq.ParquetWriter(target, schema) as writer:
+            for table in tables:
+                writer.write_table(table)
+                products += table.num_rows
+        return products
+
+    def stream_snapshot(self, with_epdx: bool = False, filters: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+        """The bytes of a snapshot, a chunk per row group and the footer last, for a streamed response."""
+        _, pq = _pyarrow()
+        schema, tables = self._tables(with_epdx, filters)
+
+        def chunks() -> Iterator[bytes]:
+            sink = _ChunkSink()
+            with pq.ParquetWriter(sink, schema) as writer:
+                for table in tables:
+                    writer.write_table(table)
+                    yield sink.take()
+            yield sink.take()
+        return chunks()
+
+    def read_snapshot(self, source: Union[str, BinaryIO], keep_ids: bool = False) -> Dict[str, int]:
+        """
+        Store the products of a snapshot written with its epdx, with one insert statement per batch.
+        The epdx documents were validated when they were first stored, so unlike the seeding routes
+        no dto is built and nothing is validated again. Products that are already stored, or repeated
+        in the snapshot, are skipped after one existence query per batch and not parsed; product_impacts
+        is filled from the epdx. With keep_ids the snapshot ids are reused, for
+        restoring into an empty table.
+        """
+        _, pq = _pyarrow()
+        snapshot = pq.ParquetFile(source)
+        names = set(snapshot.schema_arrow.names)
+        missing = [name for name in SNAPSHOT_REQUIRED_COLUMNS if name not in names]
+        if missing:
+            raise ValueError(f"the snapshot has no {', '.join(missing)} column, write it with the epdx")
+        columns = [name for name in self._product_mapper.row_columns() if name in names]
+        if keep_ids and "id" in names:
+            columns.append("id")
+
+        products, inserted = 0, 0
+        for batch in snapshot.iter_batches(batch_size=self._bulk_batch_size, columns=columns):
+            rows = batch.to_pylist()
+            products += len(rows)
+            # counted from one existence query, the insert rowcount includes skipped duplicates on mysql
+            keys = [(row["epd_sourceName"], row["epd_id"], row["epd_version"]) for row in rows]
+            seen = self._read_repo.get_existing_keys(list(set(keys)))
+            new_rows = []
+            for key, row in zip(keys, rows):
+                if key in seen:
+                    continue
+                seen.add(key)
+                row["epdx"] = json.loads(row["epdx"]) if row["epdx"] is not None else None
+                new_rows.append(row)
+            self._write_repo.bulk_insert(new_rows)
+            inserted += len(new_rows)
+        return {"products": products, "inserted": inserted, "skipped": products - inserted}
@@ -1,12 +1,15 @@
 from datetime import datetime
+from typing import List
 
 from app.config import Config
 from app.core.application.dtos.buildup.buildup_dto import (BuildupCreate_DTO, BuildupResponse_DTO, BuildupUpdate_DTO, MappedBuildup_DTO)
 from app.core.application.services.ibuildup_service import IBuildupService
 from app.infrastructure.container import Container
+from app.presentation.decorators.conditional_get import etag
+from app.presentation.decorators.response_handling import fast_json
 from dependency_injector.wiring import Provide, inject
 from flask import Blueprint
-from flask_restx import Api, Namespace, Resource, fields, marshal
+from flask_restx import Api, Namespace, Resource, fields, inputs, marshal, reqparse
 
 buildup_blueprint = Blueprint('buildup', __name__)
 api = Api(
@@ -54,16 +57,65 @@ buildup_output_model = buildup_ns.inherit('buildup', buildup_input_model, {
     'date_updated': CustomDateTime(readonly=True, description='Last update date'),
 })
 
+buildup_contribution_model = buildup_ns.model('BuildupContribution', {
+    'key': fields.String(description='Key of the product in the buildup products'),
+    'type': fields.String(description='actual or reference'),
+    'element_id': fields.String(description='model_mapping_element_id of the mapped model element'),
+    'uri': fields.String(description='<epd_sourceName>.<epd_id> of a reference'),
+    'product_id': fields.Integer(description='Stored product a reference resolved to'),
+    'epd_version': fields.String(description='EPD version a reference resolved to'),
+    'name': fields.String(description='Product name'),
+    'declared_unit': fields.String(description='Declared unit of the product'),
+    'quantity': fields.Float(description='Quantity from the buildup results'),
+    'stages': fields.Raw(description='indicator -> stage -> value'),
+    'phases': fields.Raw(description='indicator -> life cycle phase -> value'),
+})
+
+buildup_impact_model = buildup_ns.model('BuildupImpact', {
+    'id': fields.Integer(description='buildup identifier'),
+    'name': fields.String(description='Buildup name'),
+    'quantity': fields.Float(description='Buildup reference quantity'),
+    'unit': fields.String(description='Buildup reference unit'),
+    'stages': fields.Raw(description='indicator -> stage -> value, summed over the products'),
+    'phases': fields.Raw(description='indicator -> life cycle phase -> value, summed over the products'),
+    'contributions': fields.List(fields.Nested(buildup_contribution_model)),
+    'errors': fields.Raw(description='Product key -> why the product is not in the totals'),
+    'complete': fields.Boolean(description='Every product is in the totals'),
+})
+
+buildup_impact_batch_input_model = buildup_ns.model('BuildupImpactBatchInput', {
+    'ids': fields.List(fields.Integer, required=True, description='buildup identifiers'),
+    'indicators': fields.List(fields.String, description='Impact indicators, all if not set'),
+    'contributions': fields.Boolean(default=False, description='Add the contribution of every product'),
+})
+
+buildup_impact_batch_model = buildup_ns.model('BuildupImpactBatch', {
+    'results': fields.List(fields.Nested(buildup_impact_model)),
+    'missing': fields.List(fields.Integer, description='Ids of buildups that do not exist'),
+})
+
+MAX_BATCH_BUILDUPS = 200
+
+buildup_impact_parser = reqparse.RequestParser()
+buildup_impact_parser.add_argument('indicators', type=str, location='args', help='comma separated impact indicators, all if not set')
+buildup_impact_parser.add_argument('contributions', type=inputs.boolean, default=True, location='args', help='add the contribution of every product')
+
+
+def comma_list(value: str) -> list:
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
 
 @buildup_ns.route('/')
 class buildupList(Resource):
     @inject
     @buildup_ns.doc('list_buildups')
-    @buildup_ns.marshal_list_with(buildup_output_model)
+    @buildup_ns.response(200, 'Success', [buildup_output_model])
+    @etag(lambda buildup_service: buildup_service.get_change_stamp())
+    @fast_json(List[BuildupResponse_DTO], buildup_output_model)
     def get(self, buildup_service: IBuildupService = Provide[Container.buildup_service]):
         """List all buildups"""
-        buildups = buildup_service.get_all_buildups()
-        return [buildup_dto for buildup_dto in buildups]
+        buildups = buildup_service.get_all_buildups() or []
+        return [buildup_dto for buildup_dto in buildups if buildup_dto is not None]
 
     @inject
     @buildup_ns.doc('create_buildup')
@@ -87,6 +139,7 @@ class buildupList(Resource):
 class buildupItem(Resource):
     @inject
     @buildup_ns.doc('get_buildup')
+    @etag(lambda id, buildup_service: buildup_service.get_change_stamp(id))
     @buildup_ns.marshal_with(buildup_output_model)
     def get(self, id: int, buildup_service: IBuildupService = Provide[Container.buildup_service]):
         """Get a buildup by ID"""
@@ -121,11 +174,53 @@ class buildupItem(Resource):
             buildup_ns.abort(404, "buildup not found")
         return '', 204
 
+@buildup_ns.route('/<int:id>/impacts')
+@buildup_ns.param('id', 'The buildup identifier')
+class buildupImpacts(Resource):
+    @inject
+    @buildup_ns.doc('get_buildup_impacts')
+    @buildup_ns.expect(buildup_impact_parser)
+    @etag(lambda id, buildup_service: buildup_service.get_impact_stamp(id))
+    @buildup_ns.marshal_with(buildup_impact_model)
+    def get(self, id: int, buildup_service: IBuildupService = Provide[Container.buildup_service]):
+        """Impacts of a buildup per indicator, stage and life cycle phase, calculated from its products"""
+        args = buildup_impact_parser.parse_args()
+        impacts = buildup_service.get_buildup_impacts([id], comma_list(args['indicators']) or None, args['contributions'])
+        if id not in impacts:
+            buildup_ns.abort(404, "buildup not found")
+        return impacts[id].model_dump()
+
+
+@buildup_ns.route('/impacts')
+class buildupImpactBatch(Resource):
+    @inject
+    @buildup_ns.doc('get_buildups_impacts')
+    @buildup_ns.expect(buildup_impact_batch_input_model)
+    @buildup_ns.marshal_with(buildup_impact_batch_model)
+    def post(self, buildup_service: IBuildupService = Provide[Container.buildup_service]):
+        """Impacts of many buildups in one request, their products resolved together"""
+        data : dict = buildup_ns.payload or {}
+        ids, indicators = data.get('ids') or [], data.get('indicators')
+        if not isinstance(ids, list) or any(not isinstance(id, int) or isinstance(id, bool) for id in ids):
+            buildup_ns.abort(400, "ids must be a list of integers")
+        if indicators is not None and (not isinstance(indicators, list) or any(not isinstance(name, str) for name in indicators)):
+            buildup_ns.abort(400, "indicators must be a list of strings")
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > MAX_BATCH_BUILDUPS:
+            buildup_ns.abort(400, f"at most {MAX_BATCH_BUILDUPS} buildups per request")
+        impacts = buildup_service.get_buildup_impacts(ids, indicators or None, bool(data.get('contributions', False)))
+        return {
+            'results': [impacts[id].model_dump() for id in ids if id in impacts],
+            'missing': [id for id in ids if id not in impacts],
+        }
+
+
 @buildup_ns.route('/name/<name>')
 @buildup_ns.param('name', 'The buildup name')
 class buildupItem(Resource):
     @inject
     @buildup_ns.doc('get_buildup')
+    @etag(lambda name, buildup_service: buildup_service.get_change_stamp())
     @buildup_ns.marshal_with(buildup_output_model)
     def get(self, name: int, buildup_service: IBuildupService = Provide[Container.buildup_service]):
         """Get a buildup by ID"""
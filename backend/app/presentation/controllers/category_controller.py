@@ -5,6 +5,7 @@ from app.core.application.dtos.category.category_dto import (
     CategoryDTO, CategoryResponseDTO, CategoryUpdateDTO)
 from app.core.application.services.icategory_service import ICategoryService
 from app.infrastructure.container import Container
+from app.presentation.decorators.conditional_get import etag
 from dependency_injector.wiring import Provide, inject
 from flask import Blueprint
 from flask_restx import Api, Namespace, Resource, fields, marshal
@@ -70,6 +71,7 @@ category_output_model = category_ns.inherit(
 class CategoryList(Resource):
     @inject
     @category_ns.doc("list_categories")
+    @etag(lambda category_service: category_service.get_change_stamp())
     @category_ns.marshal_list_with(category_output_model)
     def get(
         self, category_service: ICategoryService = Provide[Container.category_service]
@@ -106,6 +108,7 @@ class CategoryList(Resource):
 class CategoryItem(Resource):
     @inject
     @category_ns.doc("get_category")
+    @etag(lambda id, category_service: category_service.get_change_stamp(id))
     @category_ns.marshal_with(category_output_model)
     def get(
         self,
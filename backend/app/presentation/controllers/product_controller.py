@@ -1,18 +1,25 @@
 from datetime import datetime
+from typing import List
 
 from app.config import Config
 from app.core.application.dtos.product.product_dto import (Product_DTO,
-                                                           ProductHeader_DTO)
+                                                           ProductHeader_DTO,
+                                                           ProductImpactTable_DTO)
 from app.core.application.services.iepdx_service import IEpdxService
 from app.core.application.services.iokobau_service import IOkobauService
+from app.core.application.services.iproduct_impact_service import IProductImpactService
 from app.core.application.services.iproduct_service import IProductService
+from app.core.application.services.iproduct_snapshot_service import IProductSnapshotService
 from app.core.application.services.iuser_service import IUserService
+from app.core.domain.values.impact_matrix import TABLE_REDUCTIONS
 from app.infrastructure.container import Container
+from app.presentation.decorators.conditional_get import etag
+from app.presentation.decorators.response_handling import STREAM_MIMETYPES, fast_json, stream_rows
 from dependency_injector.wiring import Provide, inject
-from flask import Blueprint, request
-from flask_restx import Api, Namespace, Resource, fields, marshal
+from flask import Blueprint, Response, request
+from flask_restx import Api, Namespace, Resource, fields, inputs, marshal, reqparse
 
-from app.core.application.dtos.epdx.epdx_dto import EPD
+from app.core.application.dtos.epdx.epdx_dto import EPD, Unit
 
 product_blueprint = Blueprint('product', __name__)
 api = Api(
@@ -61,7 +68,8 @@ product_input_model = product_ns.model('ProductInput', {
     'epd_grammage': fields.Float(description='EPD grammage'),
     'epd_layer_thickness': fields.Float(description='EPD layer thickness'),
     'epd_subtype': fields.String(description='EPD subtype'),
-    'epd_bulk_density': fields.Float(description='EPD bulk density')
+    'epd_bulk_density': fields.Float(description='EPD bulk density'),
+    'epd_weight_per_piece': fields.Float(description='EPD weight per piece')
 })
 
 product_output_model = product_ns.inherit('Product', product_input_model, {
@@ -71,15 +79,177 @@ product_output_model = product_ns.inherit('Product', product_input_model, {
 })
 
 
+product_page_model = product_ns.model('ProductPage', {
+    'items': fields.List(fields.Nested(product_output_model)),
+    'limit': fields.Integer(description='Page size'),
+    'next_cursor': fields.String(description='Cursor of the next page, null on the last page'),
+    'total': fields.Integer(description='Number of matching products, only if include_total is set'),
+})
+
+product_header_model = product_ns.model('ProductHeader', {
+    'id': fields.Integer(readonly=True, description='Product identifier'),
+    'status': fields.String(description='Product status'),
+    'epd_name': fields.String(description='EPD name'),
+    'epd_id': fields.String(description='EPD ID'),
+    'epd_version': fields.String(description='EPD version'),
+    'epd_publishedDate': fields.String(description='EPD publication date'),
+    'epd_validUntil': fields.String(description='EPD validity date'),
+    'epd_standard': fields.String(description='EPD standard'),
+    'epd_comment': fields.String(description='EPD comment'),
+    'epd_location': fields.String(description='EPD location'),
+    'epd_formatVersion': fields.String(description='EPD format version'),
+    'epd_sourceName': fields.String(description='EPD source name'),
+    'epd_sourceUrl': fields.String(description='EPD source URL'),
+    'epd_subtype': fields.String(description='EPD subtype'),
+    'epd_description': fields.String(description='EPD description'),
+})
+
+product_header_page_model = product_ns.inherit('ProductHeaderPage', product_page_model, {
+    'items': fields.List(fields.Nested(product_header_model)),
+})
+
+product_uri_reference_model = product_ns.model('ProductUriReference', {
+    'uri': fields.String(required=True, description='<epd_sourceName>.<epd_id>'),
+    'version': fields.String(description='EPD version, the latest stored version if not set'),
+})
+
+product_uri_batch_input_model = product_ns.model('ProductUriBatchInput', {
+    'uris': fields.List(fields.String, description='<epd_sourceName>.<epd_id> of the latest versions'),
+    'references': fields.List(fields.Nested(product_uri_reference_model), description='uris with a version'),
+})
+
+product_uri_batch_model = product_ns.model('ProductUriBatch', {
+    # Product models by uri, marshalled by the resource
+    'products': fields.Raw(description='Products by uri, or by <uri>@<version> for references with a version'),
+    'missing': fields.List(fields.String, description='Well formed, but not stored'),
+    'invalid': fields.List(fields.String, description='Not of the form <epd_sourceName>.<epd_id>'),
+})
+
+MAX_BATCH_URIS = 500
+
+product_impact_query_model = product_ns.model('ProductImpactQuery', {
+    'ids': fields.List(fields.Integer, description='Product ids, the whole catalog if not set'),
+    'quantities': fields.Raw(description='Product id -> quantity, 1 for products not listed'),
+    'conversion_factors': fields.Raw(description='Product id -> factor from the declared unit, 1 for products not listed'),
+    'indicators': fields.List(fields.String, description='Impact indicators, all if not set'),
+    'stages': fields.List(fields.String, description='Life cycle stages, all if not set'),
+    'by': fields.String(enum=list(TABLE_REDUCTIONS), default='total', description='A column per indicator, per indicator and phase or per indicator and stage'),
+    'to_unit': fields.String(enum=[unit.value for unit in Unit], description='Quantities are in this unit, impacts are converted to it over each product\'s conversions'),
+})
+
+product_impact_table_model = product_ns.model('ProductImpactTable', {
+    'by': fields.String(description='total, phase or stage'),
+    'columns': fields.List(fields.String, description='<indicator>, <indicator>.<phase> or <indicator>.<stage>'),
+    'product_ids': fields.List(fields.Integer, description='The product of each row'),
+    'values': fields.List(fields.List(fields.Float), description='A row per product, a value per column, null where not declared'),
+    'missing': fields.List(fields.Integer, description='Requested, but not stored'),
+    'errors': fields.Raw(description='Product id -> why it could not be converted to to_unit, its row is null'),
+})
+
+PAGE_SORT_COLUMNS = ['id', 'epd_name', 'updated_at']
+MAX_PAGE_SIZE = 500
+
+product_page_parser = reqparse.RequestParser()
+product_page_parser.add_argument('limit', type=inputs.int_range(1, MAX_PAGE_SIZE), default=50, location='args')
+product_page_parser.add_argument('cursor', type=str, location='args', help='next_cursor of the previous page')
+product_page_parser.add_argument('sort', type=str, choices=PAGE_SORT_COLUMNS, default='id', location='args')
+product_page_parser.add_argument('order', type=str, choices=['asc', 'desc'], default='asc', location='args')
+product_page_parser.add_argument('status', type=str, location='args')
+product_page_parser.add_argument('standard', type=str, location='args', help='epd_standard')
+product_page_parser.add_argument('declared_unit', type=str, location='args', help='epd_declaredUnit')
+product_page_parser.add_argument('subtype', type=str, location='args', help='epd_subtype')
+product_page_parser.add_argument('location', type=str, location='args', help='epd_location')
+product_page_parser.add_argument('source', type=str, location='args', help='epd_sourceName')
+product_page_parser.add_argument('valid_on', type=inputs.date_from_iso8601, location='args', help='only EPDs still valid on this date (YYYY-MM-DD)')
+product_page_parser.add_argument('include_total', type=inputs.boolean, default=False, location='args')
+
+
+product_search_parser = product_page_parser.copy()
+for name in ('sort', 'order', 'include_total'):
+    product_search_parser.remove_argument(name)
+product_search_parser.add_argument('q', type=str, required=True, location='args', help='words to search for, matched as prefixes')
+
+product_export_parser = product_page_parser.copy()
+for name in ('limit', 'cursor', 'sort', 'order', 'include_total'):
+    product_export_parser.remove_argument(name)
+product_export_parser.add_argument('format', type=str, choices=list(STREAM_MIMETYPES), default='ndjson', location='args')
+product_export_parser.add_argument('columns', type=str, location='args', help='comma separated product columns, the header columns and declared unit if not set')
+product_export_parser.add_argument('impacts', type=inputs.boolean, default=False, location='args', help='add a <indicator>.<stage> column per impact')
+product_export_parser.add_argument('indicators', type=str, location='args', help='comma separated impact indicators, all if not set')
+
+product_snapshot_parser = product_page_parser.copy()
+for name in ('limit', 'cursor', 'sort', 'order', 'include_total'):
+    product_snapshot_parser.remove_argument(name)
+product_snapshot_parser.add_argument('epdx', type=inputs.boolean, default=False, location='args', help='add the epdx documents as json strings')
+
+product_rank_parser = product_page_parser.copy()
+for name in ('cursor', 'sort', 'include_total'):
+    product_rank_parser.remove_argument(name)
+product_rank_parser.add_argument('indicator', type=str, required=True, location='args', help='impact indicator, e.g. gwp')
+product_rank_parser.add_argument('stage', type=str, required=True, location='args', help='life cycle stage, e.g. a1a3')
+product_rank_parser.add_argument('min', type=float, location='args', help='only values from this one')
+product_rank_parser.add_argument('max', type=float, location='args', help='only values up to this one')
+
+product_rank_model = product_ns.model('ProductImpactRank', {
+    'value': fields.Float(description='Impact of the product on the ranked indicator and stage'),
+    'product': fields.Nested(product_header_model),
+})
+
+
+def comma_list(value: str) -> list:
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+
+def id_factors(value, name: str) -> dict:
+    """A json object of product id -> number, as sent in product_impact_query_model."""
+    if value is None:
+        return {}
+    try:
+        factors = {int(id): value for id, value in dict(value).items()}
+    except (TypeError, ValueError):
+        product_ns.abort(400, f"{name} must map product ids to numbers")
+    if any(not isinstance(factor, (int, float)) or isinstance(factor, bool) for factor in factors.values()):
+        product_ns.abort(400, f"{name} must map product ids to numbers")
+    return factors
+
+
+def page_filters(args: dict) -> dict:
+    """The filters of parsed product_page_parser or product_search_parser args."""
+    return {
+        'status': args['status'],
+        'epd_standard': args['standard'],
+        'epd_declaredUnit': args['declared_unit'],
+        'epd_subtype': args['subtype'],
+        'epd_location': args['location'],
+        'epd_sourceName': args['source'],
+        # iso dates compare correctly as strings
+        'epd_validUntil__gte': args['valid_on'].isoformat() if args['valid_on'] else None,
+    }
+
+
+def page_query(args: dict) -> dict:
+    """Turns parsed product_page_parser args into get_products_page keyword arguments."""
+    return {
+        'limit': args['limit'],
+        'cursor': args['cursor'],
+        'sort_by': args['sort'],
+        'descending': args['order'] == 'desc',
+        'filters': page_filters(args),
+        'include_total': args['include_total'],
+    }
+
+
 @product_ns.route('/')
 class ProductList(Resource):
     @inject
     @product_ns.doc('list_products')
-    @product_ns.marshal_list_with(product_output_model)
+    @product_ns.response(200, 'Success', [product_output_model])
+    @etag(lambda product_service: product_service.get_change_stamp())
+    @fast_json(List[Product_DTO], product_output_model)
     def get(self, product_service: IProductService = Provide[Container.product_service]):
         """List all products"""
         products = product_service.get_all_products()
-        return [product_dto for product_dto in products]
+        return [product_dto for product_dto in products if product_dto is not None]
 
     @inject
     @product_ns.doc('create_product')
@@ -98,11 +268,150 @@ class ProductList(Resource):
         created_product : ProductHeader_DTO = product_service.create_product(product)
         return created_product.model_dump(), 201
 
+@product_ns.route('/page')
+class ProductPage(Resource):
+    @inject
+    @product_ns.doc('list_products_page')
+    @product_ns.expect(product_page_parser)
+    @etag(lambda product_service: product_service.get_change_stamp())
+    @product_ns.marshal_with(product_page_model)
+    def get(self, product_service: IProductService = Provide[Container.product_service]):
+        """List products a page at a time, with filters and a stable cursor"""
+        try:
+            page = product_service.get_products_page(**page_query(product_page_parser.parse_args()))
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        return {**page.model_dump(exclude={'items'}), 'items': [product.model_dump() for product in page.items]}
+
+
+@product_ns.route('/headers')
+class ProductHeaderPage(Resource):
+    @inject
+    @product_ns.doc('list_product_headers_page')
+    @product_ns.expect(product_page_parser)
+    @etag(lambda product_service: product_service.get_change_stamp())
+    @product_ns.marshal_with(product_header_page_model)
+    def get(self, product_service: IProductService = Provide[Container.product_service]):
+        """Like /page, but only the header columns; the epdx document is left out and not loaded"""
+        try:
+            page = product_service.get_product_headers_page(**page_query(product_page_parser.parse_args()))
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        return {**page.model_dump(exclude={'items'}), 'items': [header.model_dump() for header in page.items]}
+
+
+@product_ns.route('/search')
+class ProductSearch(Resource):
+    @inject
+    @product_ns.doc('search_products')
+    @product_ns.expect(product_search_parser)
+    @etag(lambda product_service: product_service.get_change_stamp())
+    @product_ns.marshal_with(product_header_page_model)
+    def get(self, product_service: IProductService = Provide[Container.product_service]):
+        """Full-text search over name, description, comment and source, best match first"""
+        args = product_search_parser.parse_args()
+        try:
+            page = product_service.search_products(args['q'], args['limit'], args['cursor'], page_filters(args))
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        return {**page.model_dump(exclude={'items'}), 'items': [header.model_dump() for header in page.items]}
+
+
+@product_ns.route('/ranking')
+class ProductRanking(Resource):
+    @inject
+    @product_ns.doc('rank_products_by_impact')
+    @product_ns.expect(product_rank_parser)
+    @product_ns.marshal_list_with(product_rank_model)
+    def get(self, product_service: IProductService = Provide[Container.product_service]):
+        """Products ordered by their impact on one indicator and stage, lowest first unless order is desc"""
+        args = product_rank_parser.parse_args()
+        try:
+            ranking = product_service.rank_products_by_impact(
+                args['indicator'], args['stage'], args['limit'], args['min'], args['max'], args['order'] == 'desc', page_filters(args)
+            )
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        return [rank.model_dump() for rank in ranking]
+
+
+@product_ns.route('/export')
+class ProductExport(Resource):
+    @inject
+    @product_ns.doc('export_products')
+    @product_ns.expect(product_export_parser)
+    @product_ns.produces(list(STREAM_MIMETYPES.values()))
+    def get(self, product_service: IProductService = Provide[Container.product_service]):
+        """Stream the whole (filtered) catalog as ndjson or csv, read from the database while it is sent"""
+        args = product_export_parser.parse_args()
+        try:
+            fieldnames, rows = product_service.export_products(
+                comma_list(args['columns']), page_filters(args), args['impacts'], comma_list(args['indicators'])
+            )
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        return stream_rows(fieldnames, rows, args['format'], 'products')
+
+
+@product_ns.route('/snapshot')
+class ProductSnapshot(Resource):
+    @inject
+    @product_ns.doc('export_products_snapshot')
+    @product_ns.expect(product_snapshot_parser)
+    @product_ns.produces(['application/vnd.apache.parquet'])
+    def get(self, product_snapshot_service: IProductSnapshotService = Provide[Container.product_snapshot_service]):
+        """Stream a parquet snapshot of the (filtered) catalog, header columns and a float column per impact indicator and stage"""
+        args = product_snapshot_parser.parse_args()
+        try:
+            chunks = product_snapshot_service.stream_snapshot(args['epdx'], page_filters(args))
+        except RuntimeError as e:
+            product_ns.abort(501, str(e))
+        return Response(
+            chunks,
+            mimetype='application/vnd.apache.parquet',
+            headers={'Content-Disposition': 'attachment; filename="products.parquet"'},
+        )
+
+
+@product_ns.route('/impacts')
+class ProductImpacts(Resource):
+    @inject
+    @product_ns.doc('evaluate_product_impacts')
+    @product_ns.expect(product_impact_query_model)
+    @product_ns.response(200, 'Success', product_impact_table_model)
+    @fast_json(ProductImpactTable_DTO, product_impact_table_model)
+    def post(self, product_impact_service: IProductImpactService = Provide[Container.product_impact_service]):
+        """Impacts of many products, scaled by quantities and conversion factors or converted to one unit, as one table"""
+        data : dict = product_ns.payload or {}
+        ids = data.get('ids')
+        if ids is not None and (not isinstance(ids, list) or any(not isinstance(id, int) or isinstance(id, bool) for id in ids)):
+            product_ns.abort(400, "ids must be a list of integers")
+        for name in ('indicators', 'stages'):
+            if data.get(name) is not None and (not isinstance(data[name], list) or any(not isinstance(item, str) for item in data[name])):
+                product_ns.abort(400, f"{name} must be a list of strings")
+        to_unit = data.get('to_unit')
+        if to_unit is not None and to_unit not in Unit._value2member_map_:
+            product_ns.abort(400, f"to_unit must be one of {', '.join(unit.value for unit in Unit)}")
+        try:
+            return product_impact_service.evaluate_impacts(
+                ids,
+                id_factors(data.get('quantities'), 'quantities'),
+                id_factors(data.get('conversion_factors'), 'conversion_factors'),
+                data.get('indicators'),
+                data.get('stages'),
+                data.get('by') or 'total',
+                to_unit,
+            )
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+
+
 @product_ns.route('/<int:id>')
 @product_ns.param('id', 'The product identifier')
 class ProductItem(Resource):
     @inject
     @product_ns.doc('get_product')
+    @etag(lambda id, product_service: product_service.get_change_stamp(id))
     @product_ns.marshal_with(product_output_model)
     def get(self, id: int, product_service: IProductService = Provide[Container.product_service]):
         """Get a product by ID"""
@@ -145,6 +454,7 @@ class ProductItem(Resource):
 class ProductItem(Resource):
     @inject
     @product_ns.doc('get_product_by_uri')
+    @etag(lambda uri, product_service: product_service.get_change_stamp())
     @product_ns.marshal_with(product_output_model)
     def get(self, uri: str, product_service: IProductService = Provide[Container.product_service]):
         """Get a product by source and source id"""
@@ -154,6 +464,40 @@ class ProductItem(Resource):
         return product.model_dump()
 
 
+@product_ns.route('/epd-cache')
+class ProductEpdCache(Resource):
+    @inject
+    @product_ns.doc('get_epd_cache_stats')
+    def get(self, product_service: IProductService = Provide[Container.product_service]):
+        """Hit, miss and eviction counts of the parsed epd cache, to size EPD_CACHE_SIZE"""
+        return product_service.get_epd_cache_stats()
+
+
+@product_ns.route('/uri/batch')
+class ProductUriBatch(Resource):
+    @inject
+    @product_ns.doc('get_products_by_uris')
+    @product_ns.expect(product_uri_batch_input_model)
+    @product_ns.marshal_with(product_uri_batch_model)
+    def post(self, product_service: IProductService = Provide[Container.product_service]):
+        """Resolve many products by source and source id in one request, with the misses listed"""
+        data : dict = product_ns.payload or {}
+        try:
+            references = [(uri, None) for uri in data.get('uris') or []]
+            references += [(reference['uri'], reference.get('version')) for reference in data.get('references') or []]
+        except (KeyError, TypeError):
+            product_ns.abort(400, "references must be objects with a uri")
+        if any(not isinstance(uri, str) for uri, _ in references):
+            product_ns.abort(400, "uris must be strings")
+        if len(references) > MAX_BATCH_URIS:
+            product_ns.abort(400, f"at most {MAX_BATCH_URIS} uris per request")
+        batch = product_service.get_products_by_uris(references)
+        return {
+            **batch.model_dump(exclude={'products'}),
+            'products': {name: marshal(product.model_dump(), product_output_model) for name, product in batch.products.items()},
+        }
+
+
 @product_ns.route('/epd/')
 class ProductItem(Resource):
     @inject
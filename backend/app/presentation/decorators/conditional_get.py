@@ -0,0 +1,41 @@
+# app/presentation/decorators/conditional_get.py
+import hashlib
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import Response, request
+
+
+def etag(stamp: Callable[..., Optional[str]]):
+    """
+    Strong ETags for a GET resource method, placed under @inject so that the services are passed.
+
+    `stamp` is called with the view's arguments (without self) and returns a string that changes
+    whenever the response would, typically a service's get_change_stamp. A request whose
+    If-None-Match carries the current tag is answered 304 without calling the view, so nothing is
+    loaded or serialised. A None stamp (e.g. a missing row) runs the view without a tag.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(self, *args, **kwargs):
+            version = stamp(*args, **kwargs)
+            if version is None:
+                return f(self, *args, **kwargs)
+            # the query string is part of the tag, pages and filters of one table differ, and so is the
+            # accepted encoding, a gzip body is another representation than the plain one
+            accept_encoding = request.headers.get('Accept-Encoding', '')
+            tag = hashlib.sha256(f"{request.full_path}|{accept_encoding}|{version}".encode()).hexdigest()[:32]
+            headers = {'ETag': f'"{tag}"'}
+            if request.if_none_match.contains_weak(tag):
+                return '', 304, headers
+
+            result = f(self, *args, **kwargs)
+            if isinstance(result, Response):
+                result.headers.update(headers)
+                return result
+            if not isinstance(result, tuple):
+                return result, 200, headers
+            data, code, *rest = result
+            return data, code, {**(rest[0] if rest else {}), **headers}
+        return decorated_function
+    return decorator
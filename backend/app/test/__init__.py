@@ -0,0 +1,46 @@
+# backend/app/test/__init__.py
+import os
+import tempfile
+import unittest
+
+from app.core.domain.entities import Base
+from app.infrastructure.persistence.contexts.dbcontext import DBContext
+
+
+def product_row(impacts=None, **overrides):
+    """
+    The columns of a stored product for bulk_insert, overrides replace any of them. Every row has
+    the same keys, so that rows with and without the optional columns go into one executemany.
+    impacts fills the epdx, unless an epdx is given.
+    """
+    epd_id = overrides.get("epd_id", "a")
+    epd_name = overrides.get("epd_name", f"product {epd_id}")
+    row = {
+        "status": "default", "epd_name": epd_name, "epd_declaredUnit": "m3", "epd_id": epd_id,
+        "epd_version": "00.01.000", "epd_sourceName": "Oekobaudat",
+        "epdx": {"id": epd_id, "name": epd_name, "impacts": impacts or {}},
+        "epd_description": None, "epd_validUntil": None,
+        "epd_gross_density": None, "epd_layer_thickness": None, "epd_weight_per_piece": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class SqliteTestCase(unittest.TestCase):
+    """Each test gets throwaway sqlite databases with every table, so tests do not depend on or change internal.db."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.databases = []
+        self.db = self.database("products.db")
+
+    def tearDown(self):
+        for db in self.databases:
+            db.engine.dispose()
+        self.directory.cleanup()
+
+    def database(self, name: str) -> DBContext:
+        db = DBContext(f"sqlite:///{os.path.join(self.directory.name, name)}")
+        Base.metadata.create_all(db.engine)
+        self.databases.append(db)
+        return db
@@ -0,0 +1,183 @@
+# backend/app/test/buildup/test_buildup_impacts.py
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from sqlalchemy import event, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.core.domain.entities import Buildup, BuildupResult, Product
+from app.infrastructure.mappers.buildup_mapper import BuildupMapper
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.buildup.buildup_read_repository import BuildupReadRepository
+from app.infrastructure.persistence.repositories.buildup.buildup_write_repository import BuildupWriteRepository
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.buildup_service import BuildupService
+from app.infrastructure.persistence.services.product_service import ProductService
+from app.test import SqliteTestCase, product_row
+
+
+def reference(epd_id, element_id):
+    return {"type": "reference", "uri": f"Oekobaudat.{epd_id}", "overrides": {"meta_data": {"model_mapping_element_id": element_id}}}
+
+
+def buildup(id, products, results):
+    return Buildup(id=id, name=f"buildup {id}", status="active", quantity=1.0, unit="m2", products=products, results=results)
+
+
+class AcceptingEpdxService:
+    def validate_epdx(self, epdx):
+        return True
+
+
+class TestBuildupImpacts(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        ProductWriteRepository(self.db).bulk_insert([
+            product_row(epd_id="concrete", impacts={"gwp": {"a1a3": 200.0, "c3": 10.0, "d": -5.0}, "odp": {"a1a3": 0.001}}),
+            product_row(epd_id="concrete", epd_version="00.02.000",
+                        impacts={"gwp": {"a1a3": 250.0, "c3": 10.0, "d": -5.0}, "odp": {"a1a3": 0.002}}),
+            product_row(epd_id="steel", impacts={"gwp": {"a1a3": 2.0, "c4": None}}),
+        ])
+        with self.db.session() as session:
+            session.add_all([
+                buildup(1, {
+                    "product_id_1": reference("concrete", "Beton"),
+                    "product_id_2": reference("steel", "Bewehrung"),
+                    "product_id_3": {"type": "actual", "name": "plaster", "declaredUnit": "kg",
+                                     "metaData": {"model_mapping_element_id": "Putz"}, "impacts": {"gwp": {"a1a3": 0.5, "a4": 0.1}}},
+                }, {"product_id_1": {"quantity": 0.2}, "product_id_2": {"quantity": 10}, "product_id_3": {"quantity": 4}}),
+                buildup(2, {
+                    "product_id_1": reference("concrete", "Beton"),
+                    "product_id_2": reference("missing", "Dämmung"),
+                    "product_id_3": reference("steel", "Stahl"),
+                }, {"product_id_1": {"quantity": 1}, "product_id_2": {"quantity": 1}}),
+            ])
+        self.service = self.buildup_service()
+
+    def buildup_service(self, materialise_results=True):
+        product_service = ProductService(ProductReadRepository(self.db), ProductWriteRepository(self.db), ProductMapper(), AcceptingEpdxService())
+        return BuildupService(BuildupReadRepository(self.db), BuildupWriteRepository(self.db), BuildupMapper(product_service), product_service,
+                              materialise_results=materialise_results)
+
+    def statements(self):
+        statements = []
+        event.listen(self.db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        return statements
+
+    def test_totals_per_stage_and_phase(self):
+        impact = self.service.get_buildup_impacts([1])[1]
+        self.assertTrue(impact.complete)
+        self.assertEqual(impact.stages["gwp"], {"a1a3": 50.0 + 20.0 + 2.0, "c3": 2.0, "d": -1.0, "a4": 0.4})
+        self.assertEqual(impact.phases["gwp"], {"production": 72.0, "construction": 0.4, "disposal": 2.0, "reuse": -1.0})
+        self.assertAlmostEqual(impact.stages["odp"]["a1a3"], 0.0004)
+
+    def test_contributions_describe_each_product(self):
+        contributions = {item.key: item for item in self.service.get_buildup_impacts([1])[1].contributions}
+        concrete, plaster = contributions["product_id_1"], contributions["product_id_3"]
+        # a reference resolves to the latest stored version, like the client
+        self.assertEqual((concrete.element_id, concrete.epd_version, concrete.quantity), ("Beton", "00.02.000", 0.2))
+        self.assertEqual(concrete.stages["gwp"]["a1a3"], 50.0)
+        self.assertEqual((plaster.type, plaster.element_id, plaster.declared_unit), ("actual", "Putz", "kg"))
+        self.assertEqual(contributions["product_id_2"].stages, {"gwp": {"a1a3": 20.0}})
+
+    def test_unusable_products_are_reported(self):
+        impact = self.service.get_buildup_impacts([2], indicators=["gwp"], with_contributions=False)[2]
+        self.assertFalse(impact.complete)
+        self.assertEqual(set(impact.errors), {"product_id_2", "product_id_3"})
+        self.assertIn("not stored", impact.errors["product_id_2"])
+        self.assertEqual(impact.stages, {"gwp": {"a1a3": 250.0, "c3": 10.0, "d": -5.0}})
+        self.assertEqual(impact.contributions, [])
+
+    def test_references_of_many_buildups_are_resolved_together(self):
+        service = self.buildup_service(materialise_results=False)
+        statements = self.statements()
+        impacts = service.get_buildup_impacts([1, 2, 3])
+        self.assertEqual(sorted(impacts), [1, 2])
+        # the buildups, then the products of every reference
+        self.assertEqual(len(statements), 2)
+
+    def test_stored_results_are_read_without_products(self):
+        computed = self.service.get_buildup_impacts([1, 2])
+        statements = self.statements()
+        self.assertEqual(self.service.get_buildup_impacts([1, 2]), computed)
+        # the product stamp and the buildups joined with their results
+        self.assertEqual(len(statements), 2)
+        self.assertEqual(self.service.get_buildup_impacts([2], indicators=["odp"], with_contributions=False)[2].stages,
+                         {"odp": {"a1a3": 0.002}})
+
+    def test_only_conflicts_storing_results_are_ignored(self):
+        def conflict(rows):
+            raise IntegrityError("INSERT INTO buildup_results", {}, Exception("UNIQUE constraint failed"))
+
+        def broken(rows):
+            raise OperationalError("INSERT INTO buildup_results", {}, Exception("no such table"))
+
+        self.service._write_repo.save_results = conflict
+        self.assertTrue(self.service.get_buildup_impacts([1])[1].complete)
+        self.service._write_repo.save_results = broken
+        with self.assertRaises(OperationalError):
+            self.service.get_buildup_impacts([1])
+
+    def test_unrelated_product_writes_only_check_the_references(self):
+        self.service.get_buildup_impacts([1])
+        ProductWriteRepository(self.db).bulk_insert([product_row(epd_id="glass", impacts={"gwp": {"a1a3": 30.0}})])
+        statements = self.statements()
+        self.assertEqual(self.service.get_buildup_impacts([1])[1].stages["gwp"]["a1a3"], 72.0)
+        # stamp, results, the versions of the references, marking the result as checked
+        self.assertEqual(len(statements), 4)
+        self.assertFalse([statement for statement in statements if "epdx" in statement])
+        del statements[:]
+        self.service.get_buildup_impacts([1])
+        self.assertEqual(len(statements), 2)
+
+    def test_referenced_product_writes_recompute(self):
+        self.service.get_buildup_impacts([1, 2])
+        write_repo = ProductWriteRepository(self.db)
+        write_repo.bulk_insert([product_row(epd_id="steel", epd_version="00.02.000", impacts={"gwp": {"a1a3": 3.0}})])
+        self.assertEqual(self.service.get_buildup_impacts([1])[1].stages["gwp"]["a1a3"], 82.0)
+        with self.db.session() as session:
+            concrete = session.execute(select(Product).where(Product.epd_id == "concrete", Product.epd_version == "00.02.000")).scalar_one()
+        concrete.epdx = {**concrete.epdx, "impacts": {"gwp": {"a1a3": 100.0}}}
+        write_repo.update(concrete)
+        impact = self.service.get_buildup_impacts([1, 2])
+        self.assertEqual((impact[1].stages["gwp"]["a1a3"], impact[2].stages), (20.0 + 30.0 + 2.0, {"gwp": {"a1a3": 100.0}}))
+
+    def test_buildup_writes_recompute_and_deletes_remove_results(self):
+        self.service.get_buildup_impacts([1])
+        with self.db.session() as session:
+            entity = session.get(Buildup, 1)
+            entity.results = {**entity.results, "product_id_2": {"quantity": 20}}
+        self.assertEqual(self.service.get_buildup_impacts([1])[1].stages["gwp"]["a1a3"], 92.0)
+        BuildupWriteRepository(self.db).delete(1)
+        self.assertEqual(self.service.get_buildup_impacts([1]), {})
+        with self.db.session() as session:
+            self.assertEqual(session.execute(select(BuildupResult)).all(), [])
+
+    def test_edits_within_one_second_recompute(self):
+        self.service.get_buildup_impacts([1])
+        same_second = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        with self.db.session() as session:   # updated_at does not move, as for edits in one mysql second
+            session.execute(update(Buildup).where(Buildup.id == 1).values(updated_at=same_second))
+        self.service.get_buildup_impacts([1])
+        with self.db.session() as session:
+            entity = session.get(Buildup, 1)
+            session.execute(update(Buildup).where(Buildup.id == 1).values(
+                results={**entity.results, "product_id_2": {"quantity": 20}}, updated_at=same_second))
+        self.assertEqual(self.service.get_buildup_impacts([1])[1].stages["gwp"]["a1a3"], 92.0)
+        with self.db.session() as session:
+            session.execute(update(Product).where(Product.epd_id == "steel").values(
+                epdx={"id": "steel", "name": "product steel", "impacts": {"gwp": {"a1a3": 3.0}}}, updated_at=same_second))
+        self.assertEqual(self.service.get_buildup_impacts([1])[1].stages["gwp"]["a1a3"], 50.0 + 60.0 + 2.0)
+
+    def test_impact_stamp(self):
+        self.assertIsNone(self.service.get_impact_stamp(3))
+        self.assertIsNotNone(self.service.get_impact_stamp(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# backend/app/test/okobau/ilcd_stub_server.py
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class IlcdStubHandler(BaseHTTPRequestHandler):
+    """Serves minimal ILCD json for /processes/<uuid>, with a few misbehaving uuids:
+    flaky-* answers 503 twice, missing-* answers 404, slow-* takes 1s and late-* takes 0.2s.
+    /processes itself serves a paged list of `process_list` entries."""
+    protocol_version = "HTTP/1.1"   # keep-alive, so connection reuse can be observed
+    attempts = {}
+    client_ports = set()
+    active = 0
+    max_active = 0
+    process_list = []
+    list_pages = []   # (startIndex, pageSize) of every list request
+    lock = threading.Lock()
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.attempts.clear()
+            cls.client_ports.clear()
+            cls.active = 0
+            cls.max_active = 0
+            cls.list_pages.clear()
+
+    def do_GET(self):
+        path, _, query = self.path.partition('?')
+        if path.rstrip('/').endswith('/processes'):
+            return self._send_list(parse_qs(query))
+        uuid = path.rstrip('/').split('/')[-1]
+        with self.lock:
+            IlcdStubHandler.attempts[uuid] = self.attempts.get(uuid, 0) + 1
+            IlcdStubHandler.client_ports.add(self.client_address[1])
+            IlcdStubHandler.active += 1
+            IlcdStubHandler.max_active = max(self.max_active, self.active)
+            attempt = self.attempts[uuid]
+        try:
+            if uuid.startswith('flaky') and attempt < 3:
+                return self._send(503, {"error": "busy"})
+            if uuid.startswith('missing'):
+                return self._send(404, {"error": "not found"})
+            if uuid.startswith('slow'):
+                time.sleep(1)
+            if uuid.startswith('late'):
+                time.sleep(0.2)
+            self._send(200, {
+                "processInformation": {"dataSetInformation": {"UUID": uuid}},
+                "administrativeInformation": {"publicationAndOwnership": {"dataSetVersion": "00.01.000"}},
+            })
+        finally:
+            with self.lock:
+                IlcdStubHandler.active -= 1
+
+    def _send_list(self, query):
+        start_index = int(query.get('startIndex', ['0'])[0])
+        page_size = int(query.get('pageSize', ['5000'])[0])
+        with self.lock:
+            IlcdStubHandler.list_pages.append((start_index, page_size))
+        self._send(200, {
+            "startIndex": start_index,
+            "pageSize": page_size,
+            "totalCount": len(self.process_list),
+            "data": self.process_list[start_index:start_index + page_size],
+        })
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    """Start the stub on a free local port, return the server and its /processes/ base url."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), IlcdStubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/processes/"
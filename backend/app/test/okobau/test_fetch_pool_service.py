@@ -0,0 +1,93 @@
+# backend/app/test/okobau/test_fetch_pool_service.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.config import Config
+from app.infrastructure.infrastructure.services.fetch_pool_service import FetchPoolService
+from app.infrastructure.infrastructure.services.http_client_service import HttpClientService
+from app.infrastructure.infrastructure.services.ilcd_cache_service import IlcdCacheService
+from app.infrastructure.mappers.external_product_mapper import OkobauMapper
+from app.infrastructure.infrastructure.services.okobau_service import OkobauService
+from app.test.okobau.ilcd_stub_server import IlcdStubHandler, start_stub_server
+
+
+class TestFetchPoolService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_stub_server()
+        cls.original_url = Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL
+        cls.original_timeout = Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_TIMEOUT
+        Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL = cls.url
+        Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_TIMEOUT = 0.5
+
+    @classmethod
+    def tearDownClass(cls):
+        Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL = cls.original_url
+        Config.EXTERNAL_RESOURCES.OKOBAU.FETCH_TIMEOUT = cls.original_timeout
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        IlcdStubHandler.reset()
+        self.pool = FetchPoolService(workers=4, retries=3, backoff=0.01)
+        # the http client does not retry here, so the retries below are the pool´s own
+        http_client = HttpClientService(rate_limit=0, retries=0)
+        no_cache = IlcdCacheService(directory="", datastock="test", max_bytes=0)
+        self.okobau_service = OkobauService(
+            mapper=OkobauMapper(http_client, no_cache), fetch_pool_service=self.pool, http_client_service=http_client
+        )
+
+    def _uuids(self, results):
+        return [result.value["processInformation"]["dataSetInformation"]["UUID"] for result in results]
+
+    def test_00_ordered_results_keep_input_order(self):
+        uuids = ['late-0', 'a-1', 'late-2', 'b-3', 'c-4', 'late-5', 'd-6', 'e-7', 'f-8', 'g-9']
+        results = list(self.pool.map(self.okobau_service.get_ilcd_from_uuid, uuids, ordered=True))
+        self.assertEqual(uuids, self._uuids(results))
+        self.assertEqual(list(range(len(uuids))), [result.index for result in results])
+
+    def test_01_unordered_results_yield_fast_items_first(self):
+        uuids = ['late-0', 'a-1', 'b-2', 'c-3']
+        results = list(self.pool.map(self.okobau_service.get_ilcd_from_uuid, uuids, ordered=False))
+        self.assertEqual(sorted(uuids), sorted(self._uuids(results)))
+        self.assertEqual('late-0', self._uuids(results)[-1])
+
+    def test_02_server_errors_are_retried(self):
+        results = list(self.pool.map(self.okobau_service.get_ilcd_from_uuid, ['flaky-0']))
+        self.assertTrue(results[0].ok)
+        self.assertEqual(3, results[0].attempts)
+        self.assertEqual(3, IlcdStubHandler.attempts['flaky-0'])
+
+    def test_03_client_errors_are_not_retried(self):
+        results = list(self.pool.map(self.okobau_service.get_ilcd_from_uuid, ['missing-0']))
+        self.assertFalse(results[0].ok)
+        self.assertEqual('HTTPError', results[0].error_type)
+        self.assertEqual(1, IlcdStubHandler.attempts['missing-0'])
+
+    def test_04_timeouts_fail_after_retries(self):
+        pool = FetchPoolService(workers=2, retries=1, backoff=0.01)
+        results = list(pool.map(self.okobau_service.get_ilcd_from_uuid, ['slow-0', 'a-1']))
+        self.assertFalse(results[0].ok)
+        self.assertEqual('ReadTimeout', results[0].error_type)
+        self.assertEqual(2, results[0].attempts)
+        self.assertTrue(results[1].ok)
+
+    def test_05_items_are_pulled_lazily(self):
+        pulled = []
+
+        def items():
+            for i in range(100):
+                pulled.append(i)
+                yield f"a-{i}"
+
+        results = self.pool.map(self.okobau_service.get_ilcd_from_uuid, items())
+        next(results)
+        self.assertLessEqual(len(pulled), 2 * 4 + 1)
+        results.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
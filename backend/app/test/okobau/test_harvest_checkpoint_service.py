@@ -0,0 +1,47 @@
+# backend/app/test/okobau/test_harvest_checkpoint_service.py
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.infrastructure.infrastructure.services.harvest_checkpoint_service import HarvestCheckpointService
+
+
+class TestHarvestCheckpointService(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "checkpoint.jsonl"
+        self.checkpoint = HarvestCheckpointService(self.path)
+
+    def tearDown(self):
+        self.checkpoint.close()
+        self.directory.cleanup()
+
+    def test_last_record_wins(self):
+        self.checkpoint.record_failed("a", "1", "HTTPError", "503")
+        self.checkpoint.record_done([("b", "1")])
+        self.checkpoint.record_done([("a", "1")])
+        self.checkpoint.record_failed("c", "1", "ValueError", "bad ilcd")
+        self.assertEqual(self.checkpoint.get_processed(), {"a", "b", "c"})
+        self.assertEqual(self.checkpoint.get_failed(), {"c": "ValueError"})
+
+    def test_survives_torn_last_line(self):
+        self.checkpoint.record_done([("a", "1"), ("b", "1")])
+        self.checkpoint.close()
+        with open(self.path, "a") as file:
+            file.write('{"uuid": "c", "sta')   # killed mid write
+        self.assertEqual(HarvestCheckpointService(self.path).get_processed(), {"a", "b"})
+
+    def test_reset(self):
+        self.checkpoint.record_done([("a", "1")])
+        self.checkpoint.reset()
+        self.assertEqual(self.checkpoint.load(), {})
+        self.checkpoint.record_done([("b", "1")])
+        self.assertEqual(self.checkpoint.get_processed(), {"b"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# backend/app/test/okobau/test_harvest_pipeline_service.py
+import json
+import os
+import queue
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.config import Config
+from app.infrastructure.infrastructure.services.fetch_pool_service import FetchPoolService
+from app.infrastructure.infrastructure.services.harvest_checkpoint_service import HarvestCheckpointService
+from app.core.application.dtos.okobau.okobau_dto import HarvestReport_DTO
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.infrastructure.infrastructure.services.harvest_pipeline_service import _DONE, HarvestPipelineService, StageStats
+from app.infrastructure.infrastructure.services.http_client_service import HttpClientService
+from app.infrastructure.infrastructure.services.ilcd_cache_service import IlcdCacheService
+from app.infrastructure.infrastructure.services.okobau_service import OkobauService
+from app.infrastructure.mappers.external_product_mapper import OkobauMapper
+from app.test.okobau.ilcd_stub_server import IlcdStubHandler, start_stub_server
+
+
+class RecordingProductService:
+    """Knows one stored okobaudat version and records written batches."""
+    def __init__(self):
+        self.batches = []
+
+    def get_product_versions_by_source(self, epd_sourceName):
+        return {"known": [(1, "00.01.000")]} if epd_sourceName == Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME else {}
+
+    def create_validated_product_list(self, product_dtos, user_id=None):
+        self.batches.append(list(product_dtos))
+        return len(product_dtos)
+
+
+class TestHarvestPipelineService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_stub_server()
+        cls.original_urls = (Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL, Config.EXTERNAL_RESOURCES.OKOBAU.PROCESS_LIST_URL)
+        Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL = cls.url
+        Config.EXTERNAL_RESOURCES.OKOBAU.PROCESS_LIST_URL = cls.url.rstrip('/')
+        cls.cache_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL, Config.EXTERNAL_RESOURCES.OKOBAU.PROCESS_LIST_URL = cls.original_urls
+        IlcdStubHandler.process_list = []
+        cls.cache_dir.cleanup()
+        cls.server.shutdown()
+
+    def setUp(self):
+        IlcdStubHandler.reset()
+        IlcdStubHandler.process_list = [
+            {"uuid": "known", "name": "stored already", "version": "00.01.000"},
+            {"uuid": "missing-1", "name": "gone on the server", "version": "00.01.000"},
+            {"uuid": "stub-1", "name": "not a full ilcd document", "version": "00.01.000"},
+            {"uuid": "stub-2", "name": "not a full ilcd document", "version": "00.01.000"},
+        ]
+        http_client = HttpClientService(rate_limit=0, retries=0)
+        mapper = OkobauMapper(http_client, IlcdCacheService(self.cache_dir.name, "test", max_bytes=0))
+        self.product_service = RecordingProductService()
+        self.checkpoint = HarvestCheckpointService(Path(self.cache_dir.name) / "checkpoint.jsonl")
+        self.checkpoint.reset()
+        self.pipeline = HarvestPipelineService(
+            okobau_service=OkobauService(mapper=mapper, http_client_service=http_client),
+            okobau_mapper=mapper,
+            fetch_pool_service=FetchPoolService(workers=2, retries=0),
+            product_service=self.product_service,
+            checkpoint_service=self.checkpoint,
+            convert_workers=1,
+            queue_size=2,
+            batch_size=2,
+        )
+
+    def test_skips_known_and_reports_failures_per_stage(self):
+        report = self.pipeline.run()
+        self.assertEqual(report.existing, 1)
+        self.assertNotIn("known", IlcdStubHandler.attempts)   # never downloaded
+        self.assertEqual(set(report.failed), {"missing-1", "stub-1", "stub-2"})
+        self.assertIn("HTTPError", report.failed["missing-1"])
+        self.assertEqual(report.added, 0)
+        self.assertEqual(report.stages["list"]["items"], 4)
+        self.assertEqual(report.stages["fetch"]["errors"], 1)
+        self.assertEqual(report.stages["convert"]["errors"], 2)
+        self.assertEqual(report.stages["write"]["items"], 0)
+
+    def test_failures_are_checkpointed_and_retried(self):
+        self.pipeline.run()
+        self.assertEqual(self.checkpoint.get_failed(), {"missing-1": "HTTPError", "stub-1": "ParsingException", "stub-2": "ParsingException"})
+
+        IlcdStubHandler.reset()
+        IlcdStubHandler.process_list.append({"uuid": "stub-3", "name": "listed after the first run", "version": "00.01.000"})
+        report = self.pipeline.run(retry_failed=True)
+        self.assertEqual(set(IlcdStubHandler.attempts), {"missing-1", "stub-1", "stub-2"})
+        self.assertEqual(report.skipped, 2)   # known is counted as existing, stub-3 never failed
+
+        IlcdStubHandler.reset()
+        report = self.pipeline.run(resume=True)
+        self.assertEqual(set(IlcdStubHandler.attempts), {"stub-3"})
+
+    def _archive(self, entries):
+        path = Path(self.cache_dir.name) / "export.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            for name, content in entries.items():
+                archive.writestr(name, content)
+        return path
+
+    def _ilcd(self, uuid, uri=None):
+        publication = {"dataSetVersion": "00.01.000", **({"permanentDataSetURI": uri} if uri else {})}
+        return json.dumps({
+            "processInformation": {"dataSetInformation": {"UUID": uuid, "name": {"baseName": [{"lang": "de", "value": uuid}]}}},
+            "administrativeInformation": {"publicationAndOwnership": publication},
+        })
+
+    def test_archive_import(self):
+        path = self._archive({
+            "ILCD/processes/known.json": self._ilcd("known"),
+            "ILCD/processes/stub-1.json": self._ilcd("stub-1"),
+            "ILCD/processes/broken.json": "{not json",
+            "ILCD/processes/other.xml": "<processDataSet/>",
+            "ILCD/flows/flow.json": "{}",
+        })
+        report = self.pipeline.run_archive(path)
+        self.assertEqual(IlcdStubHandler.attempts, {})   # no network
+        self.assertEqual(report.existing, 1)
+        self.assertEqual(set(report.failed), {"ILCD/processes/broken.json", "stub-1"})
+        self.assertEqual(report.stages["read"]["items"], 2)
+
+    def test_archive_of_another_programme(self):
+        path = self._archive({"ILCD/processes/known.json": self._ilcd("known")})
+        report = self.pipeline.run_archive(path, source_name="EPD Norge")
+        # only stored as an okobaudat product, so it is converted for this source
+        self.assertEqual(report.existing, 0)
+        self.assertEqual(set(report.failed), {"known"})
+
+        okobaudat = Config.EXTERNAL_RESOURCES.OKOBAU.SOURCE_NAME
+        self.assertEqual(HarvestPipelineService.archive_url(json.loads(self._ilcd("a", "https://epd-norge.no/a")), "a", "EPD Norge"),
+                         "https://epd-norge.no/a")
+        self.assertIsNone(HarvestPipelineService.archive_url(json.loads(self._ilcd("a")), "a", "EPD Norge"))
+        self.assertEqual(HarvestPipelineService.archive_url(json.loads(self._ilcd("a")), "a", okobaudat), OkobauMapper.uuid_to_url("a"))
+
+    def test_archive_checkpoint_is_separate(self):
+        self.checkpoint.record_done([("harvested", "00.01.000")])
+        path = self._archive({"ILCD/processes/stub-1.json": self._ilcd("stub-1")})
+        self.pipeline.run_archive(path)
+        self.assertEqual(self.checkpoint.get_processed(), {"harvested"})
+        archive_checkpoint = self.checkpoint.for_namespace(HarvestPipelineService.archive_namespace(path))
+        self.assertEqual(archive_checkpoint.get_failed(), {"stub-1": "ParsingException"})
+        report = self.pipeline.run_archive(path, resume=True)
+        self.assertEqual(report.skipped, 1)
+        archive_checkpoint.reset()
+
+    def test_archive_with_xml_only(self):
+        path = self._archive({"ILCD/processes/a.xml": "<processDataSet/>"})
+        with self.assertRaises(ValueError):
+            self.pipeline.run_archive(path)
+
+    def test_writer_batches(self):
+        converted = queue.Queue()
+        for item in [*(Product_DTO(epd_name=f"epd {i}", epd_id=f"uuid-{i}", epd_version="1", epd_declaredUnit="kg", epdx={}) for i in range(5)), _DONE]:
+            converted.put(item)
+        report = HarvestReport_DTO()
+        self.pipeline._write_stage(converted, None, StageStats("write"), report)
+        self.assertEqual([len(batch) for batch in self.product_service.batches], [2, 2, 1])
+        self.assertEqual(report.added, 5)
+        self.assertEqual(len(self.checkpoint.get_processed()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
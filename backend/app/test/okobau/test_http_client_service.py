@@ -0,0 +1,77 @@
+# backend/app/test/okobau/test_http_client_service.py
+import os
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.infrastructure.infrastructure.services.http_client_service import HttpClientService, TokenBucket
+from app.test.okobau.ilcd_stub_server import IlcdStubHandler, start_stub_server
+
+
+class TestHttpClientService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_stub_server()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        IlcdStubHandler.reset()
+
+    def test_00_connections_are_reused(self):
+        client = HttpClientService(rate_limit=0)
+        for i in range(10):
+            client.get_json(f"{self.url}a-{i}")
+        self.assertEqual(1, len(IlcdStubHandler.client_ports))
+        stats = client.get_stats()
+        self.assertEqual(10, stats["requests"])
+        self.assertGreater(stats["bytes"], 0)
+        self.assertEqual(10, sum(stats["latency_histogram_ms"].values()))
+
+    def test_01_transient_errors_are_retried_and_counted(self):
+        client = HttpClientService(rate_limit=0, retries=3, backoff=0.01)
+        data = client.get_json(f"{self.url}flaky-0")
+        self.assertEqual("flaky-0", data["processInformation"]["dataSetInformation"]["UUID"])
+        stats = client.get_stats()
+        self.assertEqual(3, stats["requests"])
+        self.assertEqual(2, stats["retries"])
+
+    def test_02_client_errors_raise_without_retry(self):
+        client = HttpClientService(rate_limit=0, retries=3, backoff=0.01)
+        with self.assertRaises(requests.HTTPError):
+            client.get(f"{self.url}missing-0")
+        self.assertEqual(0, client.get_stats()["retries"])
+
+    def test_03_rate_limit_spaces_requests(self):
+        client = HttpClientService(rate_limit=20, burst=1)
+        start = time.perf_counter()
+        for i in range(6):
+            client.get(f"{self.url}a-{i}")
+        # the first request uses the initial token, the other five wait 1/20s each
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+        self.assertGreater(client.get_stats()["throttled_s"], 0)
+
+    def test_04_concurrency_is_capped_per_host(self):
+        client = HttpClientService(rate_limit=0, max_per_host=2)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda i: client.get(f"{self.url}late-{i}"), range(6)))
+        self.assertLessEqual(IlcdStubHandler.max_active, 2)
+
+    def test_05_token_bucket_allows_bursts(self):
+        bucket = TokenBucket(rate=1, capacity=5)
+        start = time.perf_counter()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
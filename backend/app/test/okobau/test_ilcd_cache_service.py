@@ -0,0 +1,92 @@
+# backend/app/test/okobau/test_ilcd_cache_service.py
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.config import Config
+from app.infrastructure.infrastructure.services.http_client_service import HttpClientService
+from app.infrastructure.infrastructure.services.ilcd_cache_service import IlcdCacheService
+from app.infrastructure.mappers.external_product_mapper import OkobauMapper
+from app.test.okobau.ilcd_stub_server import IlcdStubHandler, start_stub_server
+
+
+class TestIlcdCacheService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_stub_server()
+        cls.original_url = Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL
+        Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL = cls.url
+
+    @classmethod
+    def tearDownClass(cls):
+        Config.EXTERNAL_RESOURCES.OKOBAU.SINGLE_ITEM_URL = cls.original_url
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        IlcdStubHandler.reset()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = IlcdCacheService(Path(self.tmp_dir.name), datastock="test", max_bytes=10 * 1024 * 1024)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_00_roundtrip_is_compressed(self):
+        document = {"impacts": {"gwp": {"a1a3": 1.5}}, "padding": "x" * 10000}
+        self.cache.put("ilcd", "uuid-0", "00.01.000", document)
+        self.assertEqual(document, self.cache.get("ilcd", "uuid-0", "00.01.000"))
+        self.assertIsNone(self.cache.get("ilcd", "uuid-0", "00.02.000"))
+        self.assertIsNone(self.cache.get("epdx", "uuid-0", "00.01.000"))
+        self.assertLess(self.cache.get_stats()["bytes"], 1000)
+
+    def test_01_unversioned_lookups_use_latest_alias(self):
+        self.cache.put("ilcd", "uuid-0", "00.01.000", {"v": 1})
+        self.assertIsNone(self.cache.get("ilcd", "uuid-0"))
+        self.cache.put("ilcd", "uuid-0", "00.02.000", {"v": 2}, latest=True)
+        self.assertEqual({"v": 2}, self.cache.get("ilcd", "uuid-0"))
+
+    def test_02_latest_alias_expires(self):
+        cache = IlcdCacheService(Path(self.tmp_dir.name), datastock="test", max_bytes=1024 * 1024, latest_ttl=0)
+        cache.put("ilcd", "uuid-0", "00.01.000", {"v": 1}, latest=True)
+        time.sleep(0.01)
+        self.assertIsNone(cache.get("ilcd", "uuid-0"))
+        self.assertEqual({"v": 1}, cache.get("ilcd", "uuid-0", "00.01.000"))
+
+    def test_03_least_recently_used_entries_are_evicted(self):
+        cache = IlcdCacheService(Path(self.tmp_dir.name), datastock="test", max_bytes=2200)
+        noise = lambda i: {"data": os.urandom(600).hex(), "i": i}   # random hex, ~ 650 bytes on disk
+        for i in range(3):
+            cache.put("ilcd", f"uuid-{i}", "1", noise(i))
+            time.sleep(0.02)
+        cache.get("ilcd", "uuid-0", "1")   # uuid-0 becomes the most recently used
+        time.sleep(0.02)
+        for i in range(3, 5):
+            cache.put("ilcd", f"uuid-{i}", "1", noise(i))
+            time.sleep(0.02)
+        self.assertIsNotNone(cache.get("ilcd", "uuid-0", "1"))
+        self.assertIsNone(cache.get("ilcd", "uuid-1", "1"))
+        self.assertGreater(cache.get_stats()["evictions"], 0)
+        self.assertLessEqual(cache.get_stats()["bytes"], 2200)
+
+    def test_04_disabled_cache_stores_nothing(self):
+        cache = IlcdCacheService(Path(self.tmp_dir.name), datastock="test", max_bytes=0)
+        cache.put("ilcd", "uuid-0", "1", {"v": 1})
+        self.assertIsNone(cache.get("ilcd", "uuid-0", "1"))
+
+    def test_05_mapper_serves_repeated_requests_from_disk(self):
+        mapper = OkobauMapper(HttpClientService(rate_limit=0), self.cache)
+        first = mapper.uuid_to_ilcd("a-0")
+        second = mapper.uuid_to_ilcd("a-0")
+        versioned = mapper.uuid_to_ilcd("a-0", version="00.01.000")
+        self.assertEqual(first, second)
+        self.assertEqual(first, versioned)
+        self.assertEqual(1, IlcdStubHandler.attempts["a-0"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# backend/app/test/okobau/test_okobau_process_list.py
+import os
+import sys
+import unittest
+from itertools import islice
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.config import Config
+from app.infrastructure.infrastructure.services.http_client_service import HttpClientService
+from app.infrastructure.infrastructure.services.okobau_service import OkobauService
+from app.test.okobau.ilcd_stub_server import IlcdStubHandler, start_stub_server
+
+
+class TestOkobauProcessList(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server, url = start_stub_server()
+        cls.original_url = Config.EXTERNAL_RESOURCES.OKOBAU.PROCESS_LIST_URL
+        Config.EXTERNAL_RESOURCES.OKOBAU.PROCESS_LIST_URL = url.rstrip('/')
+        IlcdStubHandler.process_list = [{"uuid": f"uuid-{i}", "name": f"epd {i}", "version": "00.01.000"} for i in range(25)]
+        IlcdStubHandler.process_list.insert(7, {"name": "entry without uuid"})
+
+    @classmethod
+    def tearDownClass(cls):
+        Config.EXTERNAL_RESOURCES.OKOBAU.PROCESS_LIST_URL = cls.original_url
+        IlcdStubHandler.process_list = []
+        cls.server.shutdown()
+
+    def setUp(self):
+        IlcdStubHandler.reset()
+        self.service = OkobauService(mapper=None, http_client_service=HttpClientService(rate_limit=0, retries=0))
+
+    def test_walks_all_pages(self):
+        epds = list(self.service.iter_epd_responses(page_size=10))
+        self.assertEqual([epd.uuid for epd in epds], [f"uuid-{i}" for i in range(25)])   # invalid entry skipped
+        self.assertEqual(IlcdStubHandler.list_pages, [(0, 10), (10, 10), (20, 10)])
+
+    def test_is_lazy(self):
+        first = list(islice(self.service.iter_epd_responses(page_size=10), 5))
+        self.assertEqual(len(first), 5)
+        self.assertEqual(IlcdStubHandler.list_pages, [(0, 10)])
+
+    def test_exact_multiple_of_page_size_stops_on_total_count(self):
+        list(self.service.iter_epds(page_size=13))
+        self.assertEqual(IlcdStubHandler.list_pages, [(0, 13), (13, 13)])
+
+
+if __name__ == '__main__':
+    unittest.main()
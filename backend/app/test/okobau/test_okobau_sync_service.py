@@ -0,0 +1,51 @@
+# backend/app/test/okobau/test_okobau_sync_service.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.application.dtos.okobau.okobau_dto import EPDResponse
+from app.infrastructure.persistence.services.okobau_sync_service import OkobauSyncService
+
+
+class LocalVersionsProductService:
+    """Only answers the single set-based lookup the diff needs."""
+    def __init__(self, versions):
+        self.versions = versions
+
+    def get_product_versions_by_source(self, epd_sourceName):
+        return self.versions
+
+
+def epd(uuid, version):
+    return EPDResponse(uuid=uuid, name=uuid, version=version)
+
+
+class TestOkobauSyncDiff(unittest.TestCase):
+    def setUp(self):
+        local = {
+            "same": [(1, "00.01.000")],
+            "changed": [(2, "00.01.000"), (5, "00.02.000")],
+            "gone": [(3, "00.01.000"), (4, "00.02.000")],
+            "older-row": [(6, "00.01.000"), (7, "00.02.000")],
+        }
+        self.service = OkobauSyncService(None, None, LocalVersionsProductService(local))
+
+    def test_classifies_remote_list(self):
+        remote = [
+            epd("same", "00.01.000"),
+            epd("changed", "00.03.000"),
+            epd("new", "00.01.000"),
+            epd("older-row", "00.01.000"),
+        ]
+        new, changed, retired, unchanged = self.service.diff(remote)
+        self.assertEqual([e.uuid for e in new], ["new"])
+        # a changed epd updates the most recent product row of its uuid
+        self.assertEqual([(e.uuid, id) for e, id in changed], [("changed", 5)])
+        self.assertEqual(retired, [("gone", [3, 4])])
+        self.assertEqual(unchanged, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# backend/app/test/product/benchmark_impact_matrix.py
+# Times building the catalog ImpactMatrix and evaluating it against one get_impact_value_from_EPD per product, run it by hand:
+#   python app/test/product/benchmark_impact_matrix.py [products]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+import numpy as np
+
+from app.core.application.dtos.epdx.epdx_dto import EPD, ImpactCategoryKey, LifeCycleStage
+from app.core.domain.values.impact_matrix import ImpactMatrix
+from app.infrastructure.infrastructure.services.epdx_service import EpdxService
+
+INDICATORS = ("gwp", "gwp_fos", "gwp_bio", "gwp_lul", "odp", "ap", "ep_fw", "ep_mar", "ep_ter", "pocp", "adpe", "adpf",
+              "wdp", "penre", "pere", "penrt", "pert", "penrm", "perm", "fw")
+STAGES = ("a1a3", "a4", "a5", "c1", "c2", "c3", "c4", "d")
+
+
+def best_of(runs, f):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = f()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(count=50000, runs=5):
+    random.seed(1)
+    ids = list(range(1, count + 1))
+    # like product_impacts: most products declare a1a3, c3, c4 and d, some the other stages
+    rows = [(id, indicator, stage, random.uniform(-10, 100)) for id in ids for indicator in INDICATORS
+            for stage in STAGES if stage in ("a1a3", "c3", "c4", "d") or id % 3 == 0]
+    quantities = {id: random.uniform(0.1, 10) for id in ids}
+    print(f"{count} products, {len(rows)} impact rows, best of {runs}")
+
+    seconds, matrix = best_of(1, lambda: ImpactMatrix.from_rows(ids, rows))
+    print(f"  build matrix: {seconds * 1000:8.1f} ms, {(matrix.values.nbytes + matrix.mask.nbytes) / 2 ** 20:.0f} MB")
+
+    factors = np.fromiter((quantities[id] for id in matrix.ids.tolist()), dtype=np.float64, count=len(matrix))
+    seconds, _ = best_of(runs, lambda: matrix.evaluate(factors, stages=["a1a3", "a4", "a5"]).totals())
+    print(f"      evaluate: {seconds * 1000:8.1f} ms (quantities, a1a3-a5, totals)")
+    seconds, _ = best_of(runs, lambda: matrix.evaluate(factors).table("phase"))
+    print(f"   phase table: {seconds * 1000:8.1f} ms")
+
+    # the per product path, on a sample as it takes too long for the whole catalog
+    sample = 2000
+    impacts = {}
+    for id, indicator, stage, value in rows:
+        if id > sample:
+            break
+        impacts.setdefault(id, {}).setdefault(indicator, {})[stage] = value
+    epdx_service = EpdxService()
+    stages = [LifeCycleStage.a1a3, LifeCycleStage.a4, LifeCycleStage.a5]
+
+    def per_product():
+        return [epdx_service.get_impact_value_from_EPD(EPD(id=str(id), name="p", impacts=impacts[id]), ImpactCategoryKey.gwp, stages,
+                                                       conversion_factor=quantities[id]) for id in range(1, sample + 1)]
+    seconds, _ = best_of(1, per_product)
+    print(f"   per product: {seconds * count / sample * 1000:8.1f} ms (extrapolated from {sample}, gwp only)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
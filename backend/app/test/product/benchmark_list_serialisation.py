@@ -0,0 +1,65 @@
+# backend/app/test/product/benchmark_list_serialisation.py
+# Compares the marshal_with path of the product list with fast_json, run it by hand:
+#   python app/test/product/benchmark_list_serialisation.py [products]
+import gzip
+import json
+import os
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from flask import Flask
+from flask_restx import marshal
+from pydantic import TypeAdapter
+
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.presentation.controllers.product_controller import product_output_model
+from app.presentation.decorators.response_handling import COMPRESS_LEVEL
+
+
+def product(id):
+    impacts = {indicator: {stage: 1.5 * id for stage in ("a1a3", "a4", "a5", "c3", "c4", "d")}
+               for indicator in ("gwp", "odp", "ap", "ep", "pocp", "adpe", "adpf", "penrt", "pert")}
+    return Product_DTO(
+        id=id, epd_name=f"Transportbeton C25/30 {id}", epd_id=f"uuid-{id}", epd_version="00.01.000",
+        epd_sourceName="Oekobaudat", epd_declaredUnit="m3", status="default", epd_gross_density=2400.0,
+        epd_publishedDate="2020-01-01", epd_validUntil="2025-01-01", epd_location="DE",
+        epdx={"name": "Transportbeton", "declaredUnit": "m3", "impacts": impacts},
+    )
+
+
+def best_of(runs, f):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = f()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(count=2000, runs=5):
+    products = [product(id) for id in range(1, count + 1)]
+    adapter = TypeAdapter(List[Product_DTO])
+    include = {'__all__': set(product_output_model.resolved.keys())}
+    app = Flask(__name__)
+
+    def marshalled():
+        # what marshal_list_with + the restx json representation did per request
+        with app.app_context():
+            return json.dumps(marshal([p.model_dump() for p in products], product_output_model)).encode()
+
+    def fast():
+        return adapter.dump_json(products, include=include)
+
+    print(f"{count} products, best of {runs}")
+    for name, f in (("marshal_with", marshalled), ("fast_json", fast)):
+        seconds, body = best_of(runs, f)
+        zipped, compressed = best_of(runs, lambda: gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+        print(f"{name:>13}: {seconds * 1000:8.1f} ms {len(body) / 1024:8.0f} kB"
+              f" | gzip +{zipped * 1000:6.1f} ms {len(compressed) / 1024:6.0f} kB")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
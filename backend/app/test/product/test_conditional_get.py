@@ -0,0 +1,67 @@
+# backend/app/test/product/test_conditional_get.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from flask import Flask
+from flask_restx import Api, Resource, fields
+
+from app.presentation.decorators.conditional_get import etag
+
+
+class CountingService:
+    def __init__(self):
+        self.version = 1
+        self.loads = 0
+
+    def get_change_stamp(self, id=None):
+        return None if id == 404 else f"{id}:{self.version}"
+
+    def load(self, id):
+        self.loads += 1
+        return {"id": id, "version": self.version}
+
+
+class TestConditionalGet(unittest.TestCase):
+    def setUp(self):
+        app = Flask(__name__)
+        api = Api(app)
+        service = self.service = CountingService()
+        model = api.model('Item', {'id': fields.Integer, 'version': fields.Integer})
+
+        @api.route('/items/<int:id>')
+        class Item(Resource):
+            @etag(lambda id: service.get_change_stamp(id))
+            @api.marshal_with(model)
+            def get(self, id):
+                if id == 404:
+                    api.abort(404)
+                return service.load(id)
+
+        self.client = app.test_client()
+
+    def test_not_modified_skips_the_view(self):
+        first = self.client.get('/items/1')
+        self.assertEqual(first.status_code, 200)
+        tag = first.headers['ETag']
+        again = self.client.get('/items/1', headers={'If-None-Match': tag})
+        self.assertEqual((again.status_code, again.data, again.headers['ETag']), (304, b'', tag))
+        self.assertEqual(self.service.loads, 1)
+
+        self.service.version = 2
+        changed = self.client.get('/items/1', headers={'If-None-Match': tag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers['ETag'], tag)
+        self.assertEqual(changed.json['version'], 2)
+
+    def test_tags_differ_per_url_and_missing_rows_have_none(self):
+        self.assertNotEqual(self.client.get('/items/1').headers['ETag'], self.client.get('/items/1?x=1').headers['ETag'])
+        missing = self.client.get('/items/404')
+        self.assertEqual(missing.status_code, 404)
+        self.assertNotIn('ETag', missing.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
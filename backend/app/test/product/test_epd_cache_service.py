@@ -0,0 +1,102 @@
+# backend/app/test/product/test_epd_cache_service.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.application.dtos.epdx.epdx_dto import ImpactCategoryKey
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.infrastructure.infrastructure.services.epd_cache_service import EpdCacheService
+from app.infrastructure.infrastructure.services.epdx_service import EpdxService
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_service import ProductService
+from app.test import SqliteTestCase
+
+
+class AcceptingEpdxService(EpdxService):
+    def validate_epdx(self, epdx):
+        return True
+
+
+def epdx(gwp):
+    return {"name": "concrete", "id": "u", "impacts": {"gwp": {"a1a3": gwp}}, "declaredUnit": "m3"}
+
+
+def product(id, gwp=1.0, version="00.01.000", updated_at=None):
+    return Product_DTO(
+        id=id, epd_name="concrete", epd_id=f"uuid-{id}", epd_version=version, epd_sourceName="Oekobaudat",
+        epd_declaredUnit="m3", status="default", epdx=epdx(gwp), updated_at=updated_at,
+    )
+
+
+class TestEpdCacheService(unittest.TestCase):
+    def test_hits_and_lru_eviction(self):
+        cache = EpdCacheService(max_entries=2)
+        first = cache.get_epd(product(1))
+        self.assertIs(cache.get_epd(product(1)), first)
+        cache.get_epd(product(2))
+        cache.get_epd(product(1))      # 2 is now the least recently used
+        cache.get_epd(product(3))
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"], stats["entries"]), (2, 3, 1, 2))
+        cache.get_epd(product(2))
+        self.assertEqual(cache.get_stats()["misses"], 4)
+
+    def test_new_version_replaces_entry(self):
+        cache = EpdCacheService(max_entries=10)
+        self.assertEqual(cache.get_epd(product(1, gwp=1.0)).impacts["gwp"]["a1a3"], 1.0)
+        updated = cache.get_epd(product(1, gwp=2.0, version="00.02.000"))
+        self.assertEqual(updated.impacts["gwp"]["a1a3"], 2.0)
+        self.assertEqual((cache.get_stats()["entries"], cache.get_stats()["invalidations"]), (1, 1))
+        cache.invalidate(1)
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_unstored_and_disabled_are_not_cached(self):
+        cache = EpdCacheService(max_entries=10)
+        cache.get_epd(product(None))
+        disabled = EpdCacheService(max_entries=0)
+        disabled.get_epd(product(1))
+        self.assertEqual(cache.get_stats()["entries"] + disabled.get_stats()["entries"], 0)
+
+
+class TestProductServiceEpdCache(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = EpdCacheService(max_entries=10)
+        self.service = ProductService(
+            product_read_repository=ProductReadRepository(self.db),
+            product_write_repository=ProductWriteRepository(self.db),
+            product_mapper=ProductMapper,
+            epdx_service=AcceptingEpdxService(),
+            epd_cache_service=self.cache,
+        )
+
+    def test_update_and_delete_invalidate(self):
+        stored = self.service.create_product(product(None, gwp=1.0))
+        self.assertIsNotNone(stored.updated_at)
+        self.assertEqual(self.service.get_epd_from_product_dto(stored).impacts["gwp"]["a1a3"], 1.0)
+        self.service.get_epd_from_product_dto(self.service.get_product_by_id(stored.id))
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+
+        self.service.update_product(stored.id, product(None, gwp=3.0))
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+        updated = self.service.get_product_by_id(stored.id)
+        self.assertEqual(self.service.get_epd_from_product_dto(updated).impacts["gwp"]["a1a3"], 3.0)
+
+        self.assertTrue(self.service.delete_product(stored.id))
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+        self.assertFalse(self.service.delete_product(stored.id))
+
+    def test_impact_value_is_one_lookup(self):
+        stored = self.service.create_product(product(None, gwp=2.0))
+        self.assertEqual(self.service.get_impact_from_product_dto(ImpactCategoryKey.gwp, stored), 2.0)
+        self.assertEqual(self.service.get_impact_from_product_dto(ImpactCategoryKey.gwp, stored), 2.0)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# backend/app/test/product/test_fast_json.py
+import gzip
+import os
+import sys
+import unittest
+import zlib
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from flask import Flask
+from flask_restx import Api, Resource, marshal
+
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.presentation.controllers.product_controller import product_ns, product_output_model
+from app.presentation.decorators.conditional_get import etag
+from app.presentation.decorators.response_handling import MIN_COMPRESS_BYTES, fast_json
+
+
+def product(id):
+    return Product_DTO(
+        id=id, epd_name=f"concrete {id}", epd_id=f"uuid-{id}", epd_version="00.01.000", epd_sourceName="Oekobaudat",
+        epd_declaredUnit="m3", status="default", epd_gross_density=2400.0,
+        epdx={"name": "concrete", "impacts": {"gwp": {"a1a3": 250.0 + id}}},
+    )
+
+
+class TestFastJson(unittest.TestCase):
+    def setUp(self):
+        app = Flask(__name__)
+        api = Api(app)
+        api.models.update(product_ns.models)
+        self.count = 50
+        self.version = 1
+        test = self
+
+        @api.route('/products')
+        class Products(Resource):
+            @api.response(200, 'Success', [product_output_model])
+            @etag(lambda: f"products:{test.version}")
+            @fast_json(List[Product_DTO], product_output_model)
+            def get(self):
+                return [product(id) for id in range(1, test.count + 1)]
+
+        self.api = api
+        self.client = app.test_client()
+
+    def test_body_matches_the_marshalled_one(self):
+        response = self.client.get('/products')
+        self.assertEqual((response.status_code, response.mimetype), (200, 'application/json'))
+        self.assertNotIn('Content-Encoding', response.headers)
+        marshalled = marshal([product(id).model_dump() for id in range(1, self.count + 1)], product_output_model)
+        # the fast path leaves out documented fields the dto does not have instead of writing null
+        expected = [{key: value for key, value in item.items() if key in Product_DTO.model_fields} for item in marshalled]
+        self.assertEqual(response.json, expected)
+        self.assertNotIn('updated_at', response.json[0])
+
+    def test_compression_is_negotiated(self):
+        plain = self.client.get('/products').data
+        gzipped = self.client.get('/products', headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(gzipped.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', gzipped.headers['Vary'])
+        self.assertEqual(gzip.decompress(gzipped.data), plain)
+        self.assertLess(len(gzipped.data), len(plain))
+
+        deflated = self.client.get('/products', headers={'Accept-Encoding': 'deflate'})
+        self.assertEqual(deflated.headers['Content-Encoding'], 'deflate')
+        self.assertEqual(zlib.decompress(deflated.data), plain)
+
+        refused = self.client.get('/products', headers={'Accept-Encoding': 'gzip;q=0'})
+        self.assertNotIn('Content-Encoding', refused.headers)
+
+    def test_small_bodies_stay_plain(self):
+        self.count = 1
+        response = self.client.get('/products', headers={'Accept-Encoding': 'gzip'})
+        self.assertLess(len(response.data), MIN_COMPRESS_BYTES)
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_etag_per_encoding(self):
+        gzipped = self.client.get('/products', headers={'Accept-Encoding': 'gzip'})
+        tag = gzipped.headers['ETag']
+        self.assertNotEqual(tag, self.client.get('/products').headers['ETag'])
+        again = self.client.get('/products', headers={'Accept-Encoding': 'gzip', 'If-None-Match': tag})
+        self.assertEqual(again.status_code, 304)
+        self.version = 2
+        changed = self.client.get('/products', headers={'Accept-Encoding': 'gzip', 'If-None-Match': tag})
+        self.assertEqual(changed.status_code, 200)
+
+    def test_swagger_documents_the_list(self):
+        with self.api.app.test_request_context():
+            spec = self.api.__schema__
+        schema = spec['paths']['/products']['get']['responses']['200']['schema']
+        self.assertEqual(schema, {'type': 'array', 'items': {'$ref': '#/definitions/Product'}})
+        self.assertIn('ProductInput', spec['definitions'])
+
+
+if __name__ == '__main__':
+    unittest.main()
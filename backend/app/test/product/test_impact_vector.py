@@ -0,0 +1,68 @@
+# backend/app/test/product/test_impact_vector.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.application.dtos.epdx.epdx_dto import EPD, ImpactCategoryKey, LifeCycleStage
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.core.domain.values.impact_vector import PHASES, ImpactVector
+from app.infrastructure.infrastructure.services.epd_cache_service import EpdCacheService
+from app.infrastructure.infrastructure.services.epdx_service import EpdxService
+
+IMPACTS = {"gwp": {"a1a3": 100.0, "a4": 2.0, "c3": 5.0, "d": -10.0, "b6": None}, "odp": {"a1a3": 0.0}, "custom": {"a1a3": 1.0}}
+
+
+class TestImpactVector(unittest.TestCase):
+    def setUp(self):
+        self.vector = ImpactVector.from_impacts(IMPACTS)
+
+    def test_declared_values_and_mask(self):
+        self.assertEqual(self.vector.to_dict(), {"gwp": {"a1a3": 100.0, "a4": 2.0, "c3": 5.0, "d": -10.0}, "odp": {"a1a3": 0.0}})
+        # declared as 0 is kept apart from not declared
+        self.assertEqual(self.vector.total("odp"), 0.0)
+        self.assertIsNone(self.vector.total(ImpactCategoryKey.ap))
+        self.assertFalse(self.vector.values.flags.writeable)
+
+    def test_scale_sum_and_stage_mask(self):
+        other = ImpactVector.from_impacts({"gwp": {"a1a3": 1.0}, "ap": {"c4": 3.0}})
+        summed = ImpactVector.sum([self.vector.scale(2), other])
+        self.assertEqual(summed.to_dict()["gwp"]["a1a3"], 201.0)
+        self.assertEqual(summed.to_dict()["ap"], {"c4": 3.0})
+        self.assertEqual(summed, self.vector * 2 + other)
+        self.assertEqual(ImpactVector.sum([]), ImpactVector.zeros())
+
+        masked = self.vector.mask_stages([LifeCycleStage.a1a3, "c3"])
+        self.assertEqual(masked.total("gwp"), 105.0)
+        self.assertEqual(self.vector.select(indicators=["odp"]).to_dict(), {"odp": {"a1a3": 0.0}})
+
+    def test_phase_reduction(self):
+        self.assertEqual(PHASES[0], "production")
+        self.assertEqual(self.vector.phases_to_dict()["gwp"], {"production": 100.0, "construction": 2.0, "disposal": 5.0, "reuse": -10.0})
+        self.assertEqual(self.vector.phase_values().shape, (len(ImpactCategoryKey), len(PHASES)))
+
+
+class TestImpactValueFromEpd(unittest.TestCase):
+    def setUp(self):
+        self.epd = EPD(id="u", name="concrete", impacts=IMPACTS)
+        self.service = EpdxService()
+
+    def test_sum_over_stages(self):
+        self.assertEqual(self.service.get_impact_value_from_EPD(self.epd, ImpactCategoryKey.gwp), 97.0)
+        self.assertEqual(self.service.get_impact_value_from_EPD(self.epd, ImpactCategoryKey.gwp, [LifeCycleStage.a1a3, LifeCycleStage.a4]), 102.0)
+        self.assertEqual(self.service.get_impact_value_from_EPD(self.epd, ImpactCategoryKey.gwp, [LifeCycleStage.b1]), 0)
+        self.assertIsNone(self.service.get_impact_value_from_EPD(self.epd, ImpactCategoryKey.ap))
+        self.assertEqual(self.service.get_impact_value_from_EPD(self.epd, ImpactCategoryKey.gwp, conversion_factor=2, normalize_to=4), 48.5)
+
+    def test_cache_builds_the_vector_once(self):
+        cache = EpdCacheService(max_entries=10)
+        product = Product_DTO(id=1, epd_name="concrete", epd_id="u", epd_version="00.01.000", epd_sourceName="Oekobaudat",
+                              epd_declaredUnit="m3", status="default", epdx=self.epd.model_dump())
+        vector = cache.get_impact_vector(product)
+        self.assertIs(cache.get_impact_vector(product), vector)
+        self.assertEqual(vector, ImpactVector.from_epd(self.epd))
+
+
+if __name__ == '__main__':
+    unittest.main()
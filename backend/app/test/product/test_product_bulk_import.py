@@ -0,0 +1,97 @@
+# backend/app/test/product/test_product_bulk_import.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.application.dtos.product.product_dto import Product_DTO
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_service import ProductService
+from app.test import SqliteTestCase, product_row
+
+
+class EpdxFlagService:
+    """Treats an epdx as valid unless it is marked invalid."""
+    def validate_epdx(self, epdx):
+        return not epdx.get("invalid")
+
+
+class TestProductBulkImport(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.read_repo = ProductReadRepository(self.db)
+        self.service = ProductService(
+            product_read_repository=self.read_repo,
+            product_write_repository=ProductWriteRepository(self.db),
+            product_mapper=ProductMapper,
+            epdx_service=EpdxFlagService(),
+            bulk_batch_size=2,
+        )
+
+    def test_creates_skips_and_fails(self):
+        report = self.service.create_product_from_dto_list([
+            Product_DTO(**product_row(epd_id="a")),
+            Product_DTO(**product_row(epd_id="b")),
+            Product_DTO(**product_row(epd_id="a")),                            # repeated in the input
+            Product_DTO(**product_row(epd_id="a", epd_version="00.02.000")),   # new version of a stored epd
+            Product_DTO(**product_row(epd_id="c", epdx={"invalid": True})),
+            Product_DTO(**product_row(epd_id="d")),
+        ], user_id=None)
+        self.assertEqual(report.created, ["Oekobaudat.a@00.01.000", "Oekobaudat.b@00.01.000", "Oekobaudat.a@00.02.000",
+                                          "Oekobaudat.d@00.01.000"])
+        self.assertEqual(report.skipped, ["Oekobaudat.a@00.01.000"])
+        self.assertEqual(list(report.failed), ["Oekobaudat.c@00.01.000"])
+        self.assertEqual(len(self.read_repo.get_all()), 4)
+
+        report = self.service.create_product_from_dto_list([Product_DTO(**product_row(epd_id=epd_id)) for epd_id in ("a", "b", "e")])
+        self.assertEqual(report.created, ["Oekobaudat.e@00.01.000"])
+        self.assertEqual(report.skipped, ["Oekobaudat.a@00.01.000", "Oekobaudat.b@00.01.000"])
+
+    def test_rows_stored_concurrently_are_conflicts(self):
+        # another writer stores b between the existence check and the insert
+        get_existing_keys = self.read_repo.get_existing_keys
+        self.read_repo.get_existing_keys = lambda keys: set() if len(keys) > 1 else get_existing_keys(keys)
+        self.service.create_validated_product_list([Product_DTO(**product_row(epd_id="b"))])
+        report = self.service.create_product_from_dto_list([Product_DTO(**product_row(epd_id=epd_id)) for epd_id in ("a", "b")])
+        self.assertEqual(report.created, ["Oekobaudat.a@00.01.000"])
+        self.assertEqual(report.conflicts, ["Oekobaudat.b@00.01.000"])
+        self.assertEqual(report.failed, {})
+        self.assertEqual(len(self.read_repo.get_all()), 2)
+
+    def test_failing_batch_is_bisected(self):
+        self.service._bulk_batch_size = 8
+        write_repo = self.service._write_repo
+        bulk_insert, calls = write_repo.bulk_insert, []
+
+        def failing_insert(rows, skip_conflicts=True):
+            calls.append(len(rows))
+            if any(row["epd_id"] == "p5" for row in rows):
+                raise ValueError("broken row")
+            return bulk_insert(rows, skip_conflicts)
+
+        write_repo.bulk_insert = failing_insert
+        report = self.service.create_product_from_dto_list([Product_DTO(**product_row(epd_id=f"p{i}")) for i in range(8)])
+        self.assertEqual(calls, [8, 4, 4, 2, 1, 1, 2])   # 7 statements, not 1 + 8
+        self.assertEqual(len(report.created), 7)
+        self.assertEqual(report.failed, {"Oekobaudat.p5@00.01.000": "ValueError: broken row"})
+
+    def test_validated_list_counts_new_rows(self):
+        self.assertEqual(self.service.create_validated_product_list([Product_DTO(**product_row(epd_id=epd_id)) for epd_id in ("a", "b")]), 2)
+        # stored and repeated rows are not counted, whatever rowcount the driver reports
+        self.service._write_repo.bulk_insert = lambda rows, skip_conflicts=True: -1 if rows else 0
+        self.assertEqual(self.service.create_validated_product_list([Product_DTO(**product_row(epd_id=epd_id)) for epd_id in ("a", "c", "c")]), 1)
+        self.assertEqual(self.service.create_validated_product_list([Product_DTO(**product_row(epd_id="a"))]), 0)
+
+    def test_existing_keys_in_one_query(self):
+        self.service.create_product_from_dto_list([
+            Product_DTO(**product_row(epd_id="a")), Product_DTO(**product_row(epd_id="b", epd_sourceName="other")),
+        ])
+        keys = [("Oekobaudat", "a", "00.01.000"), ("Oekobaudat", "b", "00.01.000"), ("other", "b", "00.01.000")]
+        self.assertEqual(self.read_repo.get_existing_keys(keys), {keys[0], keys[2]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# backend/app/test/product/test_product_export.py
+import csv
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from sqlalchemy import event
+
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_service import ProductService
+from app.presentation.decorators.response_handling import csv_chunks, ndjson_chunks
+from app.test import SqliteTestCase, product_row
+
+
+class AcceptingEpdxService:
+    def validate_epdx(self, epdx):
+        return True
+
+
+class TestProductExport(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.read_repo = ProductReadRepository(self.db)
+        ProductWriteRepository(self.db).bulk_insert([
+            product_row(epd_id="a", impacts={"gwp": {"a1a3": 300.0, "c3": 1.5}, "odp": {"a1a3": 0.001}}),
+            product_row(epd_id="b", impacts={"gwp": {"a1a3": 120.0}}),
+            product_row(epd_id="c", status="inactive"),
+        ])
+        self.service = ProductService(self.read_repo, ProductWriteRepository(self.db), ProductMapper(), AcceptingEpdxService(),
+                                      stream_batch_size=2)
+
+    def test_stream_batches_impacts_per_product(self):
+        statements = []
+        event.listen(self.db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        rows = list(self.read_repo.stream(["epd_id"], with_impacts=True, batch_size=2))
+        # the products, then the impacts of each batch of two
+        self.assertEqual(len(statements), 3)
+        self.assertEqual([(product["epd_id"], impacts) for product, impacts in rows], [
+            ("a", {("gwp", "a1a3"): 300.0, ("gwp", "c3"): 1.5, ("odp", "a1a3"): 0.001}),
+            ("b", {("gwp", "a1a3"): 120.0}),
+            ("c", {}),
+        ])
+        self.assertEqual(set(rows[0][0]), {"id", "epd_id"})
+
+    def test_export_flattens_impacts(self):
+        fieldnames, rows = self.service.export_products(["epd_id", "status"], {"status": "default"}, True, ["gwp"])
+        self.assertEqual(fieldnames, ["id", "epd_id", "status", "gwp.a1a3", "gwp.c3"])
+        rows = list(rows)
+        self.assertEqual([(row["epd_id"], row.get("gwp.a1a3"), row.get("gwp.c3")) for row in rows],
+                         [("a", 300.0, 1.5), ("b", 120.0, None)])
+        self.assertNotIn("odp.a1a3", rows[0])
+
+    def test_default_columns_leave_epdx_out(self):
+        fieldnames, rows = self.service.export_products()
+        self.assertIn("epd_declaredUnit", fieldnames)
+        self.assertNotIn("epdx", fieldnames)
+        self.assertEqual(len(list(rows)), 3)
+
+    def test_unknown_column_fails_before_streaming(self):
+        with self.assertRaises(ValueError):
+            self.service.export_products(["nope"])
+
+    def test_ndjson_and_csv_bodies(self):
+        fieldnames, rows = self.service.export_products(["epd_id"], None, True)
+        lines = b"".join(ndjson_chunks(fieldnames, rows)).decode().splitlines()
+        parsed = [json.loads(line) for line in lines]
+        self.assertEqual([set(item) for item in parsed], [set(fieldnames)] * 3)
+        self.assertEqual((parsed[0]["odp.a1a3"], parsed[1]["odp.a1a3"]), (0.001, None))
+
+        fieldnames, rows = self.service.export_products(["epd_id", "epdx"], None, True)
+        table = list(csv.DictReader(io.StringIO(b"".join(csv_chunks(fieldnames, rows)).decode())))
+        self.assertEqual([(item["epd_id"], item["gwp.a1a3"]) for item in table], [("a", "300.0"), ("b", "120.0"), ("c", "")])
+        self.assertEqual(json.loads(table[1]["epdx"]), {"id": "b", "name": "product b", "impacts": {"gwp": {"a1a3": 120.0}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# backend/app/test/product/test_product_impact_service.py
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+import numpy as np
+from sqlalchemy import delete, event, update
+
+from app.core.domain.entities import Product, ProductImpact
+from app.core.domain.values.impact_matrix import ImpactMatrix
+from app.core.domain.values.impact_vector import ImpactVector
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_impact_service import ProductImpactService
+from app.test import SqliteTestCase, product_row
+
+
+class TestImpactMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = ImpactMatrix.from_rows([3, 1, 2], [
+            (1, "gwp", "a1a3", 100.0), (1, "gwp", "c3", 5.0), (1, "odp", "a1a3", 0.0),
+            (2, "gwp", "a1a3", 10.0), (2, "gwp", "d", None), (2, "custom", "a1a3", 1.0), (9, "gwp", "a1a3", 1.0),
+        ])
+
+    def test_axes_hold_what_occurs(self):
+        self.assertEqual(self.matrix.ids.tolist(), [1, 2, 3])
+        self.assertEqual((self.matrix.indicators, self.matrix.stages), (("gwp", "odp"), ("a1a3", "c3", "d")))
+        self.assertFalse(self.matrix.mask[2].any())
+        self.assertEqual(self.matrix.vector(0), ImpactVector.from_impacts({"gwp": {"a1a3": 100.0, "c3": 5.0}, "odp": {"a1a3": 0.0}}))
+
+    def test_evaluate_scales_and_masks_in_one_pass(self):
+        evaluated = self.matrix.evaluate(np.array([2.0, np.nan, 1.0]), stages=["a1a3"])
+        self.assertEqual(evaluated.stages, ("a1a3",))
+        values, mask = evaluated.totals()
+        self.assertEqual(values[0].tolist(), [200.0, 0.0])
+        self.assertEqual(mask.tolist(), [[True, True], [False, False], [False, False]])
+
+    def test_table(self):
+        columns, values, mask = self.matrix.table("phase")
+        self.assertEqual(columns, ["gwp.production", "gwp.disposal", "odp.production"])
+        self.assertEqual(values[0].tolist(), [100.0, 5.0, 0.0])
+        taken, missing = self.matrix.take([2, 7, 1])
+        self.assertEqual((taken.ids.tolist(), missing), ([2, 1], [7]))
+        with self.assertRaises(ValueError):
+            self.matrix.table("element")
+        self.assertEqual(ImpactMatrix.from_rows([], []).table("phase")[0], [])
+
+
+class TestProductImpactService(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.read_repo = ProductReadRepository(self.db)
+        self.write_repo = ProductWriteRepository(self.db)
+        self.write_repo.bulk_insert([
+            product_row(epd_id="concrete", impacts={"gwp": {"a1a3": 250.0, "c3": 10.0, "d": -5.0}, "odp": {"a1a3": 0.002}}),
+            product_row(epd_id="steel", impacts={"gwp": {"a1a3": 2.0}}),
+            product_row(epd_id="wood", impacts={"gwp": {"a1a3": -700.0, "c3": 750.0}}),
+        ])
+        self.service = ProductImpactService(self.read_repo)
+
+    def test_quantities_conversions_and_stages(self):
+        table = self.service.evaluate_impacts([2, 1, 5], quantities={1: 0.5, 2: 10}, conversion_factors={2: 7850.0},
+                                              indicators=["gwp"], stages=["a1a3", "c3"])
+        self.assertEqual((table.columns, table.product_ids, table.missing), (["gwp"], [2, 1], [5]))
+        self.assertEqual(table.values, [[157000.0], [130.0]])
+
+    def test_tables_by_phase_and_stage(self):
+        table = self.service.evaluate_impacts(by="stage")
+        self.assertEqual(table.product_ids, [1, 2, 3])
+        self.assertEqual(table.columns, ["gwp.a1a3", "gwp.c3", "gwp.d", "odp.a1a3"])
+        self.assertEqual(table.values[1], [2.0, None, None, None])
+        by_phase = self.service.evaluate_impacts([3], by="phase")
+        self.assertEqual((by_phase.columns, by_phase.values), (["gwp.production", "gwp.disposal"], [[-700.0, 750.0]]))
+
+    def test_catalog_is_cached_until_products_change(self):
+        statements = []
+        event.listen(self.db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        self.service.evaluate_matrix()
+        loaded = len(statements)
+        self.service.evaluate_matrix([1])
+        self.assertEqual(len(statements), loaded + 1)    # only the change stamp
+        self.write_repo.bulk_insert([product_row(epd_id="glass", impacts={"gwp": {"a1a3": 30.0}})])
+        matrix, _, _ = self.service.evaluate_matrix()
+        self.assertEqual(matrix.ids.tolist(), [1, 2, 3, 4])
+
+    def test_catalog_is_reloaded_after_impacts_are_rebuilt(self):
+        matrix, _, _ = self.service.evaluate_matrix([1])
+        self.assertEqual(matrix.vector(0).values[0, 1], 250.0)
+        # the epdx fixed in place, as a migration would, products keep their change stamp
+        with self.db.session() as session:
+            session.execute(update(Product).where(Product.id == 1).values(
+                epdx={"id": "concrete", "name": "concrete", "impacts": {"gwp": {"a1a3": 240.0, "c3": 10.0, "d": -5.0}, "odp": {"a1a3": 0.002}}}
+            ))
+        self.assertEqual(self.service.evaluate_matrix([1])[0].vector(0).values[0, 1], 250.0)
+        self.assertEqual(self.write_repo.rebuild_impacts(), 3)
+        self.assertEqual(self.service.evaluate_matrix([1])[0].vector(0).values[0, 1], 240.0)
+
+        with self.db.session() as session:
+            session.execute(delete(ProductImpact))
+        self.assertFalse(self.service.evaluate_matrix()[0].totals()[1].any())
+
+    def test_without_cache_only_the_requested_products_are_loaded(self):
+        service = ProductImpactService(self.read_repo, cache_catalog=False, batch_size=1)
+        matrix, missing, errors = service.evaluate_matrix([3, 1, 3, 8], quantities={3: None})
+        self.assertEqual((matrix.ids.tolist(), missing, errors), ([3, 1], [8], {}))
+        totals, declared = matrix.totals()
+        self.assertEqual(declared[:, 0].tolist(), [False, True])
+        self.assertTrue(math.isclose(totals[1, 0], 255.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# backend/app/test/product/test_product_impacts.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.domain.entities import Product, ProductImpact
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.services.product_service import ProductService
+from app.main import create_app
+from app.test import SqliteTestCase, product_row
+from dependency_injector import providers
+from sqlalchemy import delete, select, text
+
+
+def gwp_impacts(gwp, odp=None):
+    return {"gwp": {"a1a3": gwp, "c3": 1.5, "d": None}, "odp": {"a1a3": odp} if odp is not None else {}}
+
+
+class TestProductImpacts(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.read_repo = ProductReadRepository(self.db)
+        self.write_repo = ProductWriteRepository(self.db)
+
+    def impacts(self):
+        with self.db.session() as session:
+            result = session.execute(select(ProductImpact.product_id, ProductImpact.indicator, ProductImpact.stage, ProductImpact.value))
+            return sorted(tuple(row) for row in result.all())
+
+    def test_bulk_insert_writes_impacts_once(self):
+        self.write_repo.bulk_insert([product_row(epd_id="a", impacts=gwp_impacts(300.0)), product_row(epd_id="b", impacts=gwp_impacts(120))])
+        self.write_repo.bulk_insert([product_row(epd_id="a", impacts=gwp_impacts(999.0)), product_row(epd_id="c", impacts=gwp_impacts(50.0))])   # "a" is already stored, keeps its values
+        ids = {product.epd_id: product.id for product in self.read_repo.get_all()}
+        self.assertEqual(self.impacts(), sorted([
+            (ids["a"], "gwp", "a1a3", 300.0), (ids["a"], "gwp", "c3", 1.5),
+            (ids["b"], "gwp", "a1a3", 120.0), (ids["b"], "gwp", "c3", 1.5),
+            (ids["c"], "gwp", "a1a3", 50.0), (ids["c"], "gwp", "c3", 1.5),
+        ]))
+
+    def test_create_update_delete_keep_impacts_in_sync(self):
+        product = self.write_repo.create(Product(**product_row(epd_id="a", impacts=gwp_impacts(10.0))))
+        self.assertIn((product.id, "gwp", "a1a3", 10.0), self.impacts())
+
+        product.epdx = {"impacts": gwp_impacts(20.0, odp=0.001)}
+        self.write_repo.update(product)
+        self.assertEqual(self.impacts(), sorted([
+            (product.id, "gwp", "a1a3", 20.0), (product.id, "gwp", "c3", 1.5), (product.id, "odp", "a1a3", 0.001),
+        ]))
+
+        self.write_repo.delete(product.id)
+        self.assertEqual(self.impacts(), [])
+
+    def test_rebuild_and_rank(self):
+        self.write_repo.bulk_insert([product_row(epd_id=f"p{i}", impacts=gwp_impacts(float(i * 10))) for i in range(1, 8)])
+        with self.db.session() as session:
+            session.execute(delete(ProductImpact))
+        self.assertEqual(self.write_repo.rebuild_impacts(batch_size=3), 7)
+        self.assertEqual(len(self.impacts()), 14)
+
+        ranked = self.read_repo.rank_by_impact("gwp", "a1a3", limit=3, max_value=55.0, descending=True)
+        self.assertEqual([value for _, value in ranked], [50.0, 40.0, 30.0])
+        ranked = self.read_repo.rank_by_impact("gwp", "a1a3", limit=10, min_value=60.0)
+        self.assertEqual([value for _, value in ranked], [60.0, 70.0])
+
+    def test_ranking_uses_index(self):
+        with self.db.session() as session:
+            plan = session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT product_id, value FROM product_impacts "
+                "WHERE indicator = 'gwp' AND stage = 'a1a3' AND value <= 10 ORDER BY value LIMIT 5"
+            )).all()
+        details = " ".join(str(step[-1]) for step in plan)
+        self.assertIn("USING COVERING INDEX ix_product_impacts_indicator_stage_value", details)
+        self.assertNotIn("TEMP B-TREE", details)
+
+
+class TestProductRankingEndpoint(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        ProductWriteRepository(self.db).bulk_insert([
+            product_row(epd_id=f"p{i}", epd_sourceName="other" if i == 2 else "Oekobaudat", impacts=gwp_impacts(float(i * 10)))
+            for i in range(1, 6)
+        ])
+        service = ProductService(
+            product_read_repository=ProductReadRepository(self.db),
+            product_write_repository=ProductWriteRepository(self.db),
+            product_mapper=ProductMapper,
+            epdx_service=None,
+        )
+        self.app = create_app()
+        self.app.container.product_service.override(providers.Object(service))
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        self.app.container.product_service.reset_override()
+        super().tearDown()
+
+    def test_ranking_with_page_filters(self):
+        response = self.client.get('/products/ranking?indicator=gwp&stage=a1a3&order=desc&limit=3&max=45&source=Oekobaudat')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(rank['value'], rank['product']['epd_id']) for rank in response.json], [(40.0, "p4"), (30.0, "p3"), (10.0, "p1")])
+        self.assertNotIn('epdx', response.json[0]['product'])
+
+        response = self.client.get('/products/ranking?indicator=gwp&stage=a1a3&min=20&limit=2')
+        self.assertEqual([rank['product']['epd_id'] for rank in response.json], ["p2", "p3"])
+        self.assertEqual(self.client.get('/products/ranking?indicator=gwp').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# backend/app/test/product/test_product_paging.py
+import os
+import sys
+import unittest
+
+from sqlalchemy import inspect
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.application.dtos.product.product_dto import ProductHeader_DTO
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.test import SqliteTestCase, product_row
+
+
+class TestProductPaging(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        ProductWriteRepository(self.db).bulk_insert([product_row(
+            status="retired" if i % 5 == 0 else "default",
+            epd_name=f"product {i % 7}",    # repeated names, so ties have to be broken by id
+            epd_declaredUnit="kg" if i % 2 else "m3",
+            epd_id=f"uuid-{i}", epd_validUntil=f"20{20 + i % 10}-12-31",
+        ) for i in range(1, 48)])
+        self.repo = ProductReadRepository(self.db)
+
+    def walk(self, **kwargs):
+        ids, cursor, pages = [], None, 0
+        while True:
+            page = self.repo.get_page(limit=10, cursor=cursor, **kwargs)
+            ids += [product.id for product in page.items]
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                return ids, pages
+
+    def test_walks_every_row_once_in_order(self):
+        ids, pages = self.walk()
+        self.assertEqual(ids, list(range(1, 48)))
+        self.assertEqual(pages, 5)
+
+    def test_sort_with_ties_is_stable(self):
+        ids, _ = self.walk(sort_by="epd_name", descending=True)
+        expected = sorted(range(1, 48), key=lambda i: (f"product {i % 7}", i), reverse=True)
+        self.assertEqual(ids, expected)
+
+    def test_filters_and_total(self):
+        filters = {"status": "default", "epd_declaredUnit": ["kg"], "epd_validUntil__gte": "2025-01-01"}
+        page = self.repo.get_page(limit=100, filters=filters, include_total=True)
+        expected = [i for i in range(1, 48) if i % 5 and i % 2 and 20 + i % 10 >= 25]
+        self.assertEqual([product.id for product in page.items], expected)
+        self.assertEqual(page.total, len(expected))
+        self.assertIsNone(page.next_cursor)
+
+    def test_rejects_bad_input(self):
+        with self.assertRaises(ValueError):
+            self.repo.get_page(limit=10, cursor="not-a-cursor")
+        with self.assertRaises(ValueError):
+            self.repo.get_page(limit=10, sort_by="epd_subtype")   # nullable
+        with self.assertRaises(ValueError):
+            self.repo.get_page(limit=10, filters={"epdx_size": 1})
+
+    def test_header_columns_leave_epdx_unloaded(self):
+        page = self.repo.get_page(limit=10, sort_by="epd_name", columns=ProductMapper.header_columns())
+        self.assertEqual(len(page.items), 10)
+        self.assertIn("epdx", inspect(page.items[0]).unloaded)
+        header = ProductMapper.entity_to_product_header_dto(page.items[0])
+        self.assertIsInstance(header, ProductHeader_DTO)
+        self.assertEqual((header.id, header.epd_id), (page.items[0].id, f"uuid-{page.items[0].id}"))
+        # the cursor still works on a projected page
+        following = self.repo.get_page(limit=10, sort_by="epd_name", cursor=page.next_cursor, columns=["epd_id"])
+        self.assertEqual(len(following.items), 10)
+        self.assertFalse({p.id for p in page.items} & {p.id for p in following.items})
+
+
+if __name__ == '__main__':
+    unittest.main()
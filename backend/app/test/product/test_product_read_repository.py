@@ -0,0 +1,73 @@
+# backend/app/test/product/test_product_read_repository.py
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.domain.entities import Product
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from sqlalchemy import text, update
+from sqlalchemy.exc import IntegrityError
+from app.test import SqliteTestCase, product_row
+
+
+class TestProductReadRepository(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.read_repo = ProductReadRepository(self.db)
+        self.write_repo = ProductWriteRepository(self.db)
+        self.write_repo.bulk_insert([product_row(epd_id="a"), product_row(epd_id="a", epd_version="00.02.000"), product_row(epd_id="b")])
+
+    def test_get_by_uri(self):
+        self.assertEqual(self.read_repo.get_by_uri("Oekobaudat", "a").epd_version, "00.02.000")   # latest row
+        self.assertEqual(self.read_repo.get_by_uri("Oekobaudat", "a", "00.01.000").epd_version, "00.01.000")
+        self.assertIsNone(self.read_repo.get_by_uri("Oekobaudat", "a", "00.03.000"))
+        self.assertIsNone(self.read_repo.get_by_uri("other", "b"))
+
+    def test_uri_lookup_uses_index(self):
+        with self.db.session() as session:
+            plan = session.execute(text(
+                'EXPLAIN QUERY PLAN SELECT * FROM products WHERE "epd_sourceName" = :source AND epd_id = :id ORDER BY id DESC LIMIT 1'
+            ), {"source": "Oekobaudat", "id": "a"}).all()
+        details = " ".join(str(step[-1]) for step in plan)
+        self.assertIn("SEARCH products USING INDEX ix_products_source_epd_id", details)   # no table scan, no sort
+
+    def test_versions_are_unique(self):
+        self.assertEqual(self.write_repo.bulk_insert([product_row(epd_id="a"), product_row(epd_id="c")]), 1)
+        with self.assertRaises(IntegrityError):
+            self.write_repo.create(Product(**product_row(epd_id="b")))
+
+    def test_change_stamp_follows_writes(self):
+        stamps = [self.read_repo.get_change_stamp()]
+        row_stamp = self.read_repo.get_change_stamp(1)
+        product = self.read_repo.get_by_id(1)
+        product.status = "retired"
+        self.write_repo.update(product)
+        stamps.append(self.read_repo.get_change_stamp())
+        self.assertNotEqual(self.read_repo.get_change_stamp(1), row_stamp)
+        self.assertEqual(self.read_repo.get_change_stamp(2), self.read_repo.get_change_stamp(2))
+        self.write_repo.delete(3)
+        stamps.append(self.read_repo.get_change_stamp())
+        self.write_repo.bulk_insert([product_row(epd_id="d")])   # same count as before the delete
+        stamps.append(self.read_repo.get_change_stamp())
+        self.assertEqual(len(set(stamps)), 4)
+        self.assertIsNone(self.read_repo.get_change_stamp(99))
+
+    def test_change_stamp_follows_edits_within_one_second(self):
+        same_second = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        stamps, row_stamps = [], []
+        for status in ("retired", "default"):
+            with self.db.session() as session:   # updated_at does not move, as for two edits in one mysql second
+                session.execute(update(Product).where(Product.id == 1).values(status=status, updated_at=same_second))
+            stamps.append(self.read_repo.get_change_stamp())
+            row_stamps.append(self.read_repo.get_change_stamp(1))
+        self.assertNotEqual(stamps[0], stamps[1])
+        self.assertNotEqual(row_stamps[0], row_stamps[1])
+        self.assertEqual(self.read_repo.get_by_id(1).row_version, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
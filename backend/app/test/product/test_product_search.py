@@ -0,0 +1,69 @@
+# backend/app/test/product/test_product_search.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.core.domain.entities import Product
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.test import SqliteTestCase, product_row
+from sqlalchemy import inspect
+
+
+class TestProductSearch(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.read_repo = ProductReadRepository(self.db)
+        self.write_repo = ProductWriteRepository(self.db)
+        self.write_repo.bulk_insert([
+            product_row(epd_id="beton-1", epd_name="Transportbeton C30/37", epd_description="Beton für Innenbauteile"),
+            product_row(epd_id="beton-2", epd_name="Transportbeton C20/25"),
+            product_row(epd_id="wolle-1", epd_name="Mineralwolle (Fassaden-Dämmung)", epd_description="Glaswolle, Steinwolle"),
+            product_row(epd_id="wolle-2", epd_name="Dämmplatte", epd_description="aus Mineralwolle gepresst, ohne Beton"),
+            product_row(epd_id="holz-1", epd_name="Konstruktionsvollholz", epd_description="enthält Beton nicht", status="retired"),
+        ])
+
+    def search(self, query, **kwargs):
+        return [product.epd_id for product in self.read_repo.search(query, limit=10, **kwargs).items]
+
+    def test_prefix_and_punctuation(self):
+        self.assertEqual(self.search("Transportbeton C30/37"), ["beton-1"])
+        self.assertEqual(sorted(self.search("transportbet")), ["beton-1", "beton-2"])
+        self.assertEqual(self.search("mineralwolle dammung"), ["wolle-1"])   # diacritics are folded
+        self.assertEqual(self.search('"; DROP TABLE products --'), [])
+        self.assertEqual(self.search("  /  "), [])
+
+    def test_name_ranks_before_description(self):
+        self.assertEqual(self.search("mineralwolle"), ["wolle-1", "wolle-2"])
+        self.assertEqual(sorted(self.search("beton")), ["beton-1", "holz-1", "wolle-2"])   # words, not substrings
+        self.assertEqual(sorted(self.search("beton", filters={"status": "default"})), ["beton-1", "wolle-2"])
+
+    def test_pages_and_header_columns(self):
+        first = self.read_repo.search("beton", limit=2, columns=ProductMapper.header_columns())
+        self.assertEqual(len(first.items), 2)
+        self.assertIn("epdx", inspect(first.items[0]).unloaded)
+        second = self.read_repo.search("beton", limit=2, cursor=first.next_cursor)
+        self.assertEqual(len(second.items), 1)
+        self.assertIsNone(second.next_cursor)
+        found = [product.epd_id for product in first.items + second.items]
+        self.assertEqual(sorted(found), ["beton-1", "holz-1", "wolle-2"])
+        with self.assertRaises(ValueError):
+            self.read_repo.search("beton", limit=2, cursor="-2")
+
+    def test_index_follows_writes(self):
+        product = self.write_repo.create(Product(**product_row(epd_id="ziegel-1", epd_name="Hochlochziegel")))
+        self.assertEqual(self.search("ziegel"), [])
+        self.assertEqual(self.search("hochloch"), ["ziegel-1"])
+        product.epd_name = "Planziegel"
+        self.write_repo.update(product)
+        self.assertEqual(self.search("hochloch"), [])
+        self.assertEqual(self.search("planziegel"), ["ziegel-1"])
+        self.write_repo.delete(product.id)
+        self.assertEqual(self.search("planziegel"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
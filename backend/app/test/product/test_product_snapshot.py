@@ -0,0 +1,89 @@
+# backend/app/test/product/test_product_snapshot.py
+import importlib.util
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from sqlalchemy import select
+
+from app.core.domain.entities import Product, ProductImpact
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_snapshot_service import SNAPSHOT_IMPACTS_KEY, ProductSnapshotService
+from app.test import SqliteTestCase, product_row
+
+
+@unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+class TestProductSnapshot(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        ProductWriteRepository(self.db).bulk_insert([
+            product_row(epd_id="a", epd_gross_density=2400.0, impacts={"gwp": {"a1a3": 300.0, "c3": 1.5}, "odp": {"a1a3": 0.001}}),
+            product_row(epd_id="b", epd_gross_density=2400.0, impacts={"gwp": {"a1a3": 120.0}}),
+            product_row(epd_id="c", epd_gross_density=2400.0, status="inactive"),
+        ])
+
+    def service(self, db, row_group_size=2):
+        return ProductSnapshotService(ProductReadRepository(db), ProductWriteRepository(db), ProductMapper(),
+                                      row_group_size=row_group_size, bulk_batch_size=2, stream_batch_size=2)
+
+    def test_columns_and_impact_matrix(self):
+        import pyarrow.parquet as pq
+        target = io.BytesIO()
+        self.assertEqual(self.service(self.db).write_snapshot(target, with_epdx=False, filters={"status": "default"}), 2)
+        snapshot = pq.ParquetFile(io.BytesIO(target.getvalue()))
+        self.assertEqual(snapshot.metadata.num_row_groups, 1)
+        self.assertNotIn("epdx", snapshot.schema_arrow.names)
+        self.assertEqual(str(snapshot.schema_arrow.field("gwp.a1a3").type), "double")
+        self.assertEqual(str(snapshot.schema_arrow.field("id").type), "int64")
+        self.assertEqual(snapshot.schema_arrow.metadata[SNAPSHOT_IMPACTS_KEY], b'[["gwp", "a1a3"], ["gwp", "c3"], ["odp", "a1a3"]]')
+        table = snapshot.read(columns=["epd_id", "gwp.a1a3", "odp.a1a3"]).to_pylist()
+        self.assertEqual(table, [
+            {"epd_id": "a", "gwp.a1a3": 300.0, "odp.a1a3": 0.001},
+            {"epd_id": "b", "gwp.a1a3": 120.0, "odp.a1a3": None},
+        ])
+
+    def test_stream_is_written_in_row_groups(self):
+        import pyarrow.parquet as pq
+        chunks = list(self.service(self.db, row_group_size=1).stream_snapshot())
+        self.assertEqual(len(chunks), 4)     # a chunk per row group, the footer last
+        snapshot = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+        self.assertEqual((snapshot.metadata.num_row_groups, snapshot.metadata.num_rows), (3, 3))
+
+    def test_round_trip_rebuilds_products_and_impacts(self):
+        path = os.path.join(self.directory.name, "products.parquet")
+        self.service(self.db).write_snapshot(path)
+        target = self.database("target.db")
+        report = self.service(target).read_snapshot(path, keep_ids=True)
+        self.assertEqual(report, {"products": 3, "inserted": 3, "skipped": 0})
+        self.assertEqual(self.service(target).read_snapshot(path)["skipped"], 3)
+        # mysql reports skipped duplicates as affected rows, the report does not depend on it
+        service = self.service(target)
+        bulk_insert = service._write_repo.bulk_insert
+        service._write_repo.bulk_insert = lambda rows, skip_conflicts=True: bulk_insert(rows, skip_conflicts) and len(rows)
+        self.assertEqual(service.read_snapshot(path), {"products": 3, "inserted": 0, "skipped": 3})
+
+        def dump(db):
+            with db.session() as session:
+                products = session.execute(
+                    select(Product.id, Product.epd_id, Product.status, Product.epd_gross_density, Product.epdx).order_by(Product.id)
+                ).all()
+                impacts = session.execute(select(ProductImpact.product_id, ProductImpact.indicator, ProductImpact.stage,
+                                                 ProductImpact.value).order_by(ProductImpact.product_id, ProductImpact.indicator, ProductImpact.stage)).all()
+                return [tuple(product) for product in products], [tuple(impact) for impact in impacts]
+        self.assertEqual(dump(target), dump(self.db))
+
+    def test_snapshot_without_epdx_cannot_be_imported(self):
+        target = io.BytesIO()
+        self.service(self.db).write_snapshot(target, with_epdx=False)
+        target.seek(0)
+        with self.assertRaises(ValueError):
+            self.service(self.database("target.db")).read_snapshot(target)
+
+
+if __name__ == '__main__':
+    unittest.main()
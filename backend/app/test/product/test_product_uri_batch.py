@@ -0,0 +1,64 @@
+# backend/app/test/product/test_product_uri_batch.py
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_service import ProductService
+from app.test import SqliteTestCase, product_row
+from sqlalchemy import event
+
+
+class TestProductUriBatch(SqliteTestCase):
+    def setUp(self):
+        super().setUp()
+        ProductWriteRepository(self.db).bulk_insert([
+            product_row(epd_id="a"), product_row(epd_id="a", epd_version="00.02.000"), product_row(epd_id="b"),
+            product_row(epd_id="a", epd_sourceName="other"),
+        ])
+        self.service = ProductService(
+            product_read_repository=ProductReadRepository(self.db),
+            product_write_repository=ProductWriteRepository(self.db),
+            product_mapper=ProductMapper,
+            epdx_service=None,
+        )
+        self.statements = []
+        event.listen(self.db.engine, "before_cursor_execute", self.count)
+
+    def tearDown(self):
+        event.remove(self.db.engine, "before_cursor_execute", self.count)
+        super().tearDown()
+
+    def count(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def test_resolves_in_one_query(self):
+        batch = self.service.get_products_by_uris([
+            ("Oekobaudat.a", None), ("Oekobaudat.a", "00.01.000"), ("Oekobaudat.b", None), ("other.a", None),
+            ("Oekobaudat.c", None), ("Oekobaudat.b", "00.09.000"), ("no-dot", None), ("Oekobaudat.b", None),
+        ])
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(
+            {name: (product.epd_sourceName, product.epd_id, product.epd_version) for name, product in batch.products.items()},
+            {
+                "Oekobaudat.a": ("Oekobaudat", "a", "00.02.000"),   # latest version
+                "Oekobaudat.a@00.01.000": ("Oekobaudat", "a", "00.01.000"),
+                "Oekobaudat.b": ("Oekobaudat", "b", "00.01.000"),
+                "other.a": ("other", "a", "00.01.000"),
+            },
+        )
+        self.assertEqual(batch.missing, ["Oekobaudat.c", "Oekobaudat.b@00.09.000"])
+        self.assertEqual(batch.invalid, ["no-dot"])
+
+    def test_empty(self):
+        batch = self.service.get_products_by_uris([])
+        self.assertEqual((batch.products, batch.missing, batch.invalid), ({}, [], []))
+        self.assertEqual(self.statements, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# backend/app/test/product/test_unit_conversion.py
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+import numpy as np
+
+from app.core.application.dtos.epdx.epdx_dto import EPD, Conversion, ImpactCategoryKey, Unit
+from app.core.domain.values.unit_conversion import (UnitConversionError, compile_path, conversion_factor, conversion_factors,
+                                                    conversion_parameters, impact_factor)
+from app.infrastructure.infrastructure.services.epdx_service import EpdxService
+from app.infrastructure.persistence.repositories.product.product_read_repository import ProductReadRepository
+from app.infrastructure.persistence.repositories.product.product_write_repository import ProductWriteRepository
+from app.infrastructure.persistence.services.product_impact_service import ProductImpactService
+from app.test import SqliteTestCase, product_row
+
+
+def conversion(name, value, to="kg", unit=None):
+    return Conversion.model_validate({"to": to, "value": value, "metaData": {"name": name, "unit": unit, "value": value}})
+
+
+class TestUnitConversion(unittest.TestCase):
+    def test_paths_chain_conversions(self):
+        parameters = {"weight per piece": 12.0, "gross density": 2400.0}
+        # one piece weighs 12 kg, 2400 kg are one m3
+        self.assertTrue(math.isclose(conversion_factor(Unit.pcs, Unit.m3, parameters), 12.0 / 2400.0))
+        self.assertTrue(math.isclose(conversion_factor("tones", "m3", parameters), 1000.0 / 2400.0))
+        self.assertEqual(compile_path("pcs", "m3", frozenset(parameters)).units, ("pcs", "kg", "m3"))
+        self.assertEqual(conversion_factor("m2", "m2"), 1.0)
+
+    def test_impact_factor_is_the_inverse_of_the_amount(self):
+        parameters = {"gross density": 2400.0}
+        # an impact per m3 is an impact per 2400 kg
+        self.assertTrue(math.isclose(impact_factor("m3", "kg", parameters), 1 / 2400.0))
+        self.assertTrue(math.isclose(impact_factor("m2", "m3", {"layer thickness": 0.2}), 5.0))
+
+    def test_missing_conversion_is_an_error(self):
+        with self.assertRaises(UnitConversionError) as raised:
+            conversion_factor("pcs", "m3", {"gross density": 2400.0})
+        self.assertEqual(str(raised.exception), "no conversion from pcs to m3, available conversions: gross density")
+        with self.assertRaises(ValueError):
+            conversion_factor(None, "m3")
+
+    def test_parameters_of_an_epd(self):
+        parameters = conversion_parameters("m3", [conversion("gross density", 2400.0), conversion("density", 500.0, unit="kg/m^3"),
+                                                  conversion("weight per piece", -1.0), Conversion(to=Unit.m2, value=4.0)])
+        self.assertEqual(parameters, {"gross density": 2400.0, "m3->m2": 4.0})
+        self.assertTrue(math.isclose(conversion_factor("m2", "kg", parameters), 600.0))
+
+    def test_paths_are_compiled_once_per_group(self):
+        compile_path.cache_clear()
+        columns = {"gross density": np.array([2400.0, 500.0, np.nan, 2000.0]), "weight per piece": np.array([np.nan, np.nan, 3.0, np.nan])}
+        factors, errors = conversion_factors(["kg"] * 4, ["m3", "m3", "m3", None], columns)
+        self.assertTrue(np.allclose(factors[:2], [1 / 2400.0, 1 / 500.0]))
+        self.assertTrue(np.isnan(factors[2:]).all())
+        self.assertEqual(sorted(errors), [2, 3])
+        self.assertIn("no conversion from kg to m3", errors[2])
+        self.assertEqual(compile_path.cache_info().misses, 2)
+        conversion_factors(["kg"] * 2, ["m3"] * 2, {"gross density": np.array([1.0, 2.0])})
+        self.assertEqual(compile_path.cache_info().hits, 1)
+
+
+class TestConvertedImpacts(SqliteTestCase):
+    def test_impact_value_with_a_conversion(self):
+        epd = EPD(id="c", name="concrete", declared_unit=Unit.m3, conversions=[conversion("gross density", 2400.0)],
+                  impacts={"gwp": {"a1a3": 240.0}})
+        service = EpdxService()
+        self.assertTrue(math.isclose(service.get_impact_value_from_EPD(epd, ImpactCategoryKey.gwp, conversion=Conversion(to=Unit.tones, value=1.0)), 100.0))
+        with self.assertRaises(UnitConversionError):
+            service.get_impact_value_from_EPD(epd, ImpactCategoryKey.gwp, conversion=Conversion(to=Unit.pcs, value=1.0))
+
+    def test_service_converts_to_one_unit(self):
+        ProductWriteRepository(self.db).bulk_insert([
+            product_row(epd_id="concrete", epd_declaredUnit="m3", epd_gross_density=2400.0, impacts={"gwp": {"a1a3": 240.0}}),
+            product_row(epd_id="steel", epd_declaredUnit="kg", impacts={"gwp": {"a1a3": 2.0}}),
+            product_row(epd_id="screed", epd_declaredUnit="m2", epd_layer_thickness=0.05, impacts={"gwp": {"a1a3": 20.0}}),
+            product_row(epd_id="window", epd_declaredUnit="pcs", impacts={"gwp": {"a1a3": 500.0}}),
+            product_row(epd_id="brick", epd_declaredUnit="pcs", epd_weight_per_piece=2.5, impacts={"gwp": {"a1a3": 0.5}}),
+        ])
+        for cache_catalog in (True, False):
+            service = ProductImpactService(ProductReadRepository(self.db), cache_catalog=cache_catalog)
+            table = service.evaluate_impacts([1, 2, 3, 4, 5], quantities={2: 10.0}, to_unit="kg")
+            self.assertEqual(table.product_ids, [1, 2, 3, 4, 5])
+            self.assertTrue(math.isclose(table.values[0][0], 0.1))
+            self.assertEqual(table.values[1:4], [[20.0], [None], [None]])
+            # one brick of 2.5 kg per 0.5, like the per product path converts it from the epdx
+            self.assertTrue(math.isclose(table.values[4][0], 0.2))
+            self.assertEqual(sorted(table.errors), [3, 4])
+            table = service.evaluate_impacts([3, 1], to_unit="m3")
+            self.assertEqual((table.values, table.errors), ([[400.0], [240.0]], {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ sys.path.insert(0, project_root)
 
 if __name__ == '__main__':
     
-    test_directory = ['category']
+    test_directory = ['buildup', 'category', 'okobau', 'product']
 
     for dir in test_directory:
         # Find all test files in the folders listed in test_directory, which should be subfolder of where this file is located.